@@ -0,0 +1,15 @@
+"""
+Замеры скорости горячих участков приложения (см. `python -m benchmarks -h`).
+
+Модули приложения импортируются так же, как в тестах: из src/, config/ и logs/.
+"""
+
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+for folder in ("src", "config", "logs"):
+    folder_path = os.path.join(ROOT, folder)
+    if folder_path not in sys.path:
+        sys.path.insert(0, folder_path)
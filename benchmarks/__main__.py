@@ -0,0 +1,93 @@
+import argparse
+import builtins
+import gettext
+import logging
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+from benchmarks import ROOT
+from benchmarks.harness import compare, load_report, make_report, measure, write_report
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+
+def run_cases(names, sizes, repeat: int) -> list[dict]:
+    """Готовит и замеряет каждый сценарий на каждом размере данных."""
+    from benchmarks.cases import CASES
+
+    results = []
+    for name in names:
+        for size in sizes:
+            with tempfile.TemporaryDirectory() as workdir:
+                stats = measure(CASES[name](size, workdir), repeat=repeat)
+            stats.update(name=name, size=size)
+            results.append(stats)
+            print(f"{name:<22}{size:>10}  {stats['median_s'] * 1000:10.3f} ms")
+    return results
+
+
+def print_comparison(rows: list[dict]) -> None:
+    for row in rows:
+        mark = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['name']:<22}{row['size']:>10}  "
+            f"{row['old_s'] * 1000:10.3f} -> {row['new_s'] * 1000:10.3f} ms"
+            f"  x{row['ratio']:.2f}{mark}"
+        )
+
+
+def main(argv=None) -> int:
+    from benchmarks.cases import CASES
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Замеры каталога, автодополнения, калькулятора и статистики.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="размеры каталога/журнала (по умолчанию 1000 10000 100000)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="серий на замер")
+    parser.add_argument(
+        "--only", nargs="+", choices=sorted(CASES), help="запустить только эти замеры"
+    )
+    parser.add_argument(
+        "--output", help="файл отчёта (по умолчанию benchmarks/results/<коммит>.json)"
+    )
+    parser.add_argument(
+        "--compare", metavar="BASELINE", help="отчёт, с которым сравнить результат"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="доля замедления, считающаяся регрессией (по умолчанию 0.10)",
+    )
+    args = parser.parse_args(argv)
+
+    report = make_report(run_cases(args.only or list(CASES), args.sizes, args.repeat))
+    stamp = report["commit"] or datetime.now().strftime("%Y%m%d-%H%M%S")
+    output = args.output or os.path.join(RESULTS_DIR, f"{stamp}.json")
+    write_report(report, output)
+    print(f"Отчёт: {output}")
+
+    if args.compare:
+        rows = compare(report, load_report(args.compare), args.threshold)
+        print_comparison(rows)
+        if any(row["regression"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    # Подписи окон и сообщений не переводятся: замеры идут без выбора языка
+    if not hasattr(builtins, "_"):
+        gettext.NullTranslations().install()
+    logging.disable(logging.WARNING)
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import os
+import random
+from collections.abc import Callable
+from datetime import timedelta
+
+from autocomplete import Autocomplete
+from benchmarks.datagen import (
+    DEFAULT_END,
+    DEFAULT_SEED,
+    iter_catalog,
+    iter_meals,
+    write_catalog,
+    write_journal,
+)
+from data_defaults import DataDefaults
+from gui_factory import Factory
+from product_catalog import ProductCatalog
+from product_manager import ProductCalculator, ProductContext, ProductManager
+from stats_manager import StatsManager
+
+ROWS = 20  # строк в одном расчёте калорий
+HISTORY_PRODUCTS = 1_000  # каталог, из которого собраны записи журнала
+RANGE_DAYS = 30  # выборка статистики: последние дни сгенерированного журнала
+RANGE = (
+    (DEFAULT_END - timedelta(days=RANGE_DAYS)).strftime("%Y-%m-%d"),
+    DEFAULT_END.strftime("%Y-%m-%d"),
+)
+
+
+def _quiet(*_args, **_kwargs):
+    """Заглушка диалогов и записи: замеры не должны ждать окон."""
+
+
+def _settings(workdir: str) -> DataDefaults:
+    catalog_path = os.path.join(workdir, "products.json")
+    settings = DataDefaults(
+        "ru",
+        path_ru=catalog_path,
+        path_en=catalog_path,
+        info_handler=_quiet,
+        error_handler=_quiet,
+    )
+    settings.MEALS_LIST = os.path.join(workdir, "meals.json")
+    settings.MEALS_DIR = os.path.join(workdir, "meals")
+    return settings
+
+
+def _context(workdir: str, size: int) -> ProductContext:
+    settings = _settings(workdir)
+    write_catalog(settings.PRODUCTS_LIST_RU, iter_catalog(size))
+    factory = Factory("ru", info_handler=_quiet, error_handler=_quiet)
+    factory.settings = settings
+    return ProductContext("ru", factory=factory, settings=settings)
+
+
+class _Var:
+    """Замена tk.StringVar для строк калькулятора."""
+
+    def __init__(self, value: str):
+        self.value = value
+
+    def get(self) -> str:
+        return self.value
+
+
+# —— Cases —— #
+# Каждый сценарий готовит данные в workdir и возвращает функцию для замера.
+
+
+def catalog_load(size: int, workdir: str) -> Callable[[], object]:
+    manager = ProductManager(
+        _context(workdir, size), info_message=_quiet, error_message=_quiet
+    )
+    return lambda: manager._load_products_internal("ru")
+
+
+def autocomplete_filter(size: int, workdir: str) -> Callable[[], object]:
+    catalog = ProductCatalog(dict(iter_catalog(size)))
+    names = list(catalog)
+    prefixes = [name[:2] for name in names[:: max(1, size // 50)]]
+    autocomplete = Autocomplete()
+    catalog.complete("")  # индекс подсказок строится при загрузке, не при вводе
+
+    def run():
+        for prefix in prefixes:
+            autocomplete.matches(catalog, prefix)
+
+    return run
+
+
+def calculate_total(size: int, workdir: str) -> Callable[[], object]:
+    catalog = ProductCatalog(dict(iter_catalog(size)))
+    context = _context(workdir, size)
+    calculator = ProductCalculator(
+        context, catalog, info_message=_quiet, error_message=_quiet
+    )
+    # Только расчёт: запись в журнал замеряет отдельный сценарий journal.save
+    calculator.factory.save_results = _quiet
+    rng = random.Random(DEFAULT_SEED)
+    rows = [
+        (_Var(name), _Var(str(rng.randint(10, 500))))
+        for name in rng.sample(list(catalog), min(ROWS, size))
+    ]
+    return lambda: calculator.calculate_total(rows)
+
+
+def save_results(size: int, workdir: str) -> Callable[[], object]:
+    journal_dir = os.path.join(workdir, "meals")
+    write_journal(journal_dir, iter_meals(size, HISTORY_PRODUCTS))
+    factory = Factory("ru", info_handler=_quiet, error_handler=_quiet)
+    entries = [(name, 100.0, kcal) for name, kcal in iter_catalog(ROWS)]
+    return lambda: factory.save_results(journal_dir, entries)
+
+
+def _stats_manager(size: int, workdir: str) -> StatsManager:
+    settings = _settings(workdir)
+    write_journal(settings.MEALS_DIR, iter_meals(size, HISTORY_PRODUCTS))
+    stats = StatsManager(settings.MEALS_LIST, journal_dir=settings.MEALS_DIR)
+    # Замеряем запросы, а не первое открытие журнала. «Сейчас» — конец
+    # сгенерированных данных: какие месяцы сжаты, не зависит от часов
+    stats.preload(now=DEFAULT_END)
+    return stats
+
+
+def stats_range_json(size: int, workdir: str) -> Callable[[], object]:
+    stats = _stats_manager(size, workdir)
+    return lambda: stats.get_stats_for_range(*RANGE)
+
+
+def stats_range_index(size: int, workdir: str) -> Callable[[], object]:
+    stats = _stats_manager(size, workdir)
+    return lambda: stats.get_totals_for_range(*RANGE)
+
+
+CASES: dict[str, Callable[[int, str], Callable[[], object]]] = {
+    "catalog.load": catalog_load,
+    "autocomplete.filter": autocomplete_filter,
+    "calculator.total": calculate_total,
+    "journal.save": save_results,
+    "stats.range.json": stats_range_json,
+    "stats.range.index": stats_range_index,
+}
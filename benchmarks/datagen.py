@@ -0,0 +1,271 @@
+"""
+Детерминированный генератор больших каталогов продуктов и журналов питания.
+
+Данные пишутся на диск потоком в форматах приложения и в памяти целиком не
+строятся: продукт однозначно вычисляется по номеру, а популярность
+продуктов в приёмах пищи убывает по закону Ципфа (первые номера — частые).
+При одинаковых параметрах и `seed` результат побайтно совпадает, поэтому
+замеры и форматы хранения можно сравнивать на одних и тех же данных.
+
+    python -m benchmarks.datagen data/synthetic --products 100000 --meals 1000000
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+from collections.abc import Iterator
+from datetime import datetime, time, timedelta
+from itertools import islice
+
+from meal_journal import MealJournal, dump_entry
+
+DEFAULT_SEED = 42
+DEFAULT_END = datetime(2026, 10, 19)
+LANGUAGES = ("ru", "en")
+FORMATS = ("legacy", "journal")
+CHUNK = 10_000  # записей журнала за одну запись на диск
+
+# Слоги из согласной и гласной: одинаковая длина делает разбиение слова
+# однозначным, поэтому разные номера дают разные названия.
+SYLLABLES = {
+    "ru": [c + v for c in "бвгджзклмнпрстфхцчшщ" for v in "аеёиоуыэюя"],
+    "en": [c + v for c in "bcdfghjklmnprstvwz" for v in "aeiouy"],
+}
+
+# Вид продукта и диапазон калорийности на 100 г
+KINDS = {
+    "ru": [
+        ("Суп", 20, 90),
+        ("Салат", 30, 250),
+        ("Сыр", 250, 420),
+        ("Хлеб", 200, 300),
+        ("Йогурт", 50, 120),
+        ("Каша", 70, 150),
+        ("Печенье", 380, 520),
+        ("Рыба", 80, 220),
+        ("Сок", 35, 60),
+        ("Орехи", 550, 700),
+    ],
+    "en": [
+        ("Soup", 20, 90),
+        ("Salad", 30, 250),
+        ("Fromage", 250, 420),
+        ("Pâté", 200, 350),
+        ("Yogurt", 50, 120),
+        ("Porridge", 70, 150),
+        ("Crème brûlée", 250, 350),
+        ("Jalapeño dip", 80, 220),
+        ("Café au lait", 35, 60),
+        ("Açaí bowl", 90, 180),
+    ],
+}
+
+_MIX = 2654435761  # множитель Кнута для перемешивания номеров
+_PRIME = 1_000_003  # взаимно прост с числом слогов обоих языков
+
+
+def _word_length(language: str, count: int) -> int:
+    base = len(SYLLABLES[language])
+    length = 3
+    while base**length < count:
+        length += 1
+    return length
+
+
+def product(language: str, index: int, count: int, seed: int = DEFAULT_SEED):
+    """
+    Продукт с номером `index` из каталога на `count` позиций.
+
+    Номер переставляется биекцией и записывается слогами фиксированной
+    длины, поэтому названия уникальны и не идут подряд по алфавиту.
+
+    Returns:
+        tuple[str, float]: Название и калорийность на 100 г.
+    """
+    syllables = SYLLABLES[language]
+    length = _word_length(language, count)
+    code = (index * _PRIME + seed) % len(syllables) ** length
+    mix = (code * _MIX) & 0xFFFFFFFF
+    kind, low, high = KINDS[language][mix % len(KINDS[language])]
+
+    parts = []
+    for _ in range(length):
+        code, digit = divmod(code, len(syllables))
+        parts.append(syllables[digit])
+    kcal = round(low + (high - low) * (mix >> 8) / 0xFFFFFF, 1)
+    return f"{kind} {''.join(parts).capitalize()}", kcal
+
+
+def iter_catalog(
+    count: int, language: str = "ru", seed: int = DEFAULT_SEED
+) -> Iterator[tuple[str, float]]:
+    for index in range(count):
+        yield product(language, index, count, seed)
+
+
+def popular_index(rng: random.Random, count: int, skew: float = 1.0) -> int:
+    """
+    Номер продукта по закону Ципфа с показателем `skew` (обратная функция
+    распределения непрерывного приближения; памяти на каталог не требует).
+    """
+    u = rng.random()
+    if skew == 1.0:
+        rank = math.exp(u * math.log(count + 1))
+    else:
+        power = 1.0 - skew
+        rank = (u * ((count + 1) ** power - 1) + 1) ** (1 / power)
+    return min(int(rank) - 1, count - 1)
+
+
+def iter_meals(
+    count: int,
+    catalog_size: int,
+    language: str = "ru",
+    years: float = 3.0,
+    end: datetime = DEFAULT_END,
+    seed: int = DEFAULT_SEED,
+    skew: float = 1.0,
+) -> Iterator[dict]:
+    """
+    Приёмы пищи за `years` лет до дня `end` в хронологическом порядке.
+
+    Записи совпадают по формату с `Factory.save_results`: от одного до пяти
+    продуктов каталога того же `seed` с весом и калориями.
+    """
+    rng = random.Random(seed)
+    days = max(int(365.25 * years), 1)
+    first_day = datetime.combine((end - timedelta(days=days)).date(), time())
+    for i in range(count):
+        items = []
+        for _ in range(rng.randint(1, 5)):
+            name, kcal = product(
+                language, popular_index(rng, catalog_size, skew), catalog_size, seed
+            )
+            weight = rng.randint(10, 500)
+            items.append(
+                {"name": name, "weight": weight, "calories": kcal * weight / 100}
+            )
+        # Дни идут подряд, внутри дня приёмы распределены с 7:00 до 22:00
+        day, fraction = divmod((i + rng.random()) * days / count, 1)
+        timestamp = first_day + timedelta(days=day, hours=7 + 15 * fraction)
+        yield {
+            "timestamp": timestamp.isoformat(),
+            "items": items,
+            "total": sum(item["calories"] for item in items),
+        }
+
+
+# —— Writers —— #
+
+
+def write_catalog(path: str, entries: Iterator[tuple[str, float]]) -> int:
+    """Пишет каталог в формате products_*.json, не собирая словарь в памяти."""
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{")
+        for name, kcal in entries:
+            f.write(",\n" if written else "\n")
+            f.write(f"    {json.dumps(name, ensure_ascii=False)}: {kcal}")
+            written += 1
+        f.write("\n}" if written else "}")
+    return written
+
+
+def write_legacy_meals(path: str, meals: Iterator[dict]) -> int:
+    """Пишет старый единый meals.json (список записей) потоком."""
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for meal in meals:
+            f.write(",\n" if written else "\n")
+            f.write(dump_entry(meal).rstrip("\n"))
+            written += 1
+        f.write("\n]" if written else "]")
+    return written
+
+
+def write_journal(directory: str, meals: Iterator[dict]) -> int:
+    """Дописывает записи в помесячный журнал порциями по `CHUNK`."""
+    journal = MealJournal(directory)
+    written = 0
+    while chunk := list(islice(meals, CHUNK)):
+        journal.append_many(chunk)
+        written += len(chunk)
+    return written
+
+
+def generate(
+    output: str,
+    products: int,
+    meals: int,
+    languages=LANGUAGES,
+    formats=FORMATS,
+    years: float = 3.0,
+    seed: int = DEFAULT_SEED,
+    skew: float = 1.0,
+) -> dict[str, int]:
+    """
+    Создаёт в `output` каталоги `products_<язык>.json` и журнал питания
+    на первом из языков: `meals.json` и/или каталог `meals/`.
+
+    Returns:
+        dict[str, int]: Число записей в каждом созданном файле.
+    """
+    os.makedirs(output, exist_ok=True)
+    written = {}
+    for language in languages:
+        name = f"products_{language}.json"
+        path = os.path.join(output, name)
+        written[name] = write_catalog(path, iter_catalog(products, language, seed))
+
+    def meals_stream():
+        return iter_meals(meals, products, languages[0], years, seed=seed, skew=skew)
+
+    if "legacy" in formats:
+        path = os.path.join(output, "meals.json")
+        written["meals.json"] = write_legacy_meals(path, meals_stream())
+    if "journal" in formats:
+        path = os.path.join(output, "meals")
+        written["meals/"] = write_journal(path, meals_stream())
+    return written
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.datagen",
+        description="Генератор синтетических каталогов и журналов питания",
+    )
+    parser.add_argument("output", help="каталог для файлов")
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--meals", type=int, default=100_000)
+    parser.add_argument("--years", type=float, default=3.0)
+    parser.add_argument(
+        "--languages", nargs="+", choices=LANGUAGES, default=list(LANGUAGES)
+    )
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--skew", type=float, default=1.0, help="показатель Ципфа популярности"
+    )
+    args = parser.parse_args(argv)
+    if args.products < 1:
+        parser.error("--products должен быть положительным")
+
+    written = generate(
+        args.output,
+        args.products,
+        args.meals,
+        languages=args.languages,
+        formats=args.formats,
+        years=args.years,
+        seed=args.seed,
+        skew=args.skew,
+    )
+    for name, count in written.items():
+        print(f"{name}: {count}")
+
+
+if __name__ == "__main__":
+    main()
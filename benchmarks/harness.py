@@ -0,0 +1,95 @@
+import json
+import os
+import platform
+import subprocess
+import timeit
+from collections.abc import Callable, Iterable
+from datetime import datetime
+
+from benchmarks import ROOT
+
+
+def measure(func: Callable[[], object], repeat: int = 5, number: int = 1) -> dict:
+    """
+    Замеряет `func` через timeit: `repeat` серий по `number` вызовов.
+
+    Returns:
+        dict: Лучшее, медианное и среднее время одного вызова в секундах.
+    """
+    timings = sorted(
+        t / number for t in timeit.Timer(func).repeat(repeat=repeat, number=number)
+    )
+    return {
+        "repeat": repeat,
+        "number": number,
+        "best_s": timings[0],
+        "median_s": timings[len(timings) // 2],
+        "mean_s": sum(timings) / len(timings),
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def make_report(results: Iterable[dict]) -> dict:
+    return {
+        "commit": git_commit(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": list(results),
+    }
+
+
+def write_report(report: dict, path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def load_report(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.10) -> list[dict]:
+    """
+    Сравнивает два отчёта по медианному времени.
+
+    Args:
+        current (dict): Новый отчёт.
+        baseline (dict): Отчёт, с которым сравниваем (например, прошлый коммит).
+        threshold (float): Доля замедления, начиная с которой замер — регрессия.
+
+    Returns:
+        list[dict]: Общие замеры с отношением new/old и флагом "regression".
+    """
+    old = {(r["name"], r["size"]): r for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        previous = old.get((result["name"], result["size"]))
+        if previous is None:
+            continue
+        ratio = result["median_s"] / previous["median_s"]
+        rows.append(
+            {
+                "name": result["name"],
+                "size": result["size"],
+                "old_s": previous["median_s"],
+                "new_s": result["median_s"],
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            }
+        )
+    return rows
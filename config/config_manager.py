@@ -1,7 +1,203 @@
 import configparser
+import logging
 import os
+import threading
+from collections.abc import Callable, Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
 
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config.ini")
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Значения по умолчанию для настроек, которых может не быть в config.ini.
+# В файл они не записываются: достаточно добавить ключ в нужную секцию,
+# чтобы переопределить значение.
+DEFAULTS = {
+    "file_path": {
+        "meals_file": "data/meals.json",
+        "meals_dir": "data/meals",
+    },
+    "stats": {
+        "daily_target": "2000",
+        "rolling_window": "7",
+    },
+    "performance": {
+        "poll_interval": "50",  # мс, опрос фоновых задач из Tk
+        "max_workers": "1",  # потоков для фоновых задач
+        "autocomplete_limit": "50",  # 0 — без ограничения
+        "startup_budget_ms": "3000",  # до первого окна (см. --profile-startup)
+        "stall_threshold_ms": "500",  # зависание цикла Tk в лог; 0 — выключено
+        "profile_hotkey": "<Control-Shift-P>",  # запись cProfile; пусто — выключено
+        "sampling_interval_ms": "0",  # сэмплирующий профилировщик; 0 — выключен
+        "sampling_output": "logs/sampling.folded",  # свёрнутые стеки при выходе
+    },
+    "instrumentation": {
+        "enabled": "0",  # замеры горячих участков (см. src/instrumentation.py)
+        "output": "",  # JSON-отчёт при выходе; пусто — только в лог
+    },
+}
+
+_services: dict[str, "ConfigService"] = {}
+
+
+def _to_boolean(value: str) -> bool:
+    states = configparser.ConfigParser.BOOLEAN_STATES
+    if str(value).lower() not in states:
+        raise ValueError(f"Ошибка: Не логическое значение: {value}")
+    return states[value.lower()]
+
+
+_services_lock = threading.Lock()
+
+
+class ConfigService:
+    """
+    Кэширующий доступ к config.ini.
+
+    Файл разбирается один раз и перечитывается, только если на диске
+    изменились время модификации или размер. Запись выполняется лишь при
+    реальном изменении значений и атомарно: через временный файл и
+    `os.replace`, поэтому прерванная запись не портит конфиг.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.RLock()
+        self.parser = configparser.ConfigParser()
+        self.state = "missing"  # missing | ok | unread | corrupt
+        self._stamp: tuple[int, int] | None = None
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def refresh(self) -> None:
+        """Перечитывает файл, если он изменился с прошлого чтения."""
+        with self.lock:
+            stamp = self._stat()
+            if stamp is not None and stamp == self._stamp:
+                return
+            self._stamp = stamp
+            self.parser = configparser.ConfigParser()
+            if stamp is None:
+                self.state = "missing"
+                return
+            try:
+                read_files = self.parser.read(self.path, encoding="utf-8")
+                self.state = "ok" if read_files else "unread"
+            except configparser.Error as e:
+                logger.error(f"Ошибка чтения конфигурации {self.path}: {e}")
+                self.parser = configparser.ConfigParser()
+                self.state = "corrupt"
+
+    # —— Reading —— #
+
+    def get(self, section: str, key: str, fallback: str | None = None) -> str | None:
+        """Значение из файла, иначе из DEFAULTS, иначе `fallback`."""
+        with self.lock:
+            self.refresh()
+            default = DEFAULTS.get(section, {}).get(key, fallback)
+            return self.parser.get(section, key, fallback=default)
+
+    def _typed(self, section: str, key: str, convert: Callable[[str], Any]) -> Any:
+        """
+        Значение, приведённое `convert`. Неверное значение в файле (правка
+        вручную) пишется в лог и заменяется значением из DEFAULTS, чтобы
+        опечатка в config.ini не роняла запуск приложения.
+        """
+        value = self.get(section, key)
+        try:
+            return convert(value)
+        except (TypeError, ValueError):
+            default = DEFAULTS.get(section, {}).get(key)
+            if default is None or value == default:
+                raise
+            logger.error(
+                f"Ошибка: Некорректное значение {section}.{key} = {value!r}, "
+                f"используется {default!r}"
+            )
+            return convert(default)
+
+    def getint(self, section: str, key: str) -> int:
+        return self._typed(section, key, int)
+
+    def getfloat(self, section: str, key: str) -> float:
+        return self._typed(section, key, float)
+
+    def getboolean(self, section: str, key: str) -> bool:
+        return self._typed(section, key, _to_boolean)
+
+    def get_path(self, section: str, key: str) -> str:
+        """Путь из конфига; относительные пути считаются от корня проекта."""
+        return os.path.join(PROJECT_ROOT, self.get(section, key))
+
+    # —— Writing —— #
+
+    def update(
+        self,
+        values: dict[str, dict[str, str]],
+        drop: Iterable[str] = (),
+        remove: dict[str, Iterable[str]] | None = None,
+    ) -> bool:
+        """
+        Записывает значения по секциям и удаляет секции `drop` и ключи `remove`.
+
+        Args:
+            values (dict): {секция: {ключ: значение}}.
+            drop (Iterable[str]): Секции, которые нужно удалить целиком.
+            remove (dict, optional): {секция: [ключи]} — удаляемые ключи;
+                опустевшая секция удаляется.
+
+        Returns:
+            bool: True, если файл был перезаписан; False, если всё и так совпадало.
+        """
+        with self.lock:
+            self.refresh()
+            changed = self.state != "ok"
+            parser = configparser.ConfigParser()
+            parser.read_dict(self.parser)
+            for section in drop:
+                changed |= parser.remove_section(section)
+            for section, keys in (remove or {}).items():
+                if not parser.has_section(section):
+                    continue
+                for key in keys:
+                    changed |= parser.remove_option(section, key)
+                if not parser.items(section, raw=True):
+                    parser.remove_section(section)
+            for section, items in values.items():
+                if not parser.has_section(section):
+                    parser.add_section(section)
+                for key, value in items.items():
+                    if parser.get(section, key, fallback=None) != str(value):
+                        parser.set(section, key, str(value))
+                        changed = True
+            if not changed:
+                return False
+
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as configfile:
+                parser.write(configfile)
+            os.replace(tmp_path, self.path)
+
+            self.parser = parser
+            self.state = "ok"
+            self._stamp = self._stat()
+            return True
+
+
+def get_config(path: str | None = None) -> ConfigService:
+    """Возвращает общий сервис конфигурации для файла (по умолчанию CONFIG_PATH)."""
+    path = os.path.abspath(path or CONFIG_PATH)
+    with _services_lock:
+        service = _services.get(path)
+        if service is None:
+            service = _services[path] = ConfigService(path)
+        return service
 
 
 def read_config():
@@ -24,31 +220,31 @@ def read_config():
 
     При возникновении ошибки чтения (например, синтаксическая ошибка в ini)
     возвращает (None, [None, None]).
+
+    Файл перечитывается с диска только если он изменился (см. ConfigService).
     """
-    config = configparser.ConfigParser()
-    if os.path.exists(CONFIG_PATH):
-        try:
-            read_files = config.read(CONFIG_PATH)
-            if not read_files:
-                # файл пустой или не прочитан
-                return None, [None, None]
+    service = get_config()
+    with service.lock:
+        service.refresh()
+        config = service.parser
+        if service.state == "missing":
+            return None, []
+        if service.state != "ok":
+            # файл пустой, не прочитан или повреждён
+            return None, [None, None]
 
-            if not config.has_section("settings") or not config.has_section(
-                "file_path"
-            ):
-                return None, [None, None]
+        if not config.has_section("settings") or not config.has_section("file_path"):
+            return None, [None, None]
 
-            language = config.get("settings", "language", fallback=None)
-            path_ru = config.get("file_path", "path_ru", fallback=None)
-            path_en = config.get("file_path", "path_en", fallback=None)
+        # пустой язык пишет reset_config(): язык ещё не выбран
+        language = config.get("settings", "language", fallback=None) or None
+        path_ru = config.get("file_path", "path_ru", fallback=None)
+        path_en = config.get("file_path", "path_en", fallback=None)
 
-            if language is None and path_ru is None and path_en is None:
-                return None, [None, None]
+    if language is None and path_ru is None and path_en is None:
+        return None, [None, None]
 
-            return language, [path_ru, path_en]
-        except configparser.Error:
-            return None, [None, None]
-    return None, []
+    return language, [path_ru, path_en]
 
 
 def write_config(lang_code):
@@ -63,23 +259,19 @@ def write_config(lang_code):
         - в секцию [file_path]: ключи path_ru и path_en с фиксированными путями
           к русской и английской версии файлов продуктов.
 
-    Создаёт или перезаписывает файл config.ini.
+    Создаёт или обновляет файл config.ini; если значения не изменились,
+    файл не перезаписывается. Остальные секции сохраняются.
     """
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-
     # Строим абсолютные пути для файлов
-    path_ru = os.path.join(project_root, "data/products/products_ru.json")
-    path_en = os.path.join(project_root, "data/products/products_en.json")
-
-    config = configparser.ConfigParser()
-    config["settings"] = {"language": lang_code}
-    config["file_path"] = {
-        "path_ru": path_ru,
-        "path_en": path_en,  # Убрал лишний апостроф
-    }
+    path_ru = os.path.join(PROJECT_ROOT, "data/products/products_ru.json")
+    path_en = os.path.join(PROJECT_ROOT, "data/products/products_en.json")
 
-    with open(CONFIG_PATH, "w", encoding="utf-8") as configfile:
-        config.write(configfile)
+    get_config().update(
+        {
+            "settings": {"language": lang_code},
+            "file_path": {"path_ru": path_ru, "path_en": path_en},
+        }
+    )
 
 
 def reset_config():
@@ -90,8 +282,10 @@ def reset_config():
         - ключ language со значением пустой строки.
 
     Используется для очистки или инициализации состояния конфига.
+    Из секции [file_path] удаляются пути к файлам продуктов (path_ru, path_en);
+    пути журнала и остальные настройки сохраняются.
     """
-    config = configparser.ConfigParser()
-    config["settings"] = {"language": ""}
-    with open(CONFIG_PATH, "w", encoding="utf-8") as configfile:
-        config.write(configfile)
+    get_config().update(
+        {"settings": {"language": ""}},
+        remove={"file_path": ["path_ru", "path_en"]},
+    )
@@ -1,9 +1,28 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+_listener: QueueListener | None = None
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Кладёт записи в очередь без форматирования.
+
+    Стандартный `QueueHandler.prepare` форматирует сообщение и трейсбек в
+    потоке, который пишет в лог. Здесь запись уходит в очередь как есть
+    (вместе с `exc_info`), а форматирование и запись на диск выполняет
+    поток `QueueListener`, поэтому логирование из колбэков Tk не ждёт I/O.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
 # from gettext import gettext as _
 def setup_logger(level=logging.INFO, log_path="logs/app.log"):
+    global _listener
     logger = logging.getLogger()
     if logger.handlers:
         return
@@ -16,7 +35,25 @@ def setup_logger(level=logging.INFO, log_path="logs/app.log"):
     )
     log_handler.setFormatter(log_formater)
 
+    # Запись в файл — в фоновом потоке; в логгере только неблокирующая очередь
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, log_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logger)
+
     logger.setLevel(level)
-    logger.addHandler(log_handler)
+    logger.addHandler(LazyQueueHandler(log_queue))
 
     logging.info(_("Приложение Запущено"))
+
+
+def shutdown_logger():
+    """Дописывает накопленные в очереди записи и закрывает файлы логов."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()  # обрабатывает оставшиеся записи и останавливает поток
+    for handler in listener.handlers:
+        handler.flush()
+        handler.close()
@@ -1,5 +1,26 @@
-from localization import Localization
+import argparse
+
+from startup_profile import DEFAULT_OUTPUT, profiler
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Калькулятор калорий")
+    parser.add_argument(
+        "--profile-startup",
+        nargs="?",
+        const=DEFAULT_OUTPUT,
+        metavar="REPORT",
+        help="замерить этапы запуска, сохранить отчёт и закрыть приложение "
+        f"после появления первого окна (по умолчанию {DEFAULT_OUTPUT})",
+    )
+    return parser.parse_args(argv)
+
 
 if __name__ == "__main__":
+    args = parse_args()
+    if args.profile_startup:
+        profiler.enable(args.profile_startup)
+    with profiler.phase("imports"):
+        from localization import Localization
     app = Localization()
     app.run()
@@ -1,9 +1,30 @@
 import tkinter as tk
+from itertools import islice
+
+from instrumentation import span
+from product_catalog import ProductCatalog
 
 
 class Autocomplete:
-    def __init__(self):
-        pass
+    def __init__(self, limit: int = 0):
+        """
+        :param limit: максимум подсказок в списке (0 — без ограничения)
+        """
+        self.limit = limit
+
+    def matches(self, suggestions, text: str) -> list[str]:
+        """
+        Подсказки, начинающиеся с введённого текста (без учёта регистра).
+        :param suggestions: названия продуктов
+        :param text: введённый текст
+        :return: не больше `limit` подсказок в исходном порядке
+            (для ProductCatalog — по алфавиту, через его индекс)
+        """
+        if isinstance(suggestions, ProductCatalog):
+            return suggestions.complete(text, self.limit)
+        prefix = text.strip().lower()
+        found = (word for word in suggestions if word.lower().startswith(prefix))
+        return list(islice(found, self.limit or None))
 
     def setup_autocomplete(
         self, entry_widget: tk.Entry, suggestions, listbox_widget: tk.Listbox
@@ -16,10 +37,10 @@ class Autocomplete:
             )
 
         def update_suggestions(_=None):
-            text = entry_widget.get().strip()
-            listbox_widget.delete(0, tk.END)
-            for word in suggestions:
-                if word.lower().startswith(text.lower()):
+            with span("autocomplete.update"):
+                matches = self.matches(suggestions, entry_widget.get())
+                listbox_widget.delete(0, tk.END)
+                for word in matches:
                     listbox_widget.insert(tk.END, word)
 
         def fill_from_listbox(event):
@@ -0,0 +1,139 @@
+import logging
+import tkinter as tk
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundTask:
+    """
+    Дескриптор фоновой задачи, привязанной к окну Tkinter.
+
+    Хранит future из пула, окно, через которое идёт опрос, и колбэки,
+    которые будут вызваны в главном потоке после завершения задачи.
+    """
+
+    def __init__(
+        self,
+        future: Future,
+        widget: tk.Misc,
+        on_done: Callable[[Any], None],
+        on_error: Callable[[BaseException], None] | None = None,
+        on_cancel: Callable[[], None] | None = None,
+    ):
+        self.future = future
+        self.widget = widget
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+        self.after_id: str | None = None
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Отменяет задачу: результат будет отброшен, опрос остановлен."""
+        if self.cancelled:
+            return
+        self.cancelled = True
+        self.future.cancel()
+        if self.after_id is not None:
+            try:
+                self.widget.after_cancel(self.after_id)
+            except tk.TclError:
+                pass  # окно уже уничтожено
+            self.after_id = None
+        if self.on_cancel is not None:
+            self.on_cancel()
+
+
+class BackgroundRunner:
+    """
+    Выполняет тяжёлые вычисления в фоновом потоке и возвращает результат в Tk.
+
+    Tkinter не потокобезопасен, поэтому рабочий поток не трогает виджеты:
+    результат забирается опросом через `after()`, и колбэки всегда
+    вызываются в главном потоке.
+    """
+
+    def __init__(self, max_workers: int = 1, poll_interval: int = 50):
+        """
+        Args:
+            max_workers (int): Количество рабочих потоков.
+            poll_interval (int): Интервал опроса готовности задачи в мс.
+        """
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="meals-worker"
+        )
+        self.poll_interval = poll_interval
+        self.tasks: list[BackgroundTask] = []
+
+    def submit(
+        self,
+        widget: tk.Misc,
+        func: Callable[[], Any],
+        on_done: Callable[[Any], None],
+        on_error: Callable[[BaseException], None] | None = None,
+        on_cancel: Callable[[], None] | None = None,
+    ) -> BackgroundTask:
+        """
+        Запускает `func` в пуле и планирует доставку результата в окно.
+
+        Args:
+            widget (tk.Misc): Окно, через `after()` которого идёт опрос.
+            func (Callable): Функция без аргументов для рабочего потока.
+            on_done (Callable): Получает результат в главном потоке.
+            on_error (Callable, optional): Получает исключение в главном потоке.
+            on_cancel (Callable, optional): Вызывается при отмене задачи.
+
+        Returns:
+            BackgroundTask: Дескриптор для отмены.
+        """
+        if widget is None:
+            raise ValueError("Ошибка: Не указано окно для фоновой задачи.")
+
+        task = BackgroundTask(
+            self.executor.submit(func), widget, on_done, on_error, on_cancel
+        )
+        self.tasks.append(task)
+        task.after_id = widget.after(self.poll_interval, self._poll, task)
+        return task
+
+    def _poll(self, task: BackgroundTask) -> None:
+        task.after_id = None
+        if task.cancelled:
+            return
+        if not task.future.done():
+            task.after_id = task.widget.after(self.poll_interval, self._poll, task)
+            return
+
+        self._forget(task)
+        error = task.future.exception()
+        if error is None:
+            task.on_done(task.future.result())
+        elif task.on_error is not None:
+            task.on_error(error)
+        else:
+            logger.error(f"Ошибка фоновой задачи: {error}")
+
+    def _forget(self, task: BackgroundTask) -> None:
+        if task in self.tasks:
+            self.tasks.remove(task)
+
+    def cancel_for(self, widget: tk.Misc) -> None:
+        """Отменяет все задачи, привязанные к окну (например, при его закрытии)."""
+        for task in [t for t in self.tasks if t.widget is widget]:
+            task.cancel()
+            self._forget(task)
+
+    def cancel_all(self) -> None:
+        """Отменяет все задачи, не вызывая `on_cancel` (окна будут уничтожены)."""
+        for task in list(self.tasks):
+            task.on_cancel = None
+            task.cancel()
+        self.tasks.clear()
+
+    def shutdown(self) -> None:
+        """Отменяет все задачи и останавливает пул без ожидания."""
+        self.cancel_all()
+        self.executor.shutdown(wait=False, cancel_futures=True)
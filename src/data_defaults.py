@@ -6,7 +6,9 @@ from tkinter import messagebox
 from typing import Any
 
 # from gettext import gettext as _
-from config_manager import read_config
+from config_manager import get_config, read_config
+
+from notifications import notifier
 
 logger = logging.getLogger(__name__)
 path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -26,6 +28,7 @@ class DataDefaults:
         self.log = logger.error
         self.info_message = info_handler or messagebox.showinfo
         self.error_message = error_handler or messagebox.showerror
+        self.notify = notifier.notify
         self.language = language
 
         # -- File-Path -- #
@@ -35,17 +38,29 @@ class DataDefaults:
             path_en = path_en or (paths[1] if paths else None)
         self.PRODUCTS_LIST_RU = path_ru or path + "/data/products/products_ru.json"
         self.PRODUCTS_LIST_EN = path_en or path + "/data/products/products_en.json"
-        self.MEALS_LIST = path + "/data/meals.json"
+        config = get_config()
+        self.MEALS_LIST = config.get_path("file_path", "meals_file")
+        self.MEALS_DIR = config.get_path("file_path", "meals_dir")
+
+        # -- Stats -- #
+        self.DAILY_TARGET = config.getfloat("stats", "daily_target")
+        self.ROLLING_WINDOW = config.getint("stats", "rolling_window")
 
-        # -- Colors -- #
-        self.red = {"bg": "#f44336"}
-        self.blue = {"bg": "#2196f3"}
-        self.green = {"bg": "#4CAF50"}
+        # -- Performance -- #
+        self.POLL_INTERVAL = config.getint("performance", "poll_interval")
+        self.MAX_WORKERS = config.getint("performance", "max_workers")
+        self.AUTOCOMPLETE_LIMIT = config.getint("performance", "autocomplete_limit")
+        self.STALL_THRESHOLD_MS = config.getint("performance", "stall_threshold_ms")
+        self.PROFILE_HOTKEY = config.get("performance", "profile_hotkey")
 
-        # -- Styles -- #
+        # -- Styles: имена стилей ttk, зарегистрированных в theme.py -- #
+        self.success = "Success.TButton"
+        self.danger = "Danger.TButton"
+        self.info = "Info.TButton"
+        self.danger_small = "Small.Danger.TButton"
+        self.body = "Body.TLabel"
+        # Поля ввода и списки остаются виджетами tk и получают шрифт опцией
         self.font_10 = {"font": ("Arial", 10, "bold")}
-        self.font_10_ = {"fg": "white", "relief": "flat", "font": ("Arial", 10, "bold")}
-        self.font_12 = {"fg": "white", "relief": "flat", "font": ("Arial", 12, "bold")}
 
         # -- Geometry Settings -- #
         self.frame_grid = {
@@ -399,7 +414,7 @@ class DataDefaults:
                 print(f"Путь к файлу после записи: {file_path}")
                 info_title = _("Успех")
                 info_message = _(f"Файл {file_path} создан с дефолтными значениями.")
-                self.info_message(info_title, info_message)
+                self.notify(info_title, info_message)
             except OSError as e:
                 self.log(f"Ошибка записи файла {file_path}: {e}")
                 self.error_message(
@@ -1,8 +1,8 @@
+import functools
 import json
 import logging
-import os
 import tkinter as tk
-import traceback
+import weakref
 from collections.abc import Callable
 
 # from gettext import gettext as _
@@ -12,6 +12,12 @@ from tkinter import messagebox, ttk
 from typing import Any
 
 from data_defaults import DataDefaults
+from meal_journal import get_journal
+from notifications import notifier
+from product_catalog import ProductCatalog
+from theme import apply_theme
+from translations import ui
+from virtual_scroll import ScrollRegionUpdater, VirtualList
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +42,10 @@ def handle_gui_error(msg: str):
             try:
                 return func(self, *args, **kwargs)
             except Exception as e:
-                error_details = f"{msg}: {e}\n{traceback.format_exc()}"
-                error_title = _("Ошибка:")
-                error_msg = _("{error}").format(error=str(e))
-                logger.error(error_details)
+                error_title = ui("Ошибка:")
+                error_msg = str(e)
+                # Трейсбек форматируется обработчиком лога, а не здесь
+                logger.error(f"{msg}: {e}", exc_info=True)
                 self.error_message(error_title, error_msg)
                 return None
 
@@ -48,22 +54,61 @@ def handle_gui_error(msg: str):
     return decorator
 
 
+# Корневое окно -> загруженная иконка (PhotoImage держим, иначе её соберёт GC)
+_window_icons: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+@functools.cache
+def _icon_file() -> Path | None:
+    """
+    Файл иконки, найденный один раз за время работы интерпретатора.
+
+    PNG ставится через `iconphoto` на любой платформе, `.ico` — запасной
+    вариант для `iconbitmap` (Windows).
+    """
+    resources = Path(__file__).resolve().parent.parent / "resources"
+    for name in ("icon.png", "icon.ico"):
+        if (resources / name).exists():
+            return resources / name
+    logger.warning(
+        _("Иконка {icon_path} не найдена. Используется стандартная иконка.").format(
+            icon_path=resources / "icon.ico"
+        )
+    )
+    return None
+
+
 def set_window_icon(window: tk.Widget = None):
+    """
+    Ставит иконку приложения по умолчанию для всех окон интерпретатора.
+
+    Иконка загружается один раз на корневое окно: `iconphoto(True, ...)` и
+    `iconbitmap(default=...)` действуют и на все Toplevel, созданные позже,
+    поэтому новые окна не обращаются к диску.
+    """
     if window is None:
         logger.error(_("Ошибка: Не указан экземпляр Tkinter."))
         return
 
-    script_dir = Path(__file__).resolve().parent
-    icon_path = script_dir.parent / "resources" / "icon.ico"
+    root = window if isinstance(window, tk.Tk) else window._root()
+    if root in _window_icons:
+        return
+    icon_path = _icon_file()
+    if icon_path is None:
+        _window_icons[root] = None
+        return
 
-    if icon_path.exists():
-        window.iconbitmap(icon_path)
-    else:
-        logger.warning(
-            _("Иконка {icon_path} не найдена. Используется стандартная иконка.").format(
-                icon_path=icon_path
-            )
-        )
+    try:
+        if icon_path.suffix == ".png":
+            icon = tk.PhotoImage(master=root, file=str(icon_path))
+            root.iconphoto(True, icon)
+        else:
+            icon = icon_path
+            root.iconbitmap(default=icon_path)
+    except tk.TclError as e:
+        logger.warning(f"Не удалось установить иконку {icon_path}: {e}")
+        icon = None
+    _window_icons[root] = icon
 
 
 class WidgetFactory:
@@ -104,16 +149,25 @@ class WidgetFactory:
             - size (str): Размер окна, например "800x600".
             - resizable (bool или tuple): Разрешить изменение размера окна.
         """
+        return self.setup_window(cls(), **kwargs)
+
+    def setup_window(
+        self, window: tk.Tk | tk.Toplevel, **kwargs
+    ) -> tk.Tk | tk.Toplevel:
+        """
+        Настраивает уже существующее окно так же, как `_create_window` — новое.
+        Так один корневой tk.Tk переходит от экрана к экрану без пересоздания.
+        """
         title = kwargs.get("title", "Новое Окно")
         size = kwargs.get("size", "500x350")
         resizable = kwargs.get("resizable", (False, False))
 
-        window = cls()
         window.title(title)
         window.geometry(size)
         window.resizable(*resizable)
         window.configure(bg=self.bg_color)
         set_window_icon(window)
+        apply_theme(window, self.bg_color)
         return window
 
     def _create_scrollable_frame(self, frame: tk.Frame) -> tk.Frame:
@@ -126,9 +180,8 @@ class WidgetFactory:
         scrollbar = tk.Scrollbar(frame, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, background=self.bg_color)
 
-        scrollable_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Пачка <Configure> при добавлении строк даёт одно обновление области
+        scrollable_frame.bind("<Configure>", ScrollRegionUpdater(canvas).schedule)
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
@@ -145,6 +198,10 @@ class WidgetFactory:
     ) -> tk.Widget | None:
         """Создает виджеты такие, как Button Frame Label и так далее"""
         style_option = kwargs.pop("style", {})
+        if isinstance(style_option, str):
+            # Имя стиля ttk (см. theme.py) вместо набора опций виджета
+            kwargs["style"] = style_option
+            style_option = {}
         grid_option = kwargs.pop("grid", {})
         place_option = kwargs.pop("place", {})
         pack_option = kwargs.pop("pack", {})
@@ -171,6 +228,9 @@ class WidgetFactory:
 
     def _create_combo(self, cls: type[ttk.Combobox], frame: tk.Widget | None, **kwargs):
         style_option = kwargs.pop("style", {})
+        if isinstance(style_option, str):
+            kwargs["style"] = style_option
+            style_option = {}
         grid_option = kwargs.pop("grid", {})
 
         try:
@@ -190,13 +250,14 @@ class WidgetBuilder(WidgetFactory):
 
     def create_button(
         self, window: tk.Widget, text: str, command: Callable, **kwargs
-    ) -> tk.Button | None:
+    ) -> ttk.Button | None:
+        """Кнопка ttk; `style` — имя стиля из theme.py (например, settings.success)."""
         return self.create_widgets(
-            tk.Button, frame=window, text=text, command=command, **kwargs
+            ttk.Button, frame=window, text=text, command=command, **kwargs
         )
 
-    def create_label(self, window: tk.Widget, text: str, **kwargs) -> tk.Label | None:
-        return self.create_widgets(tk.Label, frame=window, text=text, **kwargs)
+    def create_label(self, window: tk.Widget, text: str, **kwargs) -> ttk.Label | None:
+        return self.create_widgets(ttk.Label, frame=window, text=text, **kwargs)
 
     def create_entry(self, window: tk.Widget, **kwargs) -> tk.Entry | None:
         return self.create_widgets(tk.Entry, frame=window, **kwargs)
@@ -207,6 +268,14 @@ class WidgetBuilder(WidgetFactory):
     def create_scrollable_frame(self, window: tk.Widget, **kwargs) -> tk.Frame | None:
         return self.create_widgets(tk.Frame, frame=window, is_scrollable=True, **kwargs)
 
+    def create_virtual_list(
+        self, window: tk.Widget, model, create_row, bind_row, **kwargs
+    ) -> VirtualList:
+        """Список, в котором создаются только видимые строки (см. VirtualList)."""
+        return VirtualList(
+            window, model, create_row, bind_row, bg=self.bg_color, **kwargs
+        )
+
     def create_listbox(self, window: tk.Widget, **kwargs) -> tk.Listbox | None:
         return self.create_widgets(tk.Listbox, frame=window, **kwargs)
 
@@ -233,6 +302,7 @@ class Factory(WidgetFactory):
         self.log_info = logger.info
         self.info_message = info_handler or messagebox.showinfo
         self.error_message = error_handler or messagebox.showerror
+        self.notify = notifier.notify
         self.language = language
         self.settings = DataDefaults(self.language)
 
@@ -327,6 +397,8 @@ class Factory(WidgetFactory):
             with open(file_path, method, encoding="utf-8") as f:
                 return json.load(f)
         elif method == "w":
+            if isinstance(data, ProductCatalog):
+                data = data.to_dict()
             if data is not None:
                 if isinstance(data, dict):
                     for key, value in data.items():
@@ -351,14 +423,14 @@ class Factory(WidgetFactory):
         self, file_path: str, entries: list[tuple[str, float, float]]
     ) -> None:
         """
-        Сохраняет записи о приеме пищи и общее количество калорий в файл JSON.
+        Сохраняет запись о приеме пищи и общее количество калорий в журнал.
 
         Аргументы:
         записи (список кортежа): Каждый элемент — это (имя, вес, калории).
-        File_path (str): Путь к файлу для сохранения результатов.
+        File_path (str): Каталог помесячного журнала (см. MealJournal).
 
         Побочные эффекты:
-        Обновляет файл, показывает диалоговое окно информации.
+        Дописывает строку в файл текущего месяца, показывает немодальное уведомление.
 
         Примечания:
         Пропускает сохранение, если записи неправильно сформированы.
@@ -376,15 +448,15 @@ class Factory(WidgetFactory):
             "total": total,
         }
 
-        existing_data = []
-        if os.path.exists(file_path):
-            existing_data = self.read_and_write_file(file_path, "r") or []
-
-        existing_data.append(meals_data)
-        self.read_and_write_file(file_path, "w", existing_data)
+        get_journal(file_path).append(meals_data)
         msg_title = _("Успех")
         message = _("Данные сохранены в {file_path}").format(file_path=file_path)
-        self.info_message(msg_title, message)
+        self.notify(
+            msg_title,
+            message,
+            key="meals.saved",
+            summary=_("Приёмов пищи сохранено: {count}"),
+        )
 
     @handle_gui_error("Ошибка")
     def reset_config_settings(self):
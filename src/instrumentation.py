@@ -0,0 +1,161 @@
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager, nullcontext
+
+logger = logging.getLogger(__name__)
+
+ENV_VAR = "MEALS_SPANS"  # "1" — включить, "0" — выключить (сильнее конфига)
+ENV_OUTPUT = "MEALS_SPANS_OUTPUT"  # путь к JSON-отчёту
+
+# Общий пустой контекст: выключенный замер не создаёт объектов
+_DISABLED = nullcontext()
+
+
+class SpanStats:
+    """Накопленная статистика одного именованного участка."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.count, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class Instrumentation:
+    """
+    Замеры длительности и количества вызовов горячих участков кода.
+
+    Участки размечаются контекстным менеджером `span(name)` или декоратором
+    `timed(name)`. Пока замеры выключены, `span` возвращает общий пустой
+    контекст, а `timed` сразу вызывает функцию — цена одна проверка флага.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.output: str | None = None
+        self.spans: dict[str, SpanStats] = {}
+        self._lock = threading.Lock()
+        self._exit_registered = False
+
+    def configure(self) -> bool:
+        """
+        Включает замеры по переменной окружения `MEALS_SPANS` или по
+        секции [instrumentation] конфига и регистрирует отчёт при выходе.
+
+        Returns:
+            bool: Включены ли замеры.
+        """
+        # Импорт здесь: модули с разметкой запускаются и как скрипты без config/
+        from config_manager import get_config
+
+        config = get_config()
+        env = os.environ.get(ENV_VAR)
+        if env is not None:
+            self.enabled = env.strip().lower() in {"1", "true", "yes", "on"}
+        else:
+            self.enabled = config.getboolean("instrumentation", "enabled")
+        self.output = os.environ.get(ENV_OUTPUT) or (
+            config.get("instrumentation", "output") or None
+        )
+        if self.enabled and not self._exit_registered:
+            atexit.register(self.export)
+            self._exit_registered = True
+        return self.enabled
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = SpanStats()
+            stats.add(seconds)
+
+    @contextmanager
+    def _measure(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def span(self, name: str):
+        """Контекстный менеджер замера участка `name`."""
+        if not self.enabled:
+            return _DISABLED
+        return self._measure(name)
+
+    def timed(self, name: str) -> Callable:
+        """Декоратор замера каждого вызова функции как участка `name`."""
+
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+
+            return wrapper
+
+        return decorator
+
+    def summary(self) -> dict[str, dict]:
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in sorted(self.spans.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+    def export(self, path: str | None = None) -> dict[str, dict]:
+        """
+        Пишет сводку замеров в лог и, если задан путь, в JSON-файл.
+
+        Args:
+            path (str, optional): Файл отчёта; по умолчанию — из настроек.
+        """
+        summary = self.summary()
+        if not summary:
+            return summary
+        for name, stats in summary.items():
+            logger.info(
+                f"span {name}: {stats['count']} раз, всего {stats['total_ms']} мс, "
+                f"среднее {stats['mean_ms']} мс, максимум {stats['max_ms']} мс"
+            )
+        path = path or self.output
+        if path:
+            try:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(summary, f, ensure_ascii=False, indent=2)
+            except OSError as e:
+                logger.error(f"Ошибка записи отчёта замеров {path}: {e}")
+        return summary
+
+
+# Общий экземпляр приложения и короткие имена для разметки кода
+instrumentation = Instrumentation()
+span = instrumentation.span
+timed = instrumentation.timed
@@ -0,0 +1,149 @@
+import json
+import logging
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него индекс читается через array
+    np = None
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+EPOCH = datetime(1970, 1, 1)
+
+# Запись индекса: время в микросекундах от EPOCH, итог калорий и смещение
+# строки в несжатом потоке файла месяца. Все поля — float64: целые до 2**53
+# хранятся точно, а массив читается одним `frombuffer`/`frombytes`.
+RECORD = struct.Struct("ddd")
+FIELDS = 3
+
+
+def to_micros(timestamp: str | datetime) -> int:
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    return (timestamp - EPOCH) // timedelta(microseconds=1)
+
+
+def has_timestamp(entry) -> bool:
+    """Есть ли у записи журнала корректная метка времени (строки правят вручную)."""
+    try:
+        to_micros(entry["timestamp"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return True
+
+
+def from_micros(value: float) -> datetime:
+    return EPOCH + timedelta(microseconds=int(value))
+
+
+def positions_in_range(stamps, low: int, high: int):
+    """Возвращает номера записей индекса с временем в [low, high]."""
+    if np is not None and isinstance(stamps, np.ndarray):
+        return np.flatnonzero((stamps >= low) & (stamps <= high))
+    return [i for i, value in enumerate(stamps) if low <= value <= high]
+
+
+class JournalIndex:
+    """
+    Двоичный индекс фиксированной ширины рядом с файлами месяцев журнала.
+
+    Для каждого `ГГГГ-ММ.jsonl[.gz|.xz|.zst]` хранится `ГГГГ-ММ.idx` с
+    временем, итогом и смещением каждой записи. Итоги за период и данные
+    графика считаются по индексу без разбора JSON; полная запись читается
+    по смещению только когда она действительно нужна.
+
+    Индекс — это кэш: если он отсутствует или не совпадает с манифестом
+    по количеству записей, он перестраивается сканированием файла месяца.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + INDEX_SUFFIX)
+
+    @staticmethod
+    def _pack(records: Iterable[tuple[dict, int]]) -> bytes:
+        return b"".join(
+            RECORD.pack(
+                to_micros(entry["timestamp"]), float(entry.get("total", 0.0)), offset
+            )
+            for entry, offset in records
+        )
+
+    def append(self, key: str, records: list[tuple[dict, int]]) -> None:
+        """Дописывает записи (запись, смещение) в конец индекса месяца."""
+        with open(self.path(key), "ab") as f:
+            f.write(self._pack(records))
+
+    def write(self, key: str, records: list[tuple[dict, int]]) -> None:
+        """Полностью перезаписывает индекс месяца."""
+        tmp_path = self.path(key) + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self._pack(records))
+        os.replace(tmp_path, self.path(key))
+
+    def discard(self, key: str) -> None:
+        """Удаляет индекс месяца; при следующем чтении он будет перестроен."""
+        if os.path.exists(self.path(key)):
+            os.remove(self.path(key))
+
+    def rebuild(self, key: str, lines: Iterable[bytes]) -> None:
+        """
+        Строит индекс заново по строкам несжатого потока файла месяца.
+
+        Args:
+            key (str): Месяц `ГГГГ-ММ`.
+            lines (Iterable[bytes]): Строки файла, открытого в двоичном режиме.
+        """
+        records = []
+        offset = 0
+        for line in lines:
+            if line.strip():
+                try:
+                    entry = json.loads(line)
+                except ValueError as e:
+                    logger.error(f"Индекс {key}: пропущена строка ({e})")
+                else:
+                    if has_timestamp(entry):
+                        records.append((entry, offset))
+                    else:
+                        logger.warning(f"Индекс {key}: пропущена строка без даты")
+            offset += len(line)
+        self.write(key, records)
+
+    def count(self, key: str) -> int:
+        if not os.path.exists(self.path(key)):
+            return -1
+        return os.path.getsize(self.path(key)) // RECORD.size
+
+    def load(self, key: str):
+        """
+        Возвращает столбцы индекса месяца: (время_мкс, итог, смещение).
+
+        При наличии NumPy столбцы — массивы `float64`, иначе `array("d")`.
+        Актуальность индекса проверяет вызывающий код (см. `count`).
+        """
+        with open(self.path(key), "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < RECORD.size:
+                empty = array("d")
+                return empty, empty, empty
+            # Отображение закрывается сразу после копирования: открытый mmap
+            # на Windows не дал бы переписать индекс при следующей записи.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                usable = size - size % RECORD.size
+                if np is not None:
+                    data = np.frombuffer(mm, dtype="f8", count=usable // 8).copy()
+                    data = data.reshape(-1, FIELDS)
+                    return data[:, 0], data[:, 1], data[:, 2]
+                values = array("d")
+                values.frombytes(mm[:usable])
+                return values[0::FIELDS], values[1::FIELDS], values[2::FIELDS]
@@ -1,6 +1,4 @@
-import gettext
 import logging
-import os
 import tkinter as tk
 from collections.abc import Callable
 from tkinter import messagebox
@@ -9,10 +7,12 @@ from tkinter import messagebox
 from config_manager import read_config, write_config
 from log import setup_logger
 
-from data_defaults import DataDefaults
-from gui_factory import Factory, handle_gui_error
+from gui_factory import handle_gui_error
+from instrumentation import instrumentation
 from main_controller import MainController
-from product_manager import ProductContext, ProductManager
+from sampling_profile import sampler
+from startup_profile import profiler
+from translations import registry
 
 # —— Setup Language —— #
 logger = logging.getLogger(__name__)
@@ -38,23 +38,16 @@ class SetupLanguage:
         """
         Загружает и применяет файл перевода для указанного языка.
 
+        Каталог читается с диска только при первом обращении к языку,
+        дальше он берётся из кэша реестра.
+
         Args:
             language_code (str): Код языка (например, 'ru', 'en').
         """
         global _  # очень важно — объявить здесь, чтобы изменять глобальную переменную
 
-        locale_dir = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "locales")
-        )
-
         try:
-            lang = gettext.translation(
-                domain="messages",
-                localedir=locale_dir,
-                languages=[language_code],
-                fallback=True,
-            )
-            lang.install()
+            lang = registry.activate(language_code)
             _ = lang.gettext
         except FileNotFoundError:
 
@@ -73,6 +66,7 @@ class Localization(SetupLanguage):
 
     def __init__(self, error_handler=None):
         super().__init__(error_handler=error_handler)
+        self.main: MainController | None = None  # меню, открытое из окна выбора
 
     def init_window(self):
         """Инициализирует графическое окно выбора языка."""
@@ -106,7 +100,10 @@ class Localization(SetupLanguage):
             frame.grid_rowconfigure(idx, weight=1)
         frame.grid_columnconfigure(0, weight=1)
 
+        profiler.watch(self.root)
         self.root.mainloop()
+        if self.main:
+            self.main.shutdown()
 
     def start_application_with_language(self, language_code: str, root: tk.Tk = None):
         """
@@ -114,20 +111,27 @@ class Localization(SetupLanguage):
 
         Args:
             language_code (str): Выбранный язык.
+            root (tk.Tk, optional): Окно выбора языка; главное меню
+                открывается в нём же и работает в уже идущем цикле событий
+                окна выбора (см. `init_window`), вложенный `mainloop()` не
+                запускается.
         """
         if root:
-            factory = Factory(language_code)
-            factory.window_status(root, "hide")
-            settings = DataDefaults(language_code)
-            context = ProductContext(language_code)
-            manager = ProductManager(context)
-            root.destroy()
+            # Экран выбора языка убирается, окно остаётся для главного меню
+            for child in root.winfo_children():
+                child.destroy()
         # Здесь инициализируется основное приложение.
         setup_logger()
+        instrumentation.configure()
+        sampler.configure()
         msg = _("Выбранный язык: {language_code}").format(language_code=language_code)
         self.log_info(msg)
         main = MainController(language_code)
-        main.run()
+        if root:
+            self.main = main
+            main.build(root)
+        else:
+            main.run()
 
     @handle_gui_error("Ошибка")
     def _on_close(self):
@@ -146,16 +150,21 @@ class Localization(SetupLanguage):
         """
         write_config(language_code)
         self.setup_language(language_code)
-        self.start_application_with_language(language_code, self.root)
+        # Меню строится вне обработчика кнопки, которую оно же уничтожает
+        self.root.after_idle(
+            lambda: self.start_application_with_language(language_code, self.root)
+        )
 
     def run(self):
         """
         Основная точка запуска модуля локализации.
         Если сохранён язык — запускается сразу приложение, иначе — окно выбора.
         """
-        saved_language, file_paths = read_config()
+        with profiler.phase("config"):
+            saved_language, file_paths = read_config()
         if saved_language:
-            self.setup_language(saved_language)
+            with profiler.phase("gettext"):
+                self.setup_language(saved_language)
             self.start_application_with_language(saved_language)
         else:
             self.init_window()
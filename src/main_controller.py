@@ -1,16 +1,28 @@
 import logging
 import tkinter as tk
 from collections.abc import Callable
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 
 import matplotlib.pyplot as plt
+from config_manager import write_config
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+import rolling_stats
+from background import BackgroundRunner
+
 # from gettext import gettext as _
 from data_defaults import DataDefaults
 from gui_factory import Factory, WidgetBuilder
+from instrumentation import timed
+from notifications import notifier
 from product_manager import ProductCalculator, ProductContext, ProductManager
+from product_rows import ProductRows
+from session_profile import SessionProfiler
+from stall_monitor import StallMonitor
+from startup_profile import profiler
 from stats_manager import StatsManager
+from translations import registry, ui
+from window_pool import WindowPool
 
 logger = logging.getLogger(__name__)
 
@@ -29,45 +41,60 @@ class MainController:
 
         self.settings = DataDefaults(self.language)
         self.context = ProductContext(self.language)
-        self.manager = ProductManager(self.context)
+        with profiler.phase("catalog"):
+            self.manager = ProductManager(self.context)
         self.calculator = ProductCalculator(self.context, self.manager.products)
         self.factory = Factory(self.language)
         self.builder = WidgetBuilder()
-        self.stats_manager = StatsManager()
+        with profiler.phase("stats"):
+            self.stats_manager = StatsManager(
+                stats_file=self.settings.MEALS_LIST,
+                journal_dir=self.settings.MEALS_DIR,
+            )
+        self.runner = BackgroundRunner(
+            max_workers=self.settings.MAX_WORKERS,
+            poll_interval=self.settings.POLL_INTERVAL,
+        )
+        self.stall_monitor = StallMonitor(threshold_ms=self.settings.STALL_THRESHOLD_MS)
+        self.session_profiler = SessionProfiler()
+        # Экраны меню строятся один раз и дальше только прячутся/показываются
+        self.windows = WindowPool()
+        self.product_rows = ProductRows()
 
     def get_button_style(self, text, case=0):
-        """Определяет стиль для кнопки на основе её текста"""
-        style = {**self.settings.font_12, **self.settings.green}
+        """Определяет стиль ttk для кнопки на основе её текста"""
+        style = self.settings.success
 
         # Применяем особые стили для некоторых кнопок
         if case == 0:
             special_styles = {
-                "Выход": self.settings.red,
-                "Exit": self.settings.red,
-                "Cбросить Языковые Настройки": self.settings.blue,
-                "Reset Language Settings": self.settings.blue,
+                "Выход": self.settings.danger,
+                "Exit": self.settings.danger,
+                "Cбросить Языковые Настройки": self.settings.info,
+                "Reset Language Settings": self.settings.info,
+                "Сменить язык": self.settings.info,
+                "Switch Language": self.settings.info,
             }
         elif case == 1:
             special_styles = {
-                "Назад": self.settings.red,
-                "Back": self.settings.red,
-                "Рассчитать": self.settings.blue,
-                "Calculate": self.settings.blue,
+                "Назад": self.settings.danger,
+                "Back": self.settings.danger,
+                "Рассчитать": self.settings.info,
+                "Calculate": self.settings.info,
             }
 
         # Если текст кнопки соответствует одному из ключей, меняем стиль
-        style.update(special_styles.get(text, {}))
-
-        return style
+        return special_styles.get(text, style)
 
     def create_buttons(self, frame):
         """Создаёт и отображает кнопки"""
         buttons = [
-            (_("Рассчитать калории"), self.open_calculate_window),
-            (_("Меню управления продуктами"), self.open_manager_products_menu),
-            (_("Показать статистику"), self.open_stats_menu),
-            (_("Выход"), lambda: self.factory.on_close(self.root)),
-            (_("Cбросить Языковые Настройки"), self.factory.reset_config_settings),
+            (ui("Рассчитать калории"), self.open_calculate_window),
+            (ui("Меню управления продуктами"), self.open_manager_products_menu),
+            (ui("Показать статистику"), self.open_stats_menu),
+            (ui("Выход"), lambda: self.factory.on_close(self.root)),
+            (ui("Cбросить Языковые Настройки"), self.factory.reset_config_settings),
+            (ui("Сменить язык"), self.switch_language),
         ]
 
         for idx, (text, command) in enumerate(buttons):
@@ -85,53 +112,149 @@ class MainController:
 
     def _win_(self, title, size):
         self.factory.window_status(self.root, "hide")
-        win = self.builder.create_widgets(cls=tk.Toplevel, title=_(title), size=size)
+        win = self.builder.create_widgets(cls=tk.Toplevel, title=ui(title), size=size)
         win.protocol("WM_DELETE_WINDOW", lambda: self.factory.on_close(self.root, win))
         return win
 
-    def run(self):
-        self.root = self.builder.create_widgets(
-            cls=tk.Tk, title=_("Главное Меню"), size="500x350"
-        )
+    def run(self, root: tk.Tk | None = None):
+        """
+        Строит главное меню и запускает цикл событий.
+
+        Args:
+            root (tk.Tk, optional): Уже созданное корневое окно; меню
+                строится в нём, второй интерпретатор Tcl/Tk не создаётся.
+        """
+        self.build(root)
+        self.root.mainloop()
+        self.shutdown()
+
+    def build(self, root: tk.Tk | None = None):
+        """
+        Строит главное меню, не запуская цикл событий.
+
+        Так меню открывается из окна выбора языка: его цикл событий уже
+        идёт, и после выхода из него вызывающий код делает `shutdown()`.
+
+        Args:
+            root (tk.Tk, optional): Корневое окно; без него создаётся новое.
+        """
+        window = {"title": ui("Главное Меню"), "size": "500x350"}
+        if root is None:
+            self.root = self.builder.create_widgets(cls=tk.Tk, **window)
+        else:
+            self.root = self.builder.setup_window(root, **window)
         self.root.protocol("WM_DELETE_WINDOW", lambda: self.factory.on_close(self.root))
-        main_frame = self.builder.create_frame(
+        self.main_frame = self.builder.create_frame(
             self.root, grid={**self.settings.frame_grid}
         )
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
 
-        self.create_buttons(main_frame)
+        self.create_buttons(self.main_frame)
+
+        notifier.attach(self.root)
+        profiler.watch(self.root)
+        self.root.after_idle(self.preload_stats)
+        registry.subscribe(self.apply_language)
+        self.stall_monitor.start(self.root)
+        self.session_profiler.bind(self.root, self.settings.PROFILE_HOTKEY)
+
+    def shutdown(self):
+        """Освобождает ресурсы после выхода из цикла событий."""
+        self.stall_monitor.stop()
+        self.session_profiler.stop()  # незавершённая запись не теряется
+        registry.unsubscribe(self.apply_language)
+        self.runner.shutdown()
+
+    def preload_stats(self):
+        """Открывает журнал статистики в фоне, когда главное меню уже на экране."""
+        if self.stats_manager.loaded:
+            return
+        self.runner.submit(
+            self.root,
+            self.stats_manager.preload,
+            on_done=lambda _result: None,
+            on_error=lambda e: self.log(f"Ошибка фоновой загрузки статистики: {e}"),
+        )
 
-        self.root.mainloop()
+    def switch_language(self, language: str | None = None):
+        """
+        Переключает язык интерфейса без перезапуска приложения.
+
+        Args:
+            language (str, optional): Код языка; по умолчанию — другой из
+                двух поддерживаемых.
+        """
+        language = language or ("en" if self.language == "ru" else "ru")
+        if language == self.language:
+            return
+        write_config(language)
+        # Реестр установит кэшированный каталог и вызовет apply_language
+        registry.activate(language)
+
+    def apply_language(self, language: str):
+        """
+        Применяет новый язык: меняет каталог продуктов и перерисовывает окна.
+
+        Каталоги продуктов берутся из кэша `ProductManager`, поэтому
+        переключение не перечитывает файлы, уже загруженные ранее.
+        """
+        self.language = language
+        self.settings.language = language
+        self.factory.language = language
+
+        products = self.manager.switch_language(language)
+        if products is not None:
+            self.calculator.language = language
+            self.calculator.products = products
+
+        self.rerender()
+
+    def rerender(self):
+        """Закрывает дочерние окна и заново строит главное меню на текущем языке."""
+        self.runner.cancel_all()
+        self.windows.clear()
+        for child in self.root.winfo_children():
+            if isinstance(child, tk.Toplevel):
+                child.destroy()
+        self.main_frame.destroy()
+
+        self.root.title(ui("Главное Меню"))
+        self.main_frame = self.builder.create_frame(
+            self.root, grid={**self.settings.frame_grid}
+        )
+        self.create_buttons(self.main_frame)
+        self.factory.window_status(self.root, "show")
 
     def open_calculate_window(self):
         if not self.manager.products:
-            self.error_message(_("Ошибка"), _("Нет продуктов для расчёта."))
+            self.error_message(ui("Ошибка"), ui("Нет продуктов для расчёта."))
             return
+        self.windows.show(
+            "calculate",
+            self.root,
+            self._build_calculate_window,
+            reset=self._reset_calculate_window,
+        )
 
+    def _build_calculate_window(self):
         win = self._win_("Рассчитать калории", "500x500")
         frame = self.builder.create_frame(win, grid={**self.settings.frame_grid})
-        scrollable_area = self.builder.create_scrollable_frame(frame)
-        product_rows = []
-
-        def add_row():
-            row = self.calculator.create_input_product_row(
-                product_rows, scrollable_area
-            )
-            product_rows.append(row)
-            scrollable_area.grid_rowconfigure(0, weight=1)
-            scrollable_area.grid_columnconfigure(1, weight=1)
-
-        add_row()
+        self.scrollable_area = self.builder.create_scrollable_frame(frame)
+        self.product_rows = ProductRows()
+        self.add_product_row()
 
         btn_frame = self.builder.create_frame(
             win, grid={**self.settings.frame_grid, "row": 1}
         )
 
         buttons = [
-            (_("+ Добавить продукт"), add_row),
-            (_("Рассчитать"), lambda: self.calculator.calculate_total(product_rows)),
-            (_("Назад"), lambda: self.factory.restore_root_window(self.root, win)),
+            (ui("+ Добавить продукт"), self.add_product_row),
+            (
+                ui("Рассчитать"),
+                lambda: self.calculator.calculate_total(self.product_rows),
+            ),
+            (ui("Назад"), lambda: self.windows.hide(self.root, win)),
         ]
 
         for idx, (text, command) in enumerate(buttons):
@@ -142,15 +265,32 @@ class MainController:
         btn_frame.grid_columnconfigure(0, weight=1)
         win.grid_rowconfigure(0, weight=1)
         win.grid_columnconfigure(0, weight=1)
+        return win
+
+    def add_product_row(self):
+        self.calculator.create_input_product_row(
+            self.product_rows, self.scrollable_area
+        )
+        self.scrollable_area.grid_rowconfigure(0, weight=1)
+        self.scrollable_area.grid_columnconfigure(1, weight=1)
+
+    def _reset_calculate_window(self):
+        """Возвращает калькулятор к одной пустой строке ввода."""
+        # Виджеты строк прячутся и достаются новым строкам, а не пересоздаются
+        self.product_rows.clear()
+        self.add_product_row()
 
     def open_manager_products_menu(self):
+        self.windows.show("products", self.root, self._build_manager_products_menu)
+
+    def _build_manager_products_menu(self):
         win = self._win_("Меню управления продуктами", "500x350")
         frame = self.builder.create_frame(win, grid={**self.settings.frame_grid})
 
         actions = [
-            (_("Добавить продукт"), "Append"),
-            (_("Удалить продукт"), "Delete"),
-            (_("Изменить Калорийность"), "Change"),
+            (ui("Добавить продукт"), "Append"),
+            (ui("Удалить продукт"), "Delete"),
+            (ui("Изменить Калорийность"), "Change"),
         ]
 
         for idx, (label, tag) in enumerate(actions):
@@ -158,15 +298,15 @@ class MainController:
                 frame,
                 text=label,
                 command=lambda t=tag: self.manager.root_for_window(win, tag=t),
-                style={**self.settings.font_12, **self.settings.green},
+                style=self.settings.success,
                 grid={**self.settings.button_grid, "row": idx},
             )
 
         self.builder.create_button(
             frame,
-            text=_("Назад в меню"),
-            command=lambda: self.factory.restore_root_window(self.root, win),
-            style={**self.settings.font_12, **self.settings.red},
+            text=ui("Назад в меню"),
+            command=lambda: self.windows.hide(self.root, win),
+            style=self.settings.danger,
             grid={**self.settings.button_grid, "row": len(actions)},
         )
 
@@ -175,44 +315,48 @@ class MainController:
         frame.grid_columnconfigure(0, weight=1)
         win.grid_rowconfigure(0, weight=1)
         win.grid_columnconfigure(0, weight=1)
+        return win
 
     def open_stats_menu(self):
+        self.windows.show("stats", self.root, self._build_stats_menu)
+
+    def _build_stats_menu(self):
         win = self._win_("Показать статистику", "500x350")
         frame = self.builder.create_frame(win, grid={**self.settings.frame_grid})
 
         buttons = [
             (
-                _("Статистика за 7 дней:"),
-                lambda: self.show_stats_window(
-                    _("7 дней"), self.stats_manager.get_stats_by_period("week")
+                ui("Статистика за 7 дней:"),
+                lambda: self.request_stats(
+                    frame, ui("7 дней"), "week", row=len(buttons)
                 ),
             ),
             (
-                _("Статистика за 30 дней:"),
-                lambda: self.show_stats_window(
-                    _("30 дней"), self.stats_manager.get_stats_by_period("month")
+                ui("Статистика за 30 дней:"),
+                lambda: self.request_stats(
+                    frame, ui("30 дней"), "month", row=len(buttons)
                 ),
             ),
-            (_("Статистика за указанный период:"), None),  # TODO: Пока не брался за это
             (
-                _("Статистика за все время:"),
-                lambda: self.show_stats_window(
-                    _("Все время"), self.stats_manager.get_stats_by_period("all")
+                ui("Статистика за указанный период:"),
+                None,
+            ),  # TODO: Пока не брался за это
+            (
+                ui("Статистика за все время:"),
+                lambda: self.request_stats(
+                    frame, ui("Все время"), "all", row=len(buttons)
                 ),
             ),
-            (_("Назад"), lambda: self.factory.restore_root_window(self.root, win)),
+            (ui("Назад"), lambda: self._close_stats_menu(win, frame)),
         ]
 
         for idx, (text, command) in enumerate(buttons):
-            style = {**self.settings.font_12, **self.settings.green}
+            style = self.settings.success
             grid = {**self.settings.button_grid, "row": idx}
             if text in ["Назад", "Back"]:
-                style = {**self.settings.font_12, **self.settings.red}
+                style = self.settings.danger
             if command is None:
-                style = {
-                    **self.settings.font_12,
-                    **self.settings.blue,
-                }  # Убрать после реализации.
+                style = self.settings.info  # Убрать после реализации.
             self.builder.create_button(
                 frame, text=text, command=command, style=style, grid=grid
             )
@@ -221,8 +365,84 @@ class MainController:
         frame.grid_columnconfigure(0, weight=1)
         win.grid_rowconfigure(0, weight=1)
         win.grid_columnconfigure(0, weight=1)
+        win.protocol(
+            "WM_DELETE_WINDOW",
+            lambda: self._close_stats_menu(win, frame, self.factory.on_close),
+        )
+        return win
 
-    def show_stats_window(self, title: str, stats: list[dict]):
+    def _close_stats_menu(self, win, frame, close=None):
+        """Отменяет незавершённые запросы статистики и прячет (закрывает) меню."""
+        self.runner.cancel_for(frame)
+        (close or self.windows.hide)(self.root, win)
+
+    def request_stats(self, frame, title: str, period: str, row: int = 0):
+        """
+        Запрашивает статистику за период в фоновом потоке.
+
+        Пока идёт выборка и подготовка данных графика, в меню показывается
+        надпись о загрузке; окно статистики открывается уже в главном потоке.
+        Повторный запрос из того же меню отменяет предыдущий.
+        """
+        self.runner.cancel_for(frame)
+        placeholder = self.builder.create_label(
+            frame,
+            text=ui("Загрузка..."),
+            style=self.settings.body,
+            grid={**self.settings.label_grid, "row": row},
+        )
+
+        def collect():
+            # Графику нужны только время и итог: берём их из индекса журнала
+            stats = self.stats_manager.get_totals_by_period(period)
+            overlays = rolling_stats.build_overlays(
+                stats, self.settings.ROLLING_WINDOW, self.settings.DAILY_TARGET
+            )
+            return stats, self.prepare_chart_data(stats), overlays
+
+        def clear_placeholder():
+            if placeholder is not None and placeholder.winfo_exists():
+                placeholder.destroy()
+
+        def on_done(result):
+            clear_placeholder()
+            stats, chart, overlays = result
+            self.show_stats_window(title, stats, chart=chart, overlays=overlays)
+
+        def on_error(error):
+            clear_placeholder()
+            self.show_error(ui("Ошибка"), str(error))
+
+        self.runner.submit(frame, collect, on_done, on_error, clear_placeholder)
+
+    @staticmethod
+    def prepare_chart_data(stats: list[dict]) -> tuple[list[str], list[float]]:
+        """
+        Готовит оси графика: даты (без времени) и итоговые калории записей.
+
+        Не трогает Tk и matplotlib, поэтому может выполняться в рабочем потоке.
+        """
+        dates = []
+        total_calories = []
+        for entry in stats:
+            dates.append(entry.get("timestamp", "")[:10])  # Только дата без времени
+            total_calories.append(entry.get("total", 0.0))
+        return dates, total_calories
+
+    @timed("stats.chart")
+    def show_stats_window(
+        self,
+        title: str,
+        stats: list[dict],
+        chart: tuple[list[str], list[float]] | None = None,
+        overlays: dict | None = None,
+    ):
+        """
+        Показывает окно с графиком калорий за период.
+
+        `overlays` — ряды из `rolling_stats.build_overlays` (скользящее
+        среднее, цель, лучшая серия); без них строится только сам график.
+        """
         win = self._win_(title, "700x500")
         frame = self.builder.create_scrollable_frame(win)
 
@@ -230,25 +450,24 @@ class MainController:
         if not stats:
             self.builder.create_label(
                 frame,
-                text=_("Нет данных за указанный период"),
+                text=ui("Нет данных за указанный период"),
                 grid={**self.settings.label_grid},
-                style={**self.settings.font_10},
+                style=self.settings.body,
             )
             return
 
-        # Подготовим данные для графика
-        dates = []
-        total_calories = []
-        label_n_title = [_("Дата"), _("Итого Калорий"), _("Калорий за День")]
-
-        for entry in stats:
-            timestamp = entry.get("timestamp", "")[:10]  # Только дата без времени
-            total_calories.append(entry.get("total", 0.0))
-            dates.append(timestamp)
+        # Данные для графика обычно уже подготовлены в фоновом потоке
+        dates, total_calories = chart or self.prepare_chart_data(stats)
+        label_n_title = [ui("Дата"), ui("Итого Калорий"), ui("Калорий за День")]
 
         # Создаём график
         fig, ax = plt.subplots(figsize=(6, 4))
 
+        # Ряды по дням рисуются первыми: они покрывают все дни периода,
+        # и категориальная ось дат остаётся упорядоченной
+        if overlays:
+            self._plot_overlays(ax, overlays)
+
         ax.plot(
             dates,
             total_calories,
@@ -281,11 +500,62 @@ class MainController:
             row=0, column=0, sticky="nsew"
         )  # Добавляем его в окно Tkinter
 
+        self._create_entries_list(frame, stats)
+
         # Настройка прокрутки
         frame.grid_columnconfigure(0, weight=1)
         win.grid_rowconfigure(0, weight=1)
         win.grid_columnconfigure(0, weight=1)
 
+    def _create_entries_list(self, frame, stats: list[dict]):
+        """
+        Список записей периода под графиком.
+
+        За «всё время» записей могут быть тысячи, поэтому список виртуальный:
+        надписей создаётся столько, сколько строк видно.
+        """
+        container = self.builder.create_frame(
+            frame, grid={"row": 1, "column": 0, "sticky": "nsew", "pady": 5}
+        )
+
+        def create_row(canvas):
+            return ttk.Label(canvas, style=self.settings.body, anchor="w")
+
+        def bind_row(label, entry, _index):
+            moment = entry["timestamp"][:16].replace("T", " ")
+            label.configure(text=f"{moment}   {entry.get('total', 0.0):.2f}")
+
+        return self.builder.create_virtual_list(
+            container, stats, create_row, bind_row, row_height=24, height=168
+        )
+
+    @staticmethod
+    def _plot_overlays(ax, overlays: dict):
+        ax.plot(
+            overlays["dates"],
+            overlays["average"],
+            linestyle="-",
+            color="orange",
+            label=_("Среднее за {days} дн.").format(days=overlays["window"]),
+        )
+        if "target" not in overlays:
+            return
+        ax.axhline(
+            overlays["target"], linestyle="--", color="g", label=ui("Дневная цель")
+        )
+        length, start = overlays["streak"]
+        if length:
+            ax.text(
+                0.01,
+                0.97,
+                _("Лучшая серия в пределах цели: {days} дн. (с {start})").format(
+                    days=length, start=start
+                ),
+                transform=ax.transAxes,
+                va="top",
+                fontsize=8,
+            )
+
     def show_error(self, title: str, message: str):
         logger.error(f"{title}: {message}")
         self.error_message(title, message)
@@ -0,0 +1,513 @@
+import argparse
+import gzip
+import json
+import logging
+import lzma
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+from typing import IO
+
+from instrumentation import timed
+from journal_index import (
+    JournalIndex,
+    from_micros,
+    has_timestamp,
+    positions_in_range,
+    to_micros,
+)
+
+try:  # Python 3.14+
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+PARTITION_SUFFIX = ".jsonl"
+MANIFEST_VERSION = 1
+
+# Расширения файлов месяцев и функции открытия. Закрытые месяцы
+# архивируются сжатием; чтение выбирает кодек по расширению файла.
+CODECS: dict[str, Callable[..., IO]] = {
+    PARTITION_SUFFIX: open,
+    PARTITION_SUFFIX + ".gz": gzip.open,
+    PARTITION_SUFFIX + ".xz": lzma.open,
+}
+if zstd is not None:
+    CODECS[PARTITION_SUFFIX + ".zst"] = zstd.open
+
+ARCHIVE_CODECS = {"zstd": ".zst", "gzip": ".gz", "lzma": ".xz"}
+DEFAULT_ARCHIVE_CODEC = "zstd" if zstd is not None else "gzip"
+
+
+def split_partition_name(file_name: str) -> tuple[str, str] | None:
+    """Разбирает имя файла месяца на ключ `ГГГГ-ММ` и расширение кодека."""
+    for suffix in sorted(CODECS, key=len, reverse=True):
+        if file_name.endswith(suffix):
+            return file_name[: -len(suffix)], suffix
+    return None
+
+
+def open_partition(file_path: str, mode: str = "rt") -> IO:
+    """Открывает файл месяца с учётом сжатия (текстовый или двоичный режим)."""
+    parsed = split_partition_name(os.path.basename(file_path))
+    opener = CODECS[parsed[1]] if parsed else open
+    if "b" in mode:
+        return opener(file_path, mode)
+    return opener(file_path, mode, encoding="utf-8")
+
+
+def is_plain(file_path: str) -> bool:
+    return file_path.endswith(PARTITION_SUFFIX)
+
+
+def dump_entry(entry: dict) -> str:
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+_journals: dict[str, "MealJournal"] = {}
+_journals_lock = threading.Lock()
+
+
+def get_journal(directory: str) -> "MealJournal":
+    """
+    Возвращает общий экземпляр журнала для каталога.
+
+    Журнал пишет калькулятор (через Factory) и читает StatsManager, в том
+    числе из фонового потока, поэтому на один каталог держим один объект
+    с общим манифестом и блокировкой.
+    """
+    key = os.path.abspath(directory)
+    with _journals_lock:
+        journal = _journals.get(key)
+        if journal is None:
+            journal = _journals[key] = MealJournal(key)
+        return journal
+
+
+class MealJournal:
+    """
+    Журнал приёмов пищи, разбитый на помесячные файлы JSON Lines.
+
+    Каждая запись — одна строка в файле `<каталог>/ГГГГ-ММ.jsonl`.
+    Небольшой `manifest.json` хранит список месяцев с количеством записей
+    и границами по времени, поэтому запрос за период открывает только
+    пересекающиеся с ним файлы, а добавление трогает только текущий месяц.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        self.lock = threading.RLock()
+        self.index = JournalIndex(directory)
+        self.partitions: dict[str, dict] = self._read_manifest()
+
+    # —— Manifest —— #
+
+    def _read_manifest(self) -> dict[str, dict]:
+        if not os.path.exists(self.manifest_path):
+            return self._rebuild_manifest()
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                return json.load(f).get("partitions", {})
+        except (OSError, ValueError, AttributeError) as e:
+            logger.error(f"Ошибка чтения манифеста {self.manifest_path}: {e}")
+            return self._rebuild_manifest()
+
+    def _rebuild_manifest(self) -> dict[str, dict]:
+        """Восстанавливает манифест по файлам месяцев, если он потерян или повреждён."""
+        partitions = {}
+        if not os.path.isdir(self.directory):
+            return partitions
+        for file_name in sorted(os.listdir(self.directory)):
+            parsed = split_partition_name(file_name)
+            if parsed is None:
+                continue
+            key = parsed[0]
+            for entry in self._iter_file(os.path.join(self.directory, file_name)):
+                self._account(partitions, key, entry, file_name)
+        self.partitions = partitions
+        self._write_manifest()
+        return partitions
+
+    def _write_manifest(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": MANIFEST_VERSION, "partitions": self.partitions},
+                f,
+                ensure_ascii=False,
+                indent=4,
+            )
+        os.replace(tmp_path, self.manifest_path)
+
+    @staticmethod
+    def _account(partitions: dict, key: str, entry: dict, file_name: str) -> None:
+        info = partitions.setdefault(
+            key, {"file": file_name, "count": 0, "first": None, "last": None}
+        )
+        timestamp = entry["timestamp"]
+        info["count"] += 1
+        if info["first"] is None or timestamp < info["first"]:
+            info["first"] = timestamp
+        if info["last"] is None or timestamp > info["last"]:
+            info["last"] = timestamp
+
+    # —— Keys & Paths —— #
+
+    @staticmethod
+    def partition_key(timestamp: str | datetime) -> str:
+        """Возвращает ключ месяца `ГГГГ-ММ` для временной метки."""
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        return timestamp.strftime("%Y-%m")
+
+    def partition_path(self, key: str) -> str:
+        info = self.partitions.get(key)
+        file_name = info["file"] if info else key + PARTITION_SUFFIX
+        return os.path.join(self.directory, file_name)
+
+    def keys_for_range(self, start: datetime | None, end: datetime | None) -> list[str]:
+        """
+        Возвращает месяцы из манифеста, пересекающиеся с периодом.
+        Граница None означает открытый конец периода.
+        """
+        first = self.partition_key(start) if start else ""
+        last = self.partition_key(end) if end else "9999-99"
+        with self.lock:
+            return [key for key in sorted(self.partitions) if first <= key <= last]
+
+    # —— Reading —— #
+
+    @staticmethod
+    def _iter_file(file_path: str) -> Iterator[dict]:
+        with open_partition(file_path) as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError as e:
+                    logger.error(f"Повреждённая строка {file_path}:{line_no}: {e}")
+                    continue
+                if not has_timestamp(entry):
+                    # Старая или правленая вручную строка не должна ломать
+                    # перестройку манифеста, перенос и сжатие месяца
+                    logger.warning(f"Строка без даты {file_path}:{line_no} пропущена")
+                    continue
+                yield entry
+
+    def iter_partition(self, key: str) -> Iterator[dict]:
+        file_path = self.partition_path(key)
+        if not os.path.exists(file_path):
+            return iter(())
+        return self._iter_file(file_path)
+
+    def iter_range(self, start: datetime, end: datetime) -> Iterator[dict]:
+        """Отдаёт записи только из файлов месяцев, пересекающихся с периодом."""
+        for key in self.keys_for_range(start, end):
+            yield from self.iter_partition(key)
+
+    def _index_columns(self, key: str):
+        with self.lock:
+            expected = self.partitions[key]["count"]
+            if self.index.count(key) != expected:
+                with open_partition(self.partition_path(key), "rb") as f:
+                    self.index.rebuild(key, f)
+            return self.index.load(key)
+
+    def totals_range(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> list[dict]:
+        """
+        Возвращает облегчённые записи периода по двоичному индексу.
+
+        Каждая запись — `{"timestamp", "total", "partition", "offset"}` без
+        состава блюда; полная запись читается через `read_entry`.
+        JSON файлов месяцев при этом не разбирается.
+        """
+        low = to_micros(start) if start else float("-inf")
+        high = to_micros(end) if end else float("inf")
+        result = []
+        for key in self.keys_for_range(start, end):
+            stamps, totals, offsets = self._index_columns(key)
+            for i in positions_in_range(stamps, low, high):
+                result.append(
+                    {
+                        "timestamp": from_micros(stamps[i]).isoformat(),
+                        "total": float(totals[i]),
+                        "partition": key,
+                        "offset": int(offsets[i]),
+                    }
+                )
+        return result
+
+    def read_entry(self, key: str, offset: int) -> dict:
+        """Читает одну полную запись месяца по смещению из индекса."""
+        with open_partition(self.partition_path(key), "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def read_all(self) -> list[dict]:
+        with self.lock:
+            keys = sorted(self.partitions)
+        return [entry for key in keys for entry in self.iter_partition(key)]
+
+    # —— Writing —— #
+
+    def append(self, entry: dict) -> None:
+        """Дописывает запись в файл её месяца и обновляет манифест."""
+        self.append_many([entry])
+
+    @timed("journal.append")
+    def append_many(self, entries: Iterable[dict]) -> None:
+        grouped: dict[str, list[dict]] = {}
+        for entry in entries:
+            grouped.setdefault(self.partition_key(entry["timestamp"]), []).append(entry)
+        if not grouped:
+            return
+
+        with self.lock:
+            os.makedirs(self.directory, exist_ok=True)
+            for key, items in grouped.items():
+                file_name = key + PARTITION_SUFFIX
+                file_path = self.partition_path(key)
+                offset = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+                records = []
+                # Пишем байты, а не текст: смещения в индексе должны совпадать
+                # с файлом (без перевода строк Windows). Дописывание в сжатый
+                # месяц добавляет к файлу новый кадр, что допустимо для gzip,
+                # xz и zstd.
+                with open_partition(file_path, "ab") as f:
+                    for entry in items:
+                        line = dump_entry(entry).encode("utf-8")
+                        f.write(line)
+                        records.append((entry, offset))
+                        offset += len(line)
+                        self._account(self.partitions, key, entry, file_name)
+                if is_plain(file_path):
+                    self.index.append(key, records)
+                else:
+                    self.index.discard(key)  # смещения в сжатом потоке неизвестны
+            self._write_manifest()
+
+    def migrate_legacy(self, legacy_file: str) -> int:
+        """
+        Переносит записи из старого единого `meals.json` в файлы месяцев.
+
+        После переноса исходный файл переименовывается в `*.migrated`,
+        поэтому повторный вызов ничего не делает.
+
+        Returns:
+            int: Количество перенесённых записей.
+        """
+        if not legacy_file or not os.path.exists(legacy_file):
+            return 0
+        try:
+            with open(legacy_file, encoding="utf-8") as f:
+                legacy = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Ошибка при загрузке: {e}")
+            return 0
+
+        entries = []
+        for entry in legacy if isinstance(legacy, list) else []:
+            try:
+                self.partition_key(entry["timestamp"])
+            except (KeyError, TypeError, ValueError):
+                logger.error(f"Пропущена запись без корректной даты: {entry}")
+                continue
+            entries.append(entry)
+
+        with self.lock:
+            self._merge_sorted(entries)
+            os.replace(legacy_file, legacy_file + ".migrated")
+        logger.info(f"Перенесено записей из {legacy_file}: {len(entries)}")
+        return len(entries)
+
+    def _merge_sorted(self, entries: list[dict]) -> None:
+        """
+        Вливает записи в месяцы, сохраняя хронологический порядок файлов.
+
+        Каждый месяц сначала целиком пишется во временный файл; файлы
+        подменяются через `os.replace` только когда записаны все, поэтому
+        сбой посреди слияния не оставляет журнал без уже хранившихся записей.
+        """
+        grouped: dict[str, list[dict]] = {}
+        for entry in entries:
+            grouped.setdefault(self.partition_key(entry["timestamp"]), []).append(entry)
+
+        os.makedirs(self.directory, exist_ok=True)
+        pending = []  # (месяц, старый путь, временный, итоговый, записи, индекс)
+        try:
+            for key, items in grouped.items():
+                old_path = self.partition_path(key)
+                suffix = split_partition_name(os.path.basename(old_path))[1]
+                merged = sorted(
+                    [*self.iter_partition(key), *items], key=lambda e: e["timestamp"]
+                )
+                tmp_path, new_path, records = self._write_temp(key, merged, suffix)
+                pending.append((key, old_path, tmp_path, new_path, merged, records))
+        except BaseException:
+            for item in pending:
+                os.remove(item[2])
+            raise
+
+        for key, _old_path, tmp_path, new_path, merged, records in pending:
+            os.replace(tmp_path, new_path)
+            self.index.write(key, records)
+            file_name = os.path.basename(new_path)
+            info = {"file": file_name, "count": 0, "first": None, "last": None}
+            self.partitions[key] = info
+            for entry in merged:
+                self._account(self.partitions, key, entry, file_name)
+        # Старые файлы удаляются, только когда все месяцы уже подменены
+        for _key, old_path, _tmp_path, new_path, _merged, _records in pending:
+            if os.path.exists(old_path) and old_path != new_path:
+                os.remove(old_path)
+        self._write_manifest()
+
+    def _write_temp(
+        self, key: str, entries: list[dict], suffix: str
+    ) -> tuple[str, str, list[tuple[dict, int]]]:
+        """
+        Пишет записи месяца во временный файл рядом с итоговым.
+
+        Returns:
+            tuple: Путь временного файла, итоговый путь и записи индекса
+                (запись, смещение строки).
+        """
+        new_path = os.path.join(self.directory, key + suffix)
+        tmp_path = new_path + ".tmp"
+        records = []
+        offset = 0
+        try:
+            with CODECS[suffix](tmp_path, "wb") as f:
+                for entry in entries:
+                    line = dump_entry(entry).encode("utf-8")
+                    f.write(line)
+                    records.append((entry, offset))
+                    offset += len(line)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return tmp_path, new_path, records
+
+    # —— Maintenance —— #
+
+    def closed_keys(self, now: datetime | None = None) -> list[str]:
+        """Возвращает месяцы до текущего — в них больше не пишут."""
+        current = self.partition_key(now or datetime.now())
+        with self.lock:
+            return [key for key in sorted(self.partitions) if key < current]
+
+    def compact(self, key: str, suffix: str | None = None) -> str:
+        """
+        Переписывает месяц компактно: без отступов и повреждённых строк,
+        в хронологическом порядке, при необходимости со сменой кодека.
+
+        Args:
+            key (str): Месяц `ГГГГ-ММ`.
+            suffix (str, optional): Расширение нового файла из CODECS.
+                По умолчанию сохраняется текущее.
+
+        Returns:
+            str: Имя нового файла месяца.
+        """
+        with self.lock:
+            if key not in self.partitions:
+                raise ValueError(f"Ошибка: Месяц {key} отсутствует в журнале.")
+            old_path = self.partition_path(key)
+            suffix = suffix or split_partition_name(os.path.basename(old_path))[1]
+            if suffix not in CODECS:
+                raise ValueError(f"Ошибка: Неподдерживаемый формат {suffix}.")
+
+            entries = sorted(
+                self.iter_partition(key), key=lambda e: e.get("timestamp", "")
+            )
+            tmp_path, new_path, records = self._write_temp(key, entries, suffix)
+            file_name = os.path.basename(new_path)
+            os.replace(tmp_path, new_path)
+            self.index.write(key, records)
+            if os.path.exists(old_path) and old_path != new_path:
+                os.remove(old_path)
+
+            info = {"file": file_name, "count": 0, "first": None, "last": None}
+            self.partitions[key] = info
+            for entry in entries:
+                self._account(self.partitions, key, entry, file_name)
+            self._write_manifest()
+            return file_name
+
+    def archive_closed(
+        self, codec: str = DEFAULT_ARCHIVE_CODEC, now: datetime | None = None
+    ) -> list[str]:
+        """
+        Сжимает все закрытые месяцы, которые ещё хранятся без сжатия.
+
+        Args:
+            codec (str): "zstd" (Python 3.14+), "gzip" или "lzma".
+
+        Returns:
+            list[str]: Ключи заархивированных месяцев.
+        """
+        suffix = PARTITION_SUFFIX + ARCHIVE_CODECS.get(codec, "")
+        if suffix not in CODECS or suffix == PARTITION_SUFFIX:
+            raise ValueError(f"Ошибка: Кодек {codec} недоступен.")
+
+        archived = []
+        for key in self.closed_keys(now):
+            if self.partitions[key]["file"] == key + PARTITION_SUFFIX:
+                self.compact(key, suffix)
+                archived.append(key)
+        if archived:
+            logger.info(f"Заархивированы месяцы журнала: {', '.join(archived)}")
+        return archived
+
+    def clear(self) -> None:
+        """Удаляет все файлы месяцев и очищает манифест."""
+        with self.lock:
+            for key in list(self.partitions):
+                file_path = self.partition_path(key)
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                self.index.discard(key)
+            self.partitions = {}
+            self._write_manifest()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Команда обслуживания журнала: `python src/meal_journal.py archive`."""
+    default_dir = os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "data", "meals")
+    )
+    parser = argparse.ArgumentParser(description="Обслуживание журнала приёмов пищи")
+    parser.add_argument("command", choices=["archive", "compact"])
+    parser.add_argument("--dir", default=default_dir, help="Каталог журнала")
+    parser.add_argument(
+        "--codec",
+        default=DEFAULT_ARCHIVE_CODEC,
+        choices=[
+            c for c, ext in ARCHIVE_CODECS.items() if PARTITION_SUFFIX + ext in CODECS
+        ],
+    )
+    args = parser.parse_args(argv)
+
+    journal = MealJournal(args.dir)
+    if args.command == "archive":
+        archived = journal.archive_closed(args.codec)
+        print(f"Заархивировано месяцев: {len(archived)}")
+    else:
+        for key in sorted(journal.partitions):
+            journal.compact(key)
+        print(f"Уплотнено месяцев: {len(journal.partitions)}")
+
+
+if __name__ == "__main__":
+    main()
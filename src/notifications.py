@@ -0,0 +1,142 @@
+import logging
+import tkinter as tk
+from collections.abc import Hashable
+
+logger = logging.getLogger(__name__)
+
+COALESCE_MS = 400  # одинаковые уведомления за это время сливаются в одно
+DISPLAY_MS = 3000  # сколько уведомление остаётся на экране
+
+
+class Notice:
+    __slots__ = ("title", "message", "summary", "count")
+
+    def __init__(self, title: str, message: str, summary: str | None = None):
+        self.title = title
+        self.message = message
+        self.summary = summary
+        self.count = 1
+
+    def text(self) -> str:
+        if self.count == 1:
+            return self.message
+        if self.summary:
+            return self.summary.format(count=self.count)
+        return f"{self.message} (×{self.count})"
+
+
+class Notifier:
+    """
+    Немодальные уведомления вместо `messagebox.showinfo` для частых событий.
+
+    Уведомления копятся в очереди и раз в `COALESCE_MS` показываются одним
+    всплывающим окном в углу экрана, которое само закрывается через
+    `DISPLAY_MS`. Повторы с одним ключом сливаются: десять сохранений подряд
+    дают одно «Продукты сохранены: 10», и пакетные операции не ждут закрытия
+    диалога после каждого шага. До `attach` (окна ещё нет) уведомления ждут в
+    очереди. Вызывать из главного потока Tk.
+    """
+
+    def __init__(self, delay_ms: int = COALESCE_MS, duration_ms: int = DISPLAY_MS):
+        self.delay_ms = delay_ms
+        self.duration_ms = duration_ms
+        self.root: tk.Misc | None = None
+        self.pending: dict[Hashable, Notice] = {}
+        self.toast: tk.Toplevel | None = None
+        self.label: tk.Label | None = None
+        self._flush_id = None
+        self._hide_id = None
+
+    def attach(self, root: tk.Misc) -> None:
+        """Привязывает очередь к циклу событий окна и показывает накопленное."""
+        self.root = root
+        self.toast = self.label = None
+        self._flush_id = self._hide_id = None
+        self._schedule()
+
+    def notify(
+        self,
+        title: str,
+        message: str,
+        key: Hashable | None = None,
+        summary: str | None = None,
+    ) -> None:
+        """
+        Ставит уведомление в очередь.
+
+        Args:
+            title (str): Заголовок.
+            message (str): Текст одиночного уведомления.
+            key (Hashable, optional): Ключ слияния; по умолчанию — сам текст.
+            summary (str, optional): Текст для нескольких слитых уведомлений
+                с полем `{count}`, например «Продукты сохранены: {count}».
+        """
+        logger.info(f"{title}: {message}")
+        key = (title, message) if key is None else key
+        notice = self.pending.get(key)
+        if notice is None:
+            self.pending[key] = Notice(title, message, summary)
+        else:
+            notice.count += 1
+            notice.message = message
+        self._schedule()
+
+    def __call__(self, title: str, message: str) -> None:
+        """Совместимость с обработчиками вида `info_message(title, message)`."""
+        self.notify(title, message)
+
+    def _schedule(self) -> None:
+        if self.root is None or self._flush_id is not None or not self.pending:
+            return
+        try:
+            self._flush_id = self.root.after(self.delay_ms, self.flush)
+        except tk.TclError:
+            self.root = None  # окно закрыто: ждём следующего attach
+
+    def flush(self) -> None:
+        """Показывает все накопленные уведомления одним окном."""
+        self._flush_id = None
+        if not self.pending:
+            return
+        notices = list(self.pending.values())
+        self.pending.clear()
+        lines = [f"{notice.title}: {notice.text()}" for notice in notices]
+        try:
+            self.show("\n".join(lines))
+        except tk.TclError as e:
+            logger.warning(f"Не удалось показать уведомление: {e}")
+
+    def show(self, text: str) -> None:
+        if self.toast is None or not self.toast.winfo_exists():
+            self.toast = tk.Toplevel(self.root)
+            self.toast.overrideredirect(True)
+            self.toast.attributes("-topmost", True)
+            self.label = tk.Label(
+                self.toast,
+                justify="left",
+                padx=12,
+                pady=8,
+                background="#333333",
+                foreground="#ffffff",
+            )
+            self.label.pack()
+        self.label.configure(text=text)
+        self.toast.update_idletasks()
+        x = self.toast.winfo_screenwidth() - self.toast.winfo_reqwidth() - 24
+        y = self.toast.winfo_screenheight() - self.toast.winfo_reqheight() - 64
+        self.toast.geometry(f"+{x}+{y}")
+        self.toast.deiconify()
+        self.toast.lift()
+
+        if self._hide_id is not None:
+            self.root.after_cancel(self._hide_id)
+        self._hide_id = self.root.after(self.duration_ms, self.hide)
+
+    def hide(self) -> None:
+        self._hide_id = None
+        if self.toast is not None and self.toast.winfo_exists():
+            self.toast.withdraw()
+
+
+# Общая очередь приложения; MainController.run привязывает её к главному окну
+notifier = Notifier()
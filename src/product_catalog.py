@@ -0,0 +1,179 @@
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import ItemsView, Iterator, Mapping, MutableMapping, ValuesView
+from itertools import islice
+
+
+def _number(kcal: float) -> float | int:
+    """Калорийность как в JSON: целые значения — int («52», а не «52.0»)."""
+    return int(kcal) if kcal.is_integer() else kcal
+
+
+class _Items(ItemsView):
+    def __iter__(self):
+        mapping = self._mapping
+        return zip(mapping._names, map(_number, mapping._kcal), strict=True)
+
+
+class _Values(ValuesView):
+    def __iter__(self):
+        return map(_number, self._mapping._kcal)
+
+
+class ProductCatalog(MutableMapping):
+    """
+    Каталог продуктов «название -> калорийность на 100 г» с интерфейсом dict.
+
+    Названия хранятся интернированными строками в порядке файла, а
+    калорийность — в плотном массиве `array('d')` без объекта float на каждый
+    продукт; наружу целые значения отдаются как int, как их прочитал бы JSON.
+    Точный поиск идёт по словарю «название -> позиция», подсказки и `find()`
+    — по массиву позиций, отсортированному по `casefold()`. Оба индекса
+    строятся при первом обращении, поэтому загрузка каталога их не ждёт.
+
+    Счётчик `version` растёт при каждом изменении: производные кэши (списки
+    для виджетов, подсказки) сверяются с ним вместо сравнения содержимого.
+    """
+
+    __slots__ = ("_names", "_kcal", "_positions", "_folded", "version")
+
+    def __init__(self, products: Mapping[str, float] | None = None):
+        """
+        Args:
+            products (Mapping[str, float], optional): Исходные данные,
+                например словарь из products_*.json.
+        """
+        if products is not None and not isinstance(products, Mapping):
+            raise ValueError("Ошибка: Список продуктов поврежден.")
+        self._names: list[str] = []
+        self._kcal = array("d")
+        self._positions: dict[str, int] | None = None
+        self._folded: array | None = None
+        self.version = 0
+        for name, kcal in (products or {}).items():
+            self._names.append(sys.intern(name))
+            self._kcal.append(kcal)
+
+    # —— Indexes —— #
+
+    def _position_index(self) -> dict[str, int]:
+        if self._positions is None:
+            self._positions = {name: i for i, name in enumerate(self._names)}
+        return self._positions
+
+    def _folded_index(self) -> array:
+        if self._folded is None:
+            names = self._names
+            order = sorted(range(len(names)), key=lambda i: names[i].casefold())
+            self._folded = array("I", order)
+        return self._folded
+
+    def _position(self, name: object) -> int:
+        """Позиция продукта в каталоге или -1, если его нет."""
+        if not isinstance(name, str):
+            return -1
+        return self._position_index().get(name, -1)
+
+    # —— Mapping —— #
+
+    def __getitem__(self, name: str) -> float | int:
+        position = self._position(name)
+        if position < 0:
+            raise KeyError(name)
+        return _number(self._kcal[position])
+
+    def __setitem__(self, name: str, kcal: float) -> None:
+        if not isinstance(name, str):
+            raise ValueError("Ошибка: Наименование продукта должно быть строкой.")
+        position = self._position(name)
+        if position >= 0:
+            self._kcal[position] = kcal
+        else:
+            self._kcal.append(kcal)  # до добавления названия: float() может упасть
+            self._names.append(sys.intern(name))
+            self._positions[self._names[-1]] = len(self._names) - 1
+            self._folded = None
+        self.version += 1
+
+    def __delitem__(self, name: str) -> None:
+        position = self._position(name)
+        if position < 0:
+            raise KeyError(name)
+        positions = self._positions
+        del positions[self._names[position]]
+        del self._names[position]
+        del self._kcal[position]
+        for i, shifted in enumerate(self._names[position:], position):
+            positions[shifted] = i
+        self._folded = None
+        self.version += 1
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return self._position(name) >= 0
+
+    def items(self) -> ItemsView:
+        return _Items(self)
+
+    def values(self) -> ValuesView:
+        return _Values(self)
+
+    def clear(self) -> None:
+        self._names.clear()
+        del self._kcal[:]
+        self._positions = self._folded = None
+        self.version += 1
+
+    def copy(self) -> "ProductCatalog":
+        return ProductCatalog(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} продуктов, version={self.version})"
+
+    # —— Search —— #
+
+    def find(self, name: str) -> str | None:
+        """Название продукта из каталога, совпадающее с `name` без учёта регистра."""
+        names = self._names
+        folded = name.strip().casefold()
+        index = self._folded_index()
+        slot = bisect_left(index, folded, key=lambda i: names[i].casefold())
+        if slot < len(index) and names[index[slot]].casefold() == folded:
+            return names[index[slot]]
+        return None
+
+    def complete(self, text: str, limit: int = 0) -> list[str]:
+        """
+        Названия, начинающиеся с `text` без учёта регистра, по алфавиту.
+
+        Args:
+            text (str): Введённый текст.
+            limit (int): Максимум подсказок (0 — без ограничения).
+        """
+        prefix = text.strip().casefold()
+        names = self._names
+        index = self._folded_index()
+        if not prefix:
+            return [names[i] for i in islice(index, limit or None)]
+        slot = bisect_left(index, prefix, key=lambda i: names[i].casefold())
+        found = []
+        for i in range(slot, len(index)):
+            name = names[index[i]]
+            if not name.casefold().startswith(prefix):
+                break
+            found.append(name)
+            if len(found) == limit:
+                break
+        return found
+
+    # —— Export —— #
+
+    def to_dict(self) -> dict[str, float | int]:
+        """Обычный словарь для записи в JSON; целые значения остаются целыми."""
+        return dict(self.items())
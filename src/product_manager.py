@@ -8,6 +8,12 @@ from data_defaults import DataDefaults
 
 # from gettext import gettext as _
 from gui_factory import Factory, WidgetBuilder, handle_gui_error
+from instrumentation import timed
+from notifications import notifier
+from product_catalog import ProductCatalog
+from product_rows import ProductRow, ProductRows
+from translations import ui
+from window_pool import WindowPool
 
 logger = logging.getLogger(__name__)
 SUPPORTED_LANGUAGES = {"ru", "en"}
@@ -33,11 +39,14 @@ class ProductManagerGUI:
         self.factory = context.factory
         self.settings = context.settings
 
-        self.setup = Autocomplete()
+        self.setup = Autocomplete(limit=self.settings.AUTOCOMPLETE_LIMIT)
+        self.windows = WindowPool()
 
         self.log = logger.error
         self.info_message = info_message or messagebox.showinfo
         self.error_message = error_message or messagebox.showerror
+        # Частые подтверждения (сохранения) — немодальные и сливаются
+        self.notify = notifier.notify
 
     @handle_gui_error("Ошибка")
     def root_for_window(self, window: tk.Toplevel, tag: str):
@@ -58,25 +67,31 @@ class ProductManagerGUI:
 
     @handle_gui_error("Ошибка")
     def open_add_products_window(self, root: tk.Tk | tk.Toplevel = None):
+        self.windows.show("add", root, lambda: self._build_add_products_window(root))
+
+    def _build_add_products_window(self, root: tk.Tk | tk.Toplevel):
         self.factory.window_status(root, "hide")
         win = self.factory.create_widgets(
-            cls=tk.Toplevel, title=_("Добавить продукт"), size="300x150"
+            cls=tk.Toplevel, title=ui("Добавить продукт"), size="300x150"
         )
         win.protocol(
-            "WM_DELETE_WINDOW", lambda: self.factory.on_close(root=root, window=win)
+            "WM_DELETE_WINDOW",
+            lambda: self.factory.on_close(
+                root=self.windows.parent(win, root), window=win
+            ),
         )
         frame = self.builder.create_frame(window=win, grid={**self.settings.frame_grid})
 
         self.builder.create_label(
             frame,
-            text=_("Название продукта:"),
-            style={**self.settings.font_10},
+            text=ui("Название продукта:"),
+            style=self.settings.body,
             grid={**self.settings.label_grid},
         )
         self.builder.create_label(
             frame,
-            text=_("Калорийность:"),
-            style={**self.settings.font_10},
+            text=ui("Калорийность:"),
+            style=self.settings.body,
             grid={**self.settings.label_grid, "row": 1},
         )
 
@@ -88,13 +103,11 @@ class ProductManagerGUI:
         def submit():
             name = entry_name.get().strip()
             if name in self.products:
-                self.info_message(_("Внимание"), _("Такой продукт уже существует."))
+                self.info_message(ui("Внимание"), _("Такой продукт уже существует."))
                 return
             if not name:
                 self.error_message(
-                    _(
-                        "Ошибка",
-                    ),
+                    ui("Ошибка"),
                     _("Поле продукта не может быть пустым."),
                 )
                 return
@@ -103,49 +116,56 @@ class ProductManagerGUI:
             if is_valid:
                 self.update_product_data(name, kcal_value)
                 self.info_message(
-                    _("Успех"),
+                    ui("Успех"),
                     _("Добавлен {n} с калорийностью {kcal}.").format(
                         n=name, kcal=kcal_value
                     ),
                 )
             else:
-                self.error_message(_("Внимание"), _("Неверный формат калорийности."))
+                self.error_message(ui("Внимание"), _("Неверный формат калорийности."))
                 return
 
         self.builder.create_button(
             frame,
-            text=_("Сохранить"),
+            text=ui("Сохранить"),
             command=submit,
-            style={**self.settings.font_12, **self.settings.green},
+            style=self.settings.success,
             grid={**self.settings.button_grid, "row": 2},
         )
         self.builder.create_button(
             frame,
-            text=_("Назад"),
-            command=lambda: self.factory.restore_root_window(root=root, window=win),
-            style={**self.settings.font_12, **self.settings.red},
+            text=ui("Назад"),
+            command=lambda: self.windows.back(win, root),
+            style=self.settings.danger,
             grid={**self.settings.button_grid, "row": 2, "column": 1},
         )
 
         for i in range(2):
             win.grid_rowconfigure(i, weight=1)
             win.grid_columnconfigure(i, weight=1)
+        return win
 
     @handle_gui_error("Ошибка")
     def open_del_products_window(self, root: tk.Tk | tk.Toplevel = None):
+        self.windows.show("del", root, lambda: self._build_del_products_window(root))
+
+    def _build_del_products_window(self, root: tk.Tk | tk.Toplevel):
         self.factory.window_status(root, "hide")
         win = self.factory.create_widgets(
-            cls=tk.Toplevel, title=_("Удалить продукт"), size="400x350"
+            cls=tk.Toplevel, title=ui("Удалить продукт"), size="400x350"
         )
         win.protocol(
-            "WM_DELETE_WINDOW", lambda: self.factory.on_close(root=root, window=win)
+            "WM_DELETE_WINDOW",
+            lambda: self.factory.on_close(
+                root=self.windows.parent(win, root), window=win
+            ),
         )
         frame = self.builder.create_frame(window=win, grid={**self.settings.frame_grid})
 
         self.builder.create_label(
             frame,
-            text=_("Продукт для удаления:"),
-            style={**self.settings.font_10},
+            text=ui("Продукт для удаления:"),
+            style=self.settings.body,
             grid={**self.settings.label_grid},
         )
         entry = self.builder.create_entry(frame, grid={**self.settings.entry_grid})
@@ -161,17 +181,17 @@ class ProductManagerGUI:
         def delete():
             name = entry.get().strip()
             if not name:
-                self.error_message(_("Ошибка"), _("Введите название продукта."))
+                self.error_message(ui("Ошибка"), _("Введите название продукта."))
                 return
             elif name in self.products:
                 del self.products[name]
                 self._save_products(self.language)
                 self.info_message(
-                    _("Успех"), _("Продукт {name} удалён.").format(name=name)
+                    ui("Успех"), _("Продукт {name} удалён.").format(name=name)
                 )
             else:
                 self.error_message(
-                    _("Ошибка"), _("Продукт {name} не найден.").format(name=name)
+                    ui("Ошибка"), _("Продукт {name} не найден.").format(name=name)
                 )
 
         btn_frame = self.builder.create_frame(
@@ -179,16 +199,16 @@ class ProductManagerGUI:
         )
         self.builder.create_button(
             btn_frame,
-            text=_("Удалить"),
+            text=ui("Удалить"),
             command=delete,
-            style={**self.settings.font_12, **self.settings.red},
+            style=self.settings.danger,
             grid={**self.settings.listbox_button},
         )
         self.builder.create_button(
             btn_frame,
-            text=_("Назад"),
-            command=lambda: self.factory.restore_root_window(root=root, window=win),
-            style={**self.settings.font_12, **self.settings.blue},
+            text=ui("Назад"),
+            command=lambda: self.windows.back(win, root),
+            style=self.settings.info,
             grid={**self.settings.listbox_button_second},
         )
 
@@ -197,28 +217,37 @@ class ProductManagerGUI:
         btn_frame.grid_rowconfigure(0, weight=1)
         btn_frame.grid_columnconfigure(0, weight=2)
         btn_frame.grid_columnconfigure(1, weight=1)
+        return win
 
     @handle_gui_error("Ошибка")
     def open_change_products_window(self, root: tk.Tk | tk.Toplevel = None):
+        self.windows.show(
+            "change", root, lambda: self._build_change_products_window(root)
+        )
+
+    def _build_change_products_window(self, root: tk.Tk | tk.Toplevel):
         self.factory.window_status(root, "hide")
         win = self.factory.create_widgets(
-            cls=tk.Toplevel, title=_("Изменить калорийность"), size="400x350"
+            cls=tk.Toplevel, title=ui("Изменить калорийность"), size="400x350"
         )
         win.protocol(
-            "WM_DELETE_WINDOW", lambda: self.factory.on_close(root=root, window=win)
+            "WM_DELETE_WINDOW",
+            lambda: self.factory.on_close(
+                root=self.windows.parent(win, root), window=win
+            ),
         )
         frame = self.builder.create_frame(window=win, grid={**self.settings.frame_grid})
 
         self.builder.create_label(
             frame,
-            text=_("Продукт:"),
-            style={**self.settings.font_10},
+            text=ui("Продукт:"),
+            style=self.settings.body,
             grid={**self.settings.label_grid},
         )
         self.builder.create_label(
             frame,
-            text=_("Новая калорийность:"),
-            style={**self.settings.font_10},
+            text=ui("Новая калорийность:"),
+            style=self.settings.body,
             grid={**self.settings.label_grid, "row": 1},
         )
 
@@ -240,21 +269,21 @@ class ProductManagerGUI:
         def update():
             name = entry_product.get().strip()
             if not name:
-                self.error_message(_("Ошибка"), _("Введите название продукта."))
+                self.error_message(ui("Ошибка"), _("Введите название продукта."))
                 return
             elif name not in self.products:
                 self.error_message(
-                    _("Ошибка"), _("Продукт {n} не найден.").format(n=name)
+                    ui("Ошибка"), _("Продукт {n} не найден.").format(n=name)
                 )
             kcal = entry_kcal.get()
             if not kcal:
-                self.error_message(_("Ошибка"), _("Введите калории для продукта."))
+                self.error_message(ui("Ошибка"), _("Введите калории для продукта."))
                 return
             is_valid, kcal_value = self.validate_product_input(name, kcal)
             if is_valid:
                 self.update_product_data(name, kcal_value)
                 self.info_message(
-                    _("Успех"), _("Калорийность {n} обновлена.").format(n=name)
+                    ui("Успех"), _("Калорийность {n} обновлена.").format(n=name)
                 )
 
         btn_frame = self.builder.create_frame(
@@ -262,16 +291,16 @@ class ProductManagerGUI:
         )
         self.builder.create_button(
             btn_frame,
-            text=_("Изменить"),
+            text=ui("Изменить"),
             command=update,
-            style={**self.settings.font_12, **self.settings.green},
+            style=self.settings.success,
             grid={**self.settings.listbox_button, "row": 3},
         )
         self.builder.create_button(
             btn_frame,
-            text=_("Назад"),
-            command=lambda: self.factory.restore_root_window(root=root, window=win),
-            style={**self.settings.font_12, **self.settings.red},
+            text=ui("Назад"),
+            command=lambda: self.windows.back(win, root),
+            style=self.settings.danger,
             grid={**self.settings.listbox_button_second, "row": 3},
         )
 
@@ -281,12 +310,36 @@ class ProductManagerGUI:
         win.grid_columnconfigure(1, weight=1)
         for i in range(1):
             btn_frame.grid_columnconfigure(i, weight=1)
+        return win
 
 
 class ProductManager(ProductManagerGUI):
     def __init__(self, context: ProductContext, info_message=None, error_message=None):
         super().__init__(context, [], info_message, error_message)
         self.products = self._load_products_internal(context.language)
+        # Загруженные каталоги по языкам: повторное переключение без чтения файла
+        self.catalogs = {context.language: self.products}
+
+    @handle_gui_error("Ошибка")
+    def switch_language(self, language: str) -> dict:
+        """
+        Делает активным каталог продуктов другого языка.
+        :param language: код языка нового каталога
+        :return: каталог продуктов, ставший активным
+        """
+        if language not in SUPPORTED_LANGUAGES:
+            raise ValueError("Ошибка: Указанный перевод не доступен.")
+
+        self.catalogs[self.language] = self.products
+        products = self.catalogs.get(language)
+        if products is None:
+            products = self._load_products_internal(language)
+            if products is None:
+                raise ValueError("Ошибка: Не удалось загрузить список продуктов.")
+            self.catalogs[language] = products
+        self.products = products
+        self.language = self.context.language = language
+        return products
 
     @handle_gui_error("Ошибка")
     def _save_products(self, language: str):
@@ -306,9 +359,15 @@ class ProductManager(ProductManagerGUI):
 
         file_path = file_paths.get(language)
         self.factory.read_and_write_file(file_path, "w", self.products)
-        self.info_message(_("Успех"), _("Продукты сохранены!"))
+        self.notify(
+            ui("Успех"),
+            _("Продукты сохранены!"),
+            key="products.saved",
+            summary=_("Продукты сохранены: {count}"),
+        )
 
     @handle_gui_error("Ошибка")
+    @timed("catalog.load")
     def _load_products_internal(self, language: str):
         """
         Функция загружает список продуктов из файла
@@ -327,8 +386,10 @@ class ProductManager(ProductManagerGUI):
 
         file_path = file_paths.get(language)
         if not os.path.exists(file_path):
-            return self.settings.ensure_file_with_defaults(language)
-        return self.factory.read_and_write_file(file_path, "r")
+            products = self.settings.ensure_file_with_defaults(language)
+        else:
+            products = self.factory.read_and_write_file(file_path, "r")
+        return None if products is None else ProductCatalog(products)
 
     @handle_gui_error("Ошибка")
     def validate_product_input(self, name: str, kcal: str) -> tuple[bool, float | None]:
@@ -339,13 +400,13 @@ class ProductManager(ProductManagerGUI):
         :return: возвращаем True и float(kcal) если данные переданы правильно. Иначе False, None
         """
         if not name or not kcal:
-            self.error_message(_("Ошибка"), _("Название и калорийность обязательны."))
+            self.error_message(ui("Ошибка"), _("Название и калорийность обязательны."))
             return False, None
         try:
             return True, float(kcal)
         except ValueError:
             self.error_message(
-                _("Ошибка"),
+                ui("Ошибка"),
                 _("Калорийность {kcal} не является числом.").format(kcal=kcal),
             )
             return False, None
@@ -375,8 +436,11 @@ class ProductCalculator(ProductManagerGUI):
         self, context: ProductContext, products, info_message=None, error_message=None
     ):
         super().__init__(context, products, info_message, error_message)
+        self._names: list[str] = []
+        self._names_key = None
 
     @handle_gui_error("Ошибка")
+    @timed("calculator.total")
     def calculate_total(self, data):
         total = 0
         entries = []
@@ -401,11 +465,26 @@ class ProductCalculator(ProductManagerGUI):
         summary = "\n".join(f"{n} — {w}g — {c:.1f} kcal" for n, w, c in entries)
         summary += f"\n\nTOTAL: {total:.1f} kcal"
 
-        self.info_message(_("Результат"), summary)
-        self.factory.save_results(file_path=self.settings.MEALS_LIST, entries=entries)
+        self.info_message(ui("Результат"), summary)
+        self.factory.save_results(file_path=self.settings.MEALS_DIR, entries=entries)
+
+    def _product_names(self) -> list[str]:
+        """
+        Названия продуктов для выпадающих списков строк калькулятора.
+
+        Для `ProductCatalog` список строится один раз на версию каталога и
+        общий для всех строк; обычный словарь проверить на изменения нельзя,
+        поэтому для него список собирается заново.
+        """
+        version = getattr(self.products, "version", None)
+        key = (id(self.products), version)
+        if version is None or self._names_key != key:
+            self._names = list(self.products.keys())
+            self._names_key = key
+        return self._names
 
     @handle_gui_error("Ошибка")
-    def create_input_product_row(self, data, frame: tk.Frame):
+    def create_input_product_row(self, data: ProductRows, frame: tk.Frame):
         if data is None:
             raise ValueError("Ошибка: Отсутствуют данные или валидное окно.")
         if not isinstance(frame, tk.Frame):
@@ -413,38 +492,43 @@ class ProductCalculator(ProductManagerGUI):
         if self.products == {}:
             raise ValueError("Ошибка: Список продуктов пуст или поврежден.")
 
-        row_index = len(data)
+        names = self._product_names()
+        row = data.reuse()
+        if row is not None:
+            row.product_var.set(names[0])
+            row.weight_var.set("")
+            if row.names is not names:
+                row.widgets[0].configure(values=names)
+                row.names = names
+            return row.product_var, row.weight_var
 
-        product_var = tk.StringVar(value=list(self.products.keys())[0])
-        weight_var = tk.StringVar()
+        row_index = data.next_row
+        row = ProductRow(tk.StringVar(value=names[0]), tk.StringVar())
+        row.names = names
 
         box = self.builder.create_combobox(
             frame,
-            textvariable=product_var,
-            values=list(self.products.keys()),
+            textvariable=row.product_var,
+            values=names,
             style={**self.settings.combo_style},
             grid={**self.settings.combo_grid, "row": row_index},
         )
 
         entry = self.builder.create_entry(
             frame,
-            textvariable=weight_var,
+            textvariable=row.weight_var,
             style={**self.settings.font_10},
             grid={**self.settings.entry_grid, "row": row_index, "sticky": "ew"},
         )
 
-        def remove_row():
-            box.destroy()
-            entry.destroy()
-            btn.destroy()
-            data.remove((product_var, weight_var))
-
         btn = self.builder.create_button(
             frame,
-            text=_("Удалить"),
-            command=remove_row,
-            style={**self.settings.font_10_, **self.settings.red},
+            text=ui("Удалить"),
+            command=lambda: data.remove(row),
+            style=self.settings.danger_small,
             grid={**self.settings.button_grid_low, "row": row_index, "column": 2},
         )
 
-        return product_var, weight_var
+        row.widgets = (box, entry, btn)
+        data.add(row)
+        return row.product_var, row.weight_var
@@ -0,0 +1,116 @@
+import tkinter as tk
+from collections.abc import Iterator
+from itertools import count
+
+
+class ProductRow:
+    """Строка калькулятора: переменные ввода и её виджеты."""
+
+    __slots__ = ("key", "grid_row", "product_var", "weight_var", "widgets", "names")
+
+    def __init__(self, product_var: tk.StringVar, weight_var: tk.StringVar):
+        self.key = -1
+        self.grid_row = -1  # строка сетки, где сейчас виджеты (-1 — спрятаны)
+        self.product_var = product_var
+        self.weight_var = weight_var
+        self.widgets: tuple[tk.Widget, ...] = ()
+        self.names: list[str] | None = None  # список, переданный в combobox
+
+
+class ProductRows:
+    """
+    Строки калькулятора с переиспользованием виджетов.
+
+    Видимые строки лежат в словаре по ключу в порядке ввода: удаление —
+    `pop` за O(1), а соседние строки не перестраиваются (пустая строка
+    сетки не занимает места). Виджеты удалённой строки прячутся через
+    `grid_remove` и достаются следующей добавленной строке, поэтому длинный
+    приём пищи не пересоздаёт виджеты Tk.
+
+    Переиспользованные строки раскладываются не сразу: одна отложенная
+    раскладка (`after_idle`) на всю пачку сжимает номера строк сетки до
+    0..n-1 и вызывает `grid()` только у строк, сменивших место.
+
+    Итерация возвращает пары `(product_var, weight_var)`, как ожидает
+    `ProductCalculator.calculate_total`.
+    """
+
+    def __init__(self):
+        self._rows: dict[int, ProductRow] = {}
+        self._hidden: list[ProductRow] = []
+        self._keys = count()
+        self._next = 0
+        self._pending = False
+
+    def __iter__(self) -> Iterator[tuple[tk.StringVar, tk.StringVar]]:
+        for row in self._rows.values():
+            yield row.product_var, row.weight_var
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def next_row(self) -> int:
+        """Номер строки сетки для следующей добавленной строки."""
+        return self._next
+
+    @property
+    def hidden(self) -> int:
+        return len(self._hidden)
+
+    def _register(self, row: ProductRow) -> ProductRow:
+        row.key = next(self._keys)
+        self._next += 1
+        self._rows[row.key] = row
+        return row
+
+    def add(self, row: ProductRow) -> ProductRow:
+        """Регистрирует новую строку, уже размещённую в строке `next_row`."""
+        row.grid_row = self._next
+        return self._register(row)
+
+    def reuse(self) -> ProductRow | None:
+        """
+        Спрятанная строка, снова добавленная в конец (или None).
+
+        Виджеты появятся при ближайшей раскладке, см. `layout()`.
+        """
+        if not self._hidden:
+            return None
+        row = self._register(self._hidden.pop())
+        if not self._pending and row.widgets:
+            self._pending = True
+            row.widgets[0].after_idle(self.layout)
+        return row
+
+    def layout(self) -> None:
+        """Раскладывает видимые строки по строкам сетки 0..n-1 подряд."""
+        self._pending = False
+        try:
+            for index, row in enumerate(self._rows.values()):
+                if row.grid_row != index:
+                    for widget in row.widgets:
+                        widget.grid(row=index)
+                    row.grid_row = index
+        except tk.TclError:
+            return  # окно калькулятора закрыто до отложенной раскладки
+        self._next = len(self._rows)
+
+    def _hide(self, row: ProductRow) -> None:
+        for widget in row.widgets:
+            widget.grid_remove()
+        row.grid_row = -1
+        self._hidden.append(row)
+
+    def remove(self, row: ProductRow) -> None:
+        """Прячет строку и оставляет её виджеты для повторного использования."""
+        if self._rows.pop(row.key, None) is None:
+            return
+        self._hide(row)
+
+    def clear(self) -> None:
+        """Прячет все строки; нумерация сетки начинается заново."""
+        for row in reversed(self._rows.values()):
+            self._hide(row)
+        self._rows.clear()
+        self._next = 0
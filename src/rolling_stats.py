@@ -0,0 +1,122 @@
+import numpy as np
+
+# Все метрики считаются по непрерывному ряду дневных итогов: дни без записей
+# входят в ряд с нулём, поэтому окно в N элементов — это ровно N дней.
+# Серия «в пределах цели» такие дни не засчитывает: ноль там — заполнитель.
+
+
+def daily_totals(stats: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Сворачивает записи журнала в дневные итоги.
+
+    Args:
+        stats (list[dict]): Записи с ключами "timestamp" и "total" (полные
+            или облегчённые из индекса журнала).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Дни (`datetime64[D]`) от первого до
+            последнего дня без пропусков и сумма калорий за каждый день.
+    """
+    days, totals, _counts = _daily_series(stats)
+    return days, totals
+
+
+def _daily_series(stats: list[dict]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Как `daily_totals`, плюс число записей за каждый день (0 — пропуск)."""
+    days = np.array([entry["timestamp"][:10] for entry in stats], dtype="datetime64[D]")
+    totals = np.array([entry.get("total", 0.0) for entry in stats], dtype=float)
+    if not len(days):
+        return days, totals, np.zeros(0, dtype=int)
+
+    first = days.min()
+    positions = (days - first).astype(int)
+    sums = np.bincount(positions, weights=totals)
+    counts = np.bincount(positions, minlength=len(sums))
+    return first + np.arange(len(sums)), sums, counts
+
+
+def rolling_sum(totals: np.ndarray, window: int) -> np.ndarray:
+    """
+    Сумма за последние `window` дней для каждого дня.
+
+    В начале ряда, пока дней меньше окна, суммируются все доступные дни.
+    """
+    if window < 1:
+        raise ValueError(f"Ошибка: Некорректный размер окна: {window}")
+    cumulative = np.cumsum(totals, dtype=float)
+    result = cumulative.copy()
+    result[window:] -= cumulative[:-window]
+    return result
+
+
+def moving_average(totals: np.ndarray, window: int) -> np.ndarray:
+    """Скользящее среднее за `window` дней (в начале ряда — по доступным дням)."""
+    sums = rolling_sum(totals, window)
+    sizes = np.minimum(np.arange(1, len(totals) + 1), window)
+    return sums / sizes
+
+
+def deviation(totals: np.ndarray, target: float) -> np.ndarray:
+    """Отклонение дневного итога от цели: положительное — перебор."""
+    return np.asarray(totals, dtype=float) - target
+
+
+def longest_streak(
+    totals: np.ndarray, target: float, logged: np.ndarray | None = None
+) -> tuple[int, int]:
+    """
+    Самая длинная серия дней подряд с итогом не выше цели.
+
+    Args:
+        totals (np.ndarray): Дневные итоги.
+        target (float): Дневная цель по калориям.
+        logged (np.ndarray, optional): Маска дней, за которые есть записи;
+            день без записей (нулевой итог-заполнитель) прерывает серию.
+
+    Returns:
+        tuple[int, int]: Длина серии и индекс её первого дня
+            (0 и -1, если таких дней нет).
+    """
+    within = np.asarray(totals) <= target
+    if logged is not None:
+        within &= np.asarray(logged, dtype=bool)
+    under = np.concatenate(([False], within, [False]))
+    edges = np.flatnonzero(np.diff(under.astype(np.int8)))
+    if not len(edges):
+        return 0, -1
+    starts, ends = edges[0::2], edges[1::2]
+    lengths = ends - starts
+    best = int(np.argmax(lengths))
+    return int(lengths[best]), int(starts[best])
+
+
+def build_overlays(
+    stats: list[dict], window: int = 7, target: float | None = None
+) -> dict:
+    """
+    Считает дополнительные ряды для графика статистики.
+
+    Args:
+        stats (list[dict]): Записи журнала за период.
+        window (int): Размер окна скользящих метрик в днях.
+        target (float, optional): Дневная цель по калориям.
+
+    Returns:
+        dict: "dates" (строки ГГГГ-ММ-ДД), "daily", "average" и "sum" за окно;
+            при заданной цели также "target", "deviation" и "streak"
+            (длина, первый день).
+    """
+    days, totals, counts = _daily_series(stats)
+    overlays = {
+        "window": window,
+        "dates": [str(day) for day in days],
+        "daily": totals,
+        "average": moving_average(totals, window),
+        "sum": rolling_sum(totals, window),
+    }
+    if target is not None:
+        length, start = longest_streak(totals, target, logged=counts > 0)
+        overlays["target"] = target
+        overlays["deviation"] = deviation(totals, target)
+        overlays["streak"] = (length, str(days[start]) if length else None)
+    return overlays
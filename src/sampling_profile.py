@@ -0,0 +1,188 @@
+import atexit
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType
+
+logger = logging.getLogger(__name__)
+
+ENV_VAR = "MEALS_SAMPLING"  # интервал опроса, мс; "0" — выключить (сильнее конфига)
+ENV_OUTPUT = "MEALS_SAMPLING_OUTPUT"  # путь к файлу свёрнутых стеков
+DEFAULT_OUTPUT = "logs/sampling.folded"
+TOP = 10  # горячих функций в сводке в логе
+
+
+def frame_label(code: CodeType) -> str:
+    """Подпись кадра во флеймграфе: `файл.py:функция`."""
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """
+    Сэмплирующий профилировщик всего приложения.
+
+    Фоновый поток раз в `interval_ms` снимает стеки всех потоков через
+    `sys._current_frames()` и считает одинаковые стеки. В отличие от
+    `cProfile` он не перехватывает каждый вызов и не искажает тайминги Tk,
+    поэтому его можно держать включённым в обычной работе: при интервале
+    10 мс опрос занимает доли процента времени (доля пишется в лог).
+    При выходе стеки сохраняются в «свёрнутом» формате
+    (`поток;кадр;кадр… число`), который понимают flamegraph.pl, speedscope
+    и inferno.
+    """
+
+    def __init__(self, interval_ms: float = 0, output: str = DEFAULT_OUTPUT):
+        self.interval_ms = interval_ms
+        self.output = output
+        self.stacks: Counter[tuple[str, tuple[CodeType, ...]]] = Counter()
+        self.samples = 0
+        self.busy = 0.0  # время, потраченное на сами опросы
+        self._started = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._exit_registered = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval_ms > 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def configure(self) -> bool:
+        """
+        Берёт интервал из переменной `MEALS_SAMPLING` или из
+        [performance] sampling_interval_ms и, если он больше нуля, запускает
+        опрос; запись результата регистрируется на выход из приложения.
+
+        Returns:
+            bool: Запущен ли профилировщик.
+        """
+        from config_manager import get_config
+
+        config = get_config()
+        self.interval_ms = 0
+        env = os.environ.get(ENV_VAR)
+        if env:
+            try:
+                self.interval_ms = float(env)
+            except ValueError:
+                logger.error(
+                    f"Ошибка: Некорректный интервал сэмплирования {ENV_VAR}={env!r}, "
+                    "используется значение из конфига"
+                )
+                env = None
+        if not env:
+            try:
+                self.interval_ms = config.getfloat(
+                    "performance", "sampling_interval_ms"
+                )
+            except ValueError as e:
+                logger.error(f"Ошибка: Некорректный интервал сэмплирования: {e}")
+        self.output = os.environ.get(ENV_OUTPUT) or (
+            config.get("performance", "sampling_output") or DEFAULT_OUTPUT
+        )
+        if self.enabled and not self._exit_registered:
+            atexit.register(self.stop)
+            self._exit_registered = True
+        self.start()
+        return self.running
+
+    def start(self) -> None:
+        if not self.enabled or self.running:
+            return
+        self._stop.clear()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> str | None:
+        """Останавливает опрос и сохраняет стеки; возвращает путь к файлу."""
+        if not self.running:
+            return None
+        self._stop.set()
+        self._thread.join(timeout=1)
+        self._thread = None
+        return self.write()
+
+    def sample(self) -> None:
+        """Один снимок стеков всех потоков, кроме самого профилировщика."""
+        frames = sys._current_frames()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        own = threading.get_ident()
+        with self._lock:
+            for ident, frame in frames.items():
+                if ident == own:
+                    continue
+                codes = []
+                while frame is not None:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                codes.reverse()
+                self.stacks[(names.get(ident, str(ident)), tuple(codes))] += 1
+            self.samples += 1
+
+    def _run(self) -> None:
+        period = self.interval_ms / 1000
+        while not self._stop.wait(period):
+            start = time.perf_counter()
+            self.sample()
+            self.busy += time.perf_counter() - start
+
+    def collapsed(self) -> list[str]:
+        """Строки свёрнутых стеков, самые частые — первыми."""
+        labels: dict[CodeType, str] = {}
+        lines = []
+        with self._lock:
+            stacks = self.stacks.most_common()
+        for (thread, codes), count in stacks:
+            frames = [thread]
+            for code in codes:
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = frame_label(code)
+                frames.append(label)
+            lines.append(f"{';'.join(frames)} {count}")
+        return lines
+
+    def hottest(self, top: int = TOP) -> list[tuple[str, int]]:
+        """Функции, на которых чаще всего заставали потоки (верх стека)."""
+        leaves: Counter[str] = Counter()
+        with self._lock:
+            for (_thread, codes), count in self.stacks.items():
+                if codes:
+                    leaves[frame_label(codes[-1])] += count
+        return leaves.most_common(top)
+
+    def write(self, path: str | None = None) -> str | None:
+        """Пишет свёрнутые стеки в файл и короткую сводку в лог."""
+        if not self.samples:
+            return None
+        path = path or self.output
+        elapsed = time.perf_counter() - self._started
+        overhead = self.busy / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            f"Сэмплирование: {self.samples} снимков за {elapsed:.1f} с, "
+            f"затраты на опрос {overhead:.2%}"
+        )
+        for label, count in self.hottest():
+            logger.info(f"sample {label}: {count}")
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("\n".join(self.collapsed()) + "\n")
+        except OSError as e:
+            logger.error(f"Ошибка записи стеков сэмплирования {path}: {e}")
+            return None
+        return path
+
+
+# Общий профилировщик приложения; включается в configure() при запуске
+sampler = SamplingProfiler()
@@ -0,0 +1,96 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+
+from notifications import notifier
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIR = "logs"
+HOTKEY = "<Control-Shift-P>"
+TOP = 30  # строк в текстовой сводке
+
+
+class SessionProfiler:
+    """
+    Запись профиля `cProfile` по горячей клавише.
+
+    Первое нажатие включает профилировщик, второе — выключает его и пишет в
+    `output_dir` файл `profile-ГГГГММДД-ЧЧММСС.pstats` (открывается `pstats`,
+    snakeviz и т. п.) и рядом `.txt` со сводкой самых затратных функций.
+    Пока запись не идёт, объекта `cProfile.Profile` нет вовсе — накладных
+    расходов никаких, остаётся только привязка клавиши. Замеряется главный
+    поток, то есть обработчики событий Tk; фоновые задачи `BackgroundRunner`
+    в профиль не попадают.
+    """
+
+    def __init__(self, output_dir: str = DEFAULT_DIR, top: int = TOP):
+        self.output_dir = output_dir
+        self.top = top
+        self.notify = notifier.notify
+        self._profile: cProfile.Profile | None = None
+        self._started = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._profile is not None
+
+    def bind(self, root, sequence: str = HOTKEY) -> None:
+        """Вешает переключение записи на сочетание `sequence` во всех окнах."""
+        if sequence:
+            root.bind_all(sequence, lambda event: self.toggle())
+
+    def toggle(self) -> str | None:
+        if self.active:
+            return self.stop()
+        self.start()
+        return None
+
+    def start(self) -> None:
+        if self.active:
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:  # уже работает другой профилировщик
+            logger.error(f"Ошибка: Не удалось запустить профилирование: {e}")
+            return
+        self._profile = profile
+        self._started = time.perf_counter()
+        logger.info("Профилирование запущено")
+        self.notify(_("Профилирование"), _("Запись профиля начата"))
+
+    def stop(self) -> str | None:
+        """Останавливает запись и сохраняет профиль; возвращает путь к .pstats."""
+        if not self.active:
+            return None
+        profile, self._profile = self._profile, None
+        profile.disable()
+        elapsed = time.perf_counter() - self._started
+
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self.output_dir, f"profile-{stamp}.pstats")
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            profile.dump_stats(path)
+            with open(path[: -len(".pstats")] + ".txt", "w", encoding="utf-8") as f:
+                f.write(self.summary(profile, elapsed))
+        except OSError as e:
+            logger.error(f"Ошибка записи профиля {path}: {e}")
+            return None
+        logger.info(f"Профиль за {elapsed:.1f} с сохранён: {path}")
+        self.notify(
+            _("Профилирование"), _("Профиль сохранён: {path}").format(path=path)
+        )
+        return path
+
+    def summary(self, profile: cProfile.Profile, elapsed: float) -> str:
+        """Текстовая сводка: `top` функций по суммарному времени с вызовами."""
+        stream = io.StringIO()
+        stream.write(f"Запись профиля: {elapsed:.1f} с\n")
+        stats = pstats.Stats(profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        return stream.getvalue()
@@ -0,0 +1,119 @@
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from types import FrameType
+
+logger = logging.getLogger(__name__)
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def find_culprit(frame: FrameType | None) -> str | None:
+    """
+    Самый глубокий кадр стека из кода приложения (src/), например
+    `main_controller.py:412 в show_stats_window`.
+    """
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(SRC_DIR + os.sep) and filename != __file__:
+            name = os.path.basename(filename)
+            return f"{name}:{frame.f_lineno} в {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class StallMonitor:
+    """
+    Сторож цикла событий Tk.
+
+    Главный поток раз в `interval_ms` отмечает «пульс» через `after()`.
+    Фоновый поток-сторож сравнивает время последнего пульса с часами: если
+    цикл не отвечал дольше `threshold_ms`, стек главного потока снимается
+    через `sys._current_frames()` прямо во время зависания и пишется в лог
+    вместе с вероятной причиной — последним кадром из кода приложения.
+    Когда цикл оживает, в лог уходит итоговая длительность простоя.
+    """
+
+    def __init__(self, threshold_ms: float = 500, interval_ms: int = 100):
+        self.root = None
+        self.threshold = threshold_ms / 1000
+        self.interval_ms = interval_ms
+        self.main_ident = threading.main_thread().ident
+        self.last_beat = time.perf_counter()
+        self.stalls: list[dict] = []  # отчёты о зависаниях за время работы
+        self._reported = False  # текущее зависание уже записано
+        self._after_id = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def start(self, root) -> None:
+        """Начинает следить за циклом событий окна `root`."""
+        if not self.enabled or self._thread is not None:
+            return
+        self.root = root
+        self._stop.clear()
+        self.last_beat = time.perf_counter()
+        self._after_id = self.root.after(self.interval_ms, self.beat)
+        self._thread = threading.Thread(
+            target=self._watch, name="tk-stall-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass  # окно уже уничтожено
+            self._after_id = None
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def beat(self) -> None:
+        """Пульс в главном потоке; опоздание сверх порога — зависание."""
+        now = time.perf_counter()
+        late = now - self.last_beat - self.interval_ms / 1000
+        if self._reported or late > self.threshold:
+            logger.warning(f"Цикл событий Tk не отвечал {late * 1000:.0f} мс")
+        self._reported = False
+        self.last_beat = now
+        if not self._stop.is_set():
+            self._after_id = self.root.after(self.interval_ms, self.beat)
+
+    def check(self, now: float | None = None) -> dict | None:
+        """
+        Проверка из потока-сторожа: снимает стек главного потока, если пульса
+        нет дольше порога (один отчёт на зависание).
+        """
+        now = time.perf_counter() if now is None else now
+        silent = now - self.last_beat - self.interval_ms / 1000
+        if self._reported or silent <= self.threshold:
+            return None
+        frame = sys._current_frames().get(self.main_ident)
+        report = {
+            "stalled_ms": round(silent * 1000),
+            "culprit": find_culprit(frame),
+            "stack": "".join(traceback.format_stack(frame)) if frame else "",
+        }
+        self._reported = True
+        self.stalls.append(report)
+        logger.warning(
+            f"Цикл событий Tk завис на {report['stalled_ms']} мс "
+            f"(вероятная причина: {report['culprit'] or 'неизвестна'}). "
+            f"Стек главного потока:\n{report['stack']}"
+        )
+        return report
+
+    def _watch(self) -> None:
+        period = min(self.interval_ms / 1000, self.threshold / 2)
+        while not self._stop.wait(period):
+            self.check()
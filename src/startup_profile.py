@@ -0,0 +1,132 @@
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager, nullcontext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT = "logs/startup_profile.json"
+ENV_BUDGET = "MEALS_STARTUP_BUDGET_MS"  # бюджет до первого окна, мс (сильнее конфига)
+
+_DISABLED = nullcontext()
+
+
+def startup_budget_ms() -> float:
+    """Бюджет времени до первого окна: переменная окружения или [performance]."""
+    env = os.environ.get(ENV_BUDGET)
+    if env:
+        try:
+            return float(env)
+        except ValueError:
+            logger.error(
+                f"Ошибка: Некорректный бюджет запуска {ENV_BUDGET}={env!r}, "
+                "используется значение из конфига"
+            )
+    from config_manager import get_config
+
+    return get_config().getfloat("performance", "startup_budget_ms")
+
+
+class StartupProfiler:
+    """
+    Замер этапов запуска приложения по реальному времени.
+
+    Этапы (импорты, чтение конфига, установка перевода, загрузка каталога и
+    статистики) размечаются `phase(name)`; отсчёт идёт от создания профилера,
+    то есть от начала `main.py`. Когда первое окно появляется на экране,
+    `window_mapped` сохраняет отчёт и, в режиме `--profile-startup`,
+    закрывает приложение. Выключенный профилер ничего не замеряет.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.enabled = False
+        self.exit_after = False
+        self.output = DEFAULT_OUTPUT
+        self.phases: list[dict] = []
+        self.first_window_ms: float | None = None
+
+    def enable(self, output: str | None = None, exit_after: bool = True) -> None:
+        self.enabled = True
+        self.exit_after = exit_after
+        self.output = output or DEFAULT_OUTPUT
+
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.origin) * 1000
+
+    @contextmanager
+    def _measure(self, name: str):
+        start = self._elapsed_ms()
+        try:
+            yield
+        finally:
+            self.phases.append(
+                {
+                    "name": name,
+                    "start_ms": round(start, 3),
+                    "duration_ms": round(self._elapsed_ms() - start, 3),
+                }
+            )
+
+    def phase(self, name: str):
+        """Контекстный менеджер замера этапа запуска `name`."""
+        if not self.enabled:
+            return _DISABLED
+        return self._measure(name)
+
+    def watch(self, root) -> None:
+        """Отметит появление окна `root` на экране (событие <Map>)."""
+        if not self.enabled or self.first_window_ms is not None:
+            return
+
+        def on_map(event):
+            # <Map> дочерних виджетов тоже доходит до привязки окна
+            if event.widget is root and self.first_window_ms is None:
+                self.window_mapped()
+                if self.exit_after:
+                    root.after_idle(root.destroy)
+
+        root.bind("<Map>", on_map, add="+")
+
+    def window_mapped(self) -> dict:
+        self.first_window_ms = round(self._elapsed_ms(), 3)
+        report = self.report()
+        self.write(report)
+        return report
+
+    def report(self, budget_ms: float | None = None) -> dict:
+        if budget_ms is None:
+            budget_ms = startup_budget_ms()
+        first = self.first_window_ms
+        return {
+            "phases": list(self.phases),
+            "first_window_ms": first,
+            "budget_ms": budget_ms,
+            "over_budget": first is not None and first > budget_ms,
+        }
+
+    def write(self, report: dict) -> None:
+        for phase in report["phases"]:
+            logger.info(
+                f"Запуск: {phase['name']} — {phase['duration_ms']} мс "
+                f"(с {phase['start_ms']} мс)"
+            )
+        message = (
+            f"Первое окно через {report['first_window_ms']} мс "
+            f"(бюджет {report['budget_ms']} мс)"
+        )
+        if report["over_budget"]:
+            logger.warning(message)
+        else:
+            logger.info(message)
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.output)), exist_ok=True)
+            with open(self.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.error(f"Ошибка записи отчёта запуска {self.output}: {e}")
+
+
+# Общий профилер: создаётся при первом импорте, то есть в начале main.py
+profiler = StartupProfiler()
@@ -1,36 +1,81 @@
-import json
 import logging
 import os
+import threading
 
 # from gettext import gettext as _
 from datetime import datetime, timedelta
 
+from instrumentation import timed
+from meal_journal import DEFAULT_ARCHIVE_CODEC, MealJournal, get_journal
+
 logger = logging.getLogger(__name__)
 path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+PERIOD_DAYS = {"week": 7, "month": 30}
 
 
 class StatsManager:
-    def __init__(self, stats_file: str = os.path.join(path, "data", "meals.json")):
+    def __init__(
+        self,
+        stats_file: str = os.path.join(path, "data", "meals.json"),
+        journal_dir: str | None = None,
+        use_index: bool = True,
+    ):
+        """
+        Args:
+            stats_file (str): Старый единый файл журнала; при наличии его записи
+                переносятся в помесячные файлы.
+            journal_dir (str, optional): Каталог помесячного журнала. По умолчанию
+                рядом со `stats_file`: `data/meals.json` -> `data/meals/`.
+            use_index (bool): Считать итоги за период по двоичному индексу
+                журнала, не разбирая JSON.
+        """
         self.log = logger.error
         self.stats_file = stats_file
-        self.stats: list[dict] = []
-        self._load_stats()
+        self.journal_dir = journal_dir or os.path.splitext(stats_file)[0]
+        self.use_index = use_index
+        # Журнал открывается при первом запросе (или в `preload`), а не при
+        # запуске: время старта не зависит от размера истории.
+        self._journal: MealJournal | None = None
+        self._load_lock = threading.Lock()
 
-    def _load_stats(self):
-        if os.path.exists(self.stats_file):
-            try:
-                with open(self.stats_file, encoding="utf-8") as f:
-                    self.stats = json.load(f)
-            except Exception as e:
-                self.log(f"Ошибка при загрузке: {e}")
-                self.stats = []
-        else:
-            self.stats = []
+    @property
+    def journal(self) -> MealJournal:
+        if self._journal is None:
+            self.preload()
+        return self._journal
+
+    @property
+    def loaded(self) -> bool:
+        return self._journal is not None
 
-    def _save_stats(self):
-        os.makedirs(os.path.dirname(self.stats_file), exist_ok=True)
-        with open(self.stats_file, "w", encoding="utf-8") as f:
-            json.dump(self.stats, f, ensure_ascii=False, indent=4)
+    def preload(self, now: datetime | None = None) -> None:
+        """
+        Открывает журнал заранее; безопасно вызывать из фонового потока.
+
+        Args:
+            now (datetime, optional): Текущий момент для выбора закрытых
+                месяцев; по умолчанию — часы системы.
+        """
+        with self._load_lock:
+            if self._journal is None:
+                journal = get_journal(self.journal_dir)
+                self._load_stats(journal, now)
+                self._journal = journal
+
+    def _load_stats(self, journal: MealJournal, now: datetime | None = None):
+        """
+        Переносит старый meals.json в журнал и сжимает закрытые месяцы.
+        Сами записи читаются по запросу.
+        """
+        try:
+            journal.migrate_legacy(self.stats_file)
+            journal.archive_closed(DEFAULT_ARCHIVE_CODEC, now=now)
+        except Exception as e:
+            self.log(f"Ошибка при загрузке: {e}")
+
+    def archive_closed_periods(self, codec: str = DEFAULT_ARCHIVE_CODEC) -> list[str]:
+        """Сжимает прошедшие месяцы журнала; запросы читают их прозрачно."""
+        return self.journal.archive_closed(codec)
 
     def log_product_usage(self, items: list[dict], total: float):
         entry = {
@@ -38,8 +83,7 @@ class StatsManager:
             "items": items,
             "total": total,
         }
-        self.stats.append(entry)
-        self._save_stats()
+        self.journal.append(entry)
 
     def _is_within_range(self, timestamp: str, start: datetime, end: datetime) -> bool:
         try:
@@ -48,34 +92,83 @@ class StatsManager:
         except Exception:
             return False
 
+    @timed("stats.range")
     def get_stats_for_range(self, start_date: str, end_date: str) -> list[dict]:
         start = datetime.strptime(start_date, "%Y-%m-%d")
         end = datetime.strptime(end_date, "%Y-%m-%d")
         return [
             entry
-            for entry in self.stats
-            if self._is_within_range(entry["timestamp"], start, end)
+            for entry in self.journal.iter_range(start, end)
+            if self._is_within_range(entry.get("timestamp", ""), start, end)
         ]
 
     def get_stats_last_n_days(self, n: int) -> list[dict]:
+        return self.get_stats_for_range(*self._last_n_days(n))
+
+    @staticmethod
+    def _last_n_days(n: int) -> tuple[str, str]:
         today = datetime.now()
         start = today - timedelta(days=n - 1)
-        return self.get_stats_for_range(
-            start.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
-        )
+        return start.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
+
+    def _unknown_period(self, period: str) -> ValueError:
+        msg = _("Неизвестный период: {period}").format(period=period)
+        self.log(msg)
+        return ValueError(msg)
 
     def get_stats_by_period(self, period: str) -> list[dict]:
-        if period == "week":
-            return self.get_stats_last_n_days(7)
-        elif period == "month":
-            return self.get_stats_last_n_days(30)
+        if period in PERIOD_DAYS:
+            return self.get_stats_last_n_days(PERIOD_DAYS[period])
         elif period == "all":
-            return self.stats
+            return self.journal.read_all()
         else:
-            msg = _("Неизвестный период: {period}").format(period=period)
-            self.log(msg)
-            raise ValueError(msg)
+            raise self._unknown_period(period)
+
+    # —— Totals (binary index) —— #
+
+    @timed("stats.totals")
+    def _totals(self, start: datetime | None, end: datetime | None) -> list[dict]:
+        if self.use_index:
+            try:
+                return self.journal.totals_range(start, end)
+            except (OSError, ValueError, KeyError) as e:
+                self.log(f"Ошибка чтения индекса журнала: {e}")
+        entries = (
+            self.journal.iter_range(start, end)
+            if start and end
+            else self.journal.read_all()
+        )
+        return [
+            {"timestamp": entry["timestamp"], "total": entry.get("total", 0.0)}
+            for entry in entries
+            if not (start and end)
+            or self._is_within_range(entry.get("timestamp", ""), start, end)
+        ]
+
+    def get_totals_for_range(self, start_date: str, end_date: str) -> list[dict]:
+        """
+        Как `get_stats_for_range`, но возвращает только время и итог записи.
+
+        Записи содержат ссылку на место в журнале, по которой полный состав
+        можно получить через `load_entry_details`.
+        """
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        end = datetime.strptime(end_date, "%Y-%m-%d")
+        return self._totals(start, end)
+
+    def get_totals_by_period(self, period: str) -> list[dict]:
+        if period in PERIOD_DAYS:
+            return self.get_totals_for_range(*self._last_n_days(PERIOD_DAYS[period]))
+        elif period == "all":
+            return self._totals(None, None)
+        else:
+            raise self._unknown_period(period)
+
+    def load_entry_details(self, entry: dict) -> dict:
+        """Дочитывает полную запись (с составом блюда) для записи из итогов."""
+        if "partition" not in entry:
+            return entry
+        return self.journal.read_entry(entry["partition"], entry["offset"])
 
     def clear_stats(self):
-        self.stats = []
-        self._save_stats()
+        self.journal.clear()
@@ -0,0 +1,74 @@
+import tkinter as tk
+import weakref
+from tkinter import ttk
+
+# -- Палитра -- #
+RED = "#f44336"
+BLUE = "#2196f3"
+GREEN = "#4CAF50"
+BACKGROUND = "#f0f8ff"  # фон окон (Factory.bg_color)
+
+FONT_10 = ("Arial", 10, "bold")
+FONT_12 = ("Arial", 12, "bold")
+
+BASE_THEME = "clam"  # цвет фона кнопок учитывают не все темы (vista, aqua)
+
+# -- Именованные стили (имена хранит DataDefaults) -- #
+STYLES = {
+    "Success.TButton": {"font": FONT_12, "background": GREEN},
+    "Danger.TButton": {"font": FONT_12, "background": RED},
+    "Info.TButton": {"font": FONT_12, "background": BLUE},
+    "Small.Danger.TButton": {"font": FONT_10, "background": RED},
+    "Body.TLabel": {"font": FONT_10},
+}
+BUTTON = {"foreground": "white", "relief": "flat", "padding": (8, 4)}
+
+# Корневые окна, в интерпретаторах которых стили уже зарегистрированы
+_themed_roots: weakref.WeakSet = weakref.WeakSet()
+
+
+def _darker(color: str, factor: float = 0.85) -> str:
+    """Цвет нажатой/наведённой кнопки."""
+    red, green, blue = (int(color[i : i + 2], 16) for i in (1, 3, 5))
+    return "#{:02x}{:02x}{:02x}".format(
+        *(int(channel * factor) for channel in (red, green, blue))
+    )
+
+
+def apply_theme(window: tk.Misc, background: str = BACKGROUND) -> None:
+    """
+    Регистрирует стили приложения в интерпретаторе окна `window`.
+
+    Стили `ttk.Style` общие для всего интерпретатора, поэтому настройка
+    выполняется один раз на корневое окно; виджеты дальше только ссылаются
+    на стиль по имени вместо набора опций на каждый виджет.
+
+    Тема clam рисует фон ttk-виджетов серым, поэтому фон по умолчанию,
+    надписи и рамка вокруг кнопок получают цвет окна `background`.
+    """
+    root = window if isinstance(window, tk.Tk) else window._root()
+    if root in _themed_roots:
+        return
+    style = ttk.Style(root)
+    if BASE_THEME in style.theme_names():
+        style.theme_use(BASE_THEME)
+    style.configure(".", background=background)
+    for name, options in STYLES.items():
+        if name.endswith(".TButton"):
+            color = options["background"]
+            style.configure(
+                name,
+                **BUTTON,
+                **options,
+                bordercolor=background,
+                lightcolor=color,
+                darkcolor=color,
+            )
+            style.map(
+                name,
+                background=[("active", _darker(options["background"]))],
+                foreground=[("disabled", "#dddddd")],
+            )
+        else:
+            style.configure(name, **{"background": background, **options})
+    _themed_roots.add(root)
@@ -0,0 +1,177 @@
+import gettext
+import logging
+import os
+import threading
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+LOCALE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "locales"))
+DOMAIN = "messages"
+SOURCE_LANGUAGE = "ru"  # msgid в каталогах записаны по-русски
+
+# Постоянные подписи окон и диалогов. Переводятся один раз при активации
+# языка; строки с подстановками ({n}, {kcal}...) сюда не входят.
+UI_STRINGS = (
+    # Общие
+    "Ошибка",
+    "Ошибка:",
+    "Успех",
+    "Внимание",
+    "Назад",
+    "Удалить",
+    "Изменить",
+    "Сохранить",
+    "Результат",
+    # Главное меню
+    "Главное Меню",
+    "Рассчитать калории",
+    "Меню управления продуктами",
+    "Показать статистику",
+    "Выход",
+    "Cбросить Языковые Настройки",
+    "Сменить язык",
+    # Калькулятор
+    "+ Добавить продукт",
+    "Рассчитать",
+    "Нет продуктов для расчёта.",
+    # Управление продуктами
+    "Добавить продукт",
+    "Изменить Калорийность",
+    "Удалить продукт",
+    "Назад в меню",
+    "Изменить калорийность",
+    "Название продукта:",
+    "Калорийность:",
+    "Продукт:",
+    "Новая калорийность:",
+    "Продукт для удаления:",
+    # Статистика
+    "Статистика за 7 дней:",
+    "Статистика за 30 дней:",
+    "Статистика за все время:",
+    "Статистика за указанный период:",
+    "7 дней",
+    "30 дней",
+    "Все время",
+    "Загрузка...",
+    "Нет данных за указанный период",
+    "Дата",
+    "Итого Калорий",
+    "Калорий за День",
+    "Дневная цель",
+)
+
+
+class StringTable:
+    """
+    Таблица заранее переведённых строк интерфейса для одного языка.
+
+    Построители окон берут подписи отсюда: повторное открытие окна не
+    обращается к gettext. Строка не из `UI_STRINGS` переводится при первом
+    запросе и тоже запоминается.
+    """
+
+    def __init__(self, translate: Callable[[str], str] | None = None):
+        self.translate = translate or str
+        self.strings = {msgid: self.translate(msgid) for msgid in UI_STRINGS}
+
+    def __getitem__(self, msgid: str) -> str:
+        text = self.strings.get(msgid)
+        if text is None:
+            logger.debug(f"Строка интерфейса вне таблицы: {msgid}")
+            text = self.strings[msgid] = self.translate(msgid)
+        return text
+
+    def untranslated(self) -> list[str]:
+        """Строки `UI_STRINGS`, для которых в каталоге нет перевода."""
+        return [msgid for msgid in UI_STRINGS if self.strings[msgid] == msgid]
+
+
+class TranslationRegistry:
+    """
+    Кэш каталогов перевода gettext и переключатель активного языка.
+
+    Каждый `.mo` читается с диска один раз; повторная активация языка только
+    переустанавливает уже загруженный каталог в `builtins._` и подменяет
+    таблицу строк интерфейса `strings` (она тоже строится один раз на
+    язык). Подписчики (`subscribe`) получают код языка после каждого
+    переключения и перерисовывают свои окна.
+    """
+
+    def __init__(self, locale_dir: str = LOCALE_DIR, domain: str = DOMAIN):
+        self.locale_dir = locale_dir
+        self.domain = domain
+        self.language: str | None = None
+        self._catalogs: dict[str, gettext.NullTranslations] = {}
+        self._tables: dict[str, StringTable] = {}
+        self.strings = StringTable()
+        self._listeners: list[Callable[[str], None]] = []
+        self._lock = threading.Lock()
+
+    def get(self, language: str) -> gettext.NullTranslations:
+        """Возвращает каталог языка, загружая его при первом обращении."""
+        with self._lock:
+            catalog = self._catalogs.get(language)
+            if catalog is None:
+                catalog = gettext.translation(
+                    domain=self.domain,
+                    localedir=self.locale_dir,
+                    languages=[language],
+                    fallback=True,
+                )
+                self._catalogs[language] = catalog
+            return catalog
+
+    def activate(self, language: str) -> gettext.NullTranslations:
+        """
+        Делает язык активным: устанавливает `_` и оповещает подписчиков.
+
+        Args:
+            language (str): Код языка (например, 'ru', 'en').
+
+        Returns:
+            gettext.NullTranslations: Установленный каталог.
+        """
+        catalog = self.get(language)
+        catalog.install()
+        self.strings = self._tables.get(language) or self._build_table(language)
+        previous, self.language = self.language, language
+        if previous is not None and previous != language:
+            logger.info(f"Язык переключён: {previous} -> {language}")
+            for listener in list(self._listeners):
+                listener(language)
+        return catalog
+
+    def _build_table(self, language: str) -> StringTable:
+        table = StringTable(self.get(language).gettext)
+        self._tables[language] = table
+        missing = table.untranslated() if language != SOURCE_LANGUAGE else []
+        if missing:
+            logger.warning(f"Нет перевода ({language}) для: {', '.join(missing)}")
+        return table
+
+    def subscribe(self, listener: Callable[[str], None]) -> None:
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[str], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def clear(self) -> None:
+        """Сбрасывает кэш каталогов и таблиц (например, после пересборки `.mo`)."""
+        with self._lock:
+            self._catalogs.clear()
+            self._tables.clear()
+        self.language = None
+        self.strings = StringTable()
+
+
+# Общий реестр приложения: окно выбора языка и главное меню работают с ним
+registry = TranslationRegistry()
+
+
+def ui(msgid: str) -> str:
+    """Подпись интерфейса на активном языке из предпереведённой таблицы."""
+    return registry.strings[msgid]
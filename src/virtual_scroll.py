@@ -0,0 +1,175 @@
+import math
+import tkinter as tk
+from collections.abc import Callable, Sequence
+from typing import Any
+
+THROTTLE_MS = 16  # не чаще одного пересчёта за кадр (~60 Гц)
+
+
+def visible_range(
+    top: float, height: int, row_height: int, count: int
+) -> tuple[int, int]:
+    """
+    Диапазон строк `[first, stop)`, попадающих в область просмотра.
+
+    Args:
+        top (float): Верхняя граница видимой части холста (`canvasy(0)`).
+        height (int): Высота области просмотра.
+        row_height (int): Высота одной строки.
+        count (int): Число строк в модели.
+    """
+    if count <= 0:
+        return 0, 0
+    first = min(max(int(top // row_height), 0), count - 1)
+    # +1 — частично видимая строка снизу при прокрутке не на целую строку
+    stop = min(count, first + math.ceil(max(height, 1) / row_height) + 1)
+    return first, stop
+
+
+class ScrollRegionUpdater:
+    """
+    Обновляет `scrollregion` холста с прокручиваемым фреймом.
+
+    Пачка событий `<Configure>` (каждая добавленная строка, изменение
+    размера окна) сводится к одному обновлению за `interval` мс. Размер
+    берётся из самого события: фрейм — единственный элемент холста в (0, 0),
+    поэтому пересчитывать `bbox("all")` не нужно.
+    """
+
+    def __init__(self, canvas: tk.Canvas, interval: int = THROTTLE_MS):
+        self.canvas = canvas
+        self.interval = interval
+        self.size: tuple[int, int] | None = None
+        self.pending = None
+
+    def schedule(self, event: tk.Event | None = None) -> None:
+        if event is not None:
+            self.size = (event.width, event.height)
+        if self.pending is None:
+            self.pending = self.canvas.after(self.interval, self.flush)
+
+    def flush(self) -> None:
+        self.pending = None
+        try:
+            if self.size is None:
+                region = self.canvas.bbox("all")
+            else:
+                region = (0, 0, *self.size)
+            self.canvas.configure(scrollregion=region)
+        except tk.TclError:
+            pass  # окно закрыли, пока обновление ждало своей очереди
+
+
+class VirtualList:
+    """
+    Прокручиваемый список, в котором существуют только видимые строки.
+
+    Данные берутся из модели-последовательности (`len` и индекс), строки
+    одной высоты. Виджетов создаётся столько, сколько помещается в область
+    просмотра; при прокрутке они переезжают на новые позиции и заново
+    заполняются `bind_row`. Высота прокрутки считается арифметически как
+    `len(model) * row_height`, поэтому память и время раскладки зависят от
+    высоты окна, а не от размера данных.
+    """
+
+    def __init__(
+        self,
+        parent: tk.Widget,
+        model: Sequence,
+        create_row: Callable[[tk.Canvas], tk.Widget],
+        bind_row: Callable[[tk.Widget, Any, int], None],
+        row_height: int = 28,
+        bg: str = "#f0f8ff",
+        height: int | None = None,
+    ):
+        """
+        Args:
+            parent (tk.Widget): Контейнер; холст и полоса прокрутки
+                размещаются в его строке 0 сеткой.
+            model (Sequence): Данные списка.
+            create_row (Callable): Создаёт пустой виджет строки на холсте.
+            bind_row (Callable): Заполняет виджет строки элементом модели
+                `(widget, item, index)`.
+            row_height (int): Высота строки в пикселях.
+            height (int, optional): Высота области просмотра; по умолчанию
+                её задаёт сетка родителя.
+        """
+        if row_height <= 0:
+            raise ValueError("Ошибка: Высота строки должна быть положительной.")
+        self.model = model
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.row_height = row_height
+
+        self.canvas = tk.Canvas(
+            parent,
+            background=bg,
+            highlightthickness=0,
+            yscrollincrement=row_height,
+            **({"height": height} if height else {}),
+        )
+        self.scrollbar = tk.Scrollbar(
+            parent, orient="vertical", command=self.canvas.yview
+        )
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        parent.grid_rowconfigure(0, weight=1)
+        parent.grid_columnconfigure(0, weight=1)
+
+        self.rows: list[tuple[tk.Widget, int]] = []  # виджет и id на холсте
+        self.shown: tuple[int, int] = (0, 0)
+        self._region: tuple[int, int, int, int] | None = None
+        self._pending = None
+        self.canvas.bind("<Configure>", lambda _event: self.schedule())
+
+    def _on_scroll(self, first: str, last: str) -> None:
+        self.scrollbar.set(first, last)
+        self.schedule()
+
+    def schedule(self) -> None:
+        """Перерисует видимые строки один раз, когда Tk освободится."""
+        if self._pending is None:
+            self._pending = self.canvas.after_idle(self.render)
+
+    def set_model(self, model: Sequence) -> None:
+        """Заменяет данные списка и возвращает прокрутку в начало."""
+        self.model = model
+        self.canvas.yview_moveto(0)
+        self.schedule()
+
+    def render(self) -> None:
+        self._pending = None
+        try:
+            width = self.canvas.winfo_width()
+            height = self.canvas.winfo_height()
+        except tk.TclError:
+            return  # окно уже закрыто
+
+        count = len(self.model)
+        region = (0, 0, width, count * self.row_height)
+        if region != self._region:
+            # Меняется только при изменении модели или ширины; иначе
+            # yscrollcommand снова запланировал бы отрисовку
+            self._region = region
+            self.canvas.configure(scrollregion=region)
+
+        first, stop = visible_range(
+            self.canvas.canvasy(0), height, self.row_height, count
+        )
+        while len(self.rows) < stop - first:
+            widget = self.create_row(self.canvas)
+            item = self.canvas.create_window(0, 0, window=widget, anchor="nw")
+            self.rows.append((widget, item))
+
+        for slot, (widget, item) in enumerate(self.rows):
+            index = first + slot
+            if index < stop:
+                self.canvas.coords(item, 0, index * self.row_height)
+                self.canvas.itemconfigure(
+                    item, state="normal", width=width, height=self.row_height
+                )
+                self.bind_row(widget, self.model[index], index)
+            else:
+                self.canvas.itemconfigure(item, state="hidden")
+        self.shown = (first, stop)
@@ -0,0 +1,127 @@
+import tkinter as tk
+from collections.abc import Callable
+
+
+def clear_inputs(window: tk.Misc) -> None:
+    """Очищает поля ввода и списки подсказок окна (сброс формы по умолчанию)."""
+    for child in window.winfo_children():
+        if isinstance(child, tk.Entry | tk.Listbox):
+            child.delete(0, tk.END)
+        clear_inputs(child)
+
+
+class PooledWindow:
+    __slots__ = ("window", "reset", "parent")
+
+    def __init__(
+        self,
+        window: tk.Toplevel,
+        reset: Callable[[], None],
+        parent: tk.Tk | tk.Toplevel,
+    ):
+        self.window = window
+        self.reset = reset
+        self.parent = parent  # окно, из которого экран открыт последним
+
+
+class WindowPool:
+    """
+    Экраны-Toplevel, которые строятся один раз за время жизни окна.
+
+    `show` при первом вызове строит экран функцией `build`, а дальше только
+    сбрасывает его изменяемое состояние (`reset`, по умолчанию — очистка
+    полей ввода) и показывает через `deiconify`. `hide` прячет экран через
+    `withdraw` и возвращает на экран родительское окно. Уничтоженный экран
+    (закрыт крестиком, пересоздан интерфейс при смене языка) при следующем
+    `show` строится заново.
+
+    Родитель запоминается при каждом `show`: обработчики экрана, построенного
+    однажды, ищут его через `parent`/`back`, а не держат окно, из которого
+    экран открыли впервые (оно могло быть с тех пор пересоздано).
+    """
+
+    def __init__(self):
+        self.screens: dict[str, PooledWindow] = {}
+
+    @staticmethod
+    def _alive(window: tk.Misc) -> bool:
+        try:
+            return bool(window.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def show(
+        self,
+        key: str,
+        root: tk.Tk | tk.Toplevel,
+        build: Callable[[], tk.Toplevel],
+        reset: Callable[[], None] | None = None,
+    ) -> tk.Toplevel | None:
+        """
+        Показывает экран `key` вместо окна `root`.
+
+        Args:
+            key (str): Имя экрана в пуле.
+            root (tk.Tk | tk.Toplevel): Окно, которое экран заменяет.
+            build (Callable): Строит и возвращает Toplevel экрана.
+            reset (Callable, optional): Сбрасывает состояние при повторном
+                показе; по умолчанию очищаются поля ввода.
+
+        Returns:
+            tk.Toplevel | None: Окно экрана (None, если построить не удалось).
+        """
+        if root is None:
+            raise ValueError("Ошибка: Не указано родительское окно.")
+        screen = self.screens.get(key)
+        if screen is not None and self._alive(screen.window):
+            root.withdraw()
+            screen.parent = root
+            screen.reset()
+            screen.window.deiconify()
+            screen.window.lift()
+            return screen.window
+
+        window = build()
+        if window is not None:
+            self.screens[key] = PooledWindow(
+                window, reset or (lambda: clear_inputs(window)), root
+            )
+        return window
+
+    def hide(self, root: tk.Tk | tk.Toplevel, window: tk.Toplevel) -> None:
+        """Прячет экран и возвращает на экран окно `root`."""
+        if root is None:
+            raise ValueError("Ошибка: Не указано родительское окно.")
+        if window is not None:
+            window.withdraw()
+        root.deiconify()
+
+    def parent(
+        self, window: tk.Toplevel, default: tk.Tk | tk.Toplevel | None = None
+    ) -> tk.Tk | tk.Toplevel | None:
+        """
+        Окно, из которого экран `window` показан последним (для экранов не из
+        пула — `default`). Если то окно уже уничтожено, возвращается корневое
+        окно приложения.
+        """
+        parent = default
+        for screen in self.screens.values():
+            if screen.window is window:
+                parent = screen.parent
+                break
+        if parent is not None and not self._alive(parent):
+            return window._root()
+        return parent
+
+    def back(
+        self, window: tk.Toplevel, default: tk.Tk | tk.Toplevel | None = None
+    ) -> None:
+        """Прячет экран и возвращает окно, из которого его показали (см. parent)."""
+        self.hide(self.parent(window, default), window)
+
+    def clear(self) -> None:
+        """Уничтожает все экраны пула (например, перед сменой языка)."""
+        for screen in self.screens.values():
+            if self._alive(screen.window):
+                screen.window.destroy()
+        self.screens.clear()
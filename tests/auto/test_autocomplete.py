@@ -144,3 +144,17 @@ def test_on_select_behavior(instance, fake_root, autocomplete_helper, key, targe
         mock_delete.assert_called_once_with(0, tk.END)
         mock_insert.assert_called_once_with(0, target.title())
         mock_listbox_delete.assert_called_once_with(0, tk.END)
+
+
+def test_autocomplete_limit(fake_root, autocomplete_helper):
+    app = Autocomplete(limit=1)
+    update_suggestions = app.setup_autocomplete(
+        autocomplete_helper["entry"],
+        list(autocomplete_helper["products"].keys()),
+        autocomplete_helper["listbox"],
+    )
+
+    autocomplete_helper["entry"].insert(0, "А")
+    update_suggestions()
+
+    assert autocomplete_helper["listbox"].get(0, tk.END) == ("Апельсин",)
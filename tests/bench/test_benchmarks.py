@@ -0,0 +1,56 @@
+import logging
+
+import pytest
+
+from benchmarks.cases import CASES, RANGE
+from benchmarks.datagen import DEFAULT_END
+from benchmarks.harness import compare, make_report, measure
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_case_runs(name, tmp_path):
+    result = measure(CASES[name](100, str(tmp_path)), repeat=1)
+    assert result["best_s"] >= 0
+    assert result["best_s"] <= result["median_s"]
+
+
+def test_stats_range_covers_generated_data(tmp_path):
+    assert RANGE[1] == DEFAULT_END.strftime("%Y-%m-%d")
+
+    entries = CASES["stats.range.json"](1_000, str(tmp_path / "json"))()
+    totals = CASES["stats.range.index"](1_000, str(tmp_path / "index"))()
+
+    assert entries
+    assert len(totals) == len(entries)
+
+
+def test_calculator_case_does_not_write_journal(tmp_path):
+    CASES["calculator.total"](100, str(tmp_path))()
+
+    assert not (tmp_path / "meals").exists()
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_case_times_success_path(name, tmp_path, caplog):
+    """Сценарий замеряет работу, а не обработку ошибки и запись трейсбека."""
+    CASES[name](100, str(tmp_path))()
+
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+
+
+def test_compare_flags_regressions():
+    baseline = make_report(
+        [
+            {"name": "a", "size": 10, "median_s": 1.0},
+            {"name": "b", "size": 10, "median_s": 1.0},
+        ]
+    )
+    current = make_report(
+        [
+            {"name": "a", "size": 10, "median_s": 1.05},
+            {"name": "b", "size": 10, "median_s": 1.5},
+            {"name": "c", "size": 10, "median_s": 1.0},
+        ]
+    )
+    rows = compare(current, baseline, threshold=0.10)
+    assert [(r["name"], r["regression"]) for r in rows] == [("a", False), ("b", True)]
@@ -0,0 +1,76 @@
+import json
+import random
+from collections import Counter
+
+from benchmarks import datagen
+from benchmarks.datagen import (
+    generate,
+    iter_catalog,
+    iter_meals,
+    popular_index,
+    write_catalog,
+)
+from meal_journal import MealJournal
+
+
+def test_catalog_names_are_unique_and_deterministic():
+    names = [name for name, _kcal in iter_catalog(5000, "ru")]
+    assert len(set(names)) == 5000
+    assert list(iter_catalog(50, "en")) == list(iter_catalog(50, "en"))
+    assert list(iter_catalog(50, "en", seed=1)) != list(iter_catalog(50, "en"))
+
+
+def test_catalog_grows_word_length_beyond_syllable_space():
+    count = len(datagen.SYLLABLES["en"]) ** 3 + 10
+    names = {datagen.product("en", i, count)[0] for i in range(count - 500, count)}
+    assert len(names) == 500
+    assert datagen._word_length("en", count) == 4
+
+
+def test_write_catalog_matches_app_format(tmp_path):
+    path = tmp_path / "products_ru.json"
+    assert write_catalog(str(path), iter_catalog(100, "ru")) == 100
+    catalog = json.loads(path.read_text(encoding="utf-8"))
+    assert catalog == dict(iter_catalog(100, "ru"))
+
+    empty = tmp_path / "empty.json"
+    write_catalog(str(empty), iter([]))
+    assert json.loads(empty.read_text(encoding="utf-8")) == {}
+
+
+def test_popularity_is_skewed():
+    rng = random.Random(0)
+    counts = Counter(popular_index(rng, 1000) for _ in range(20000))
+    assert min(counts) >= 0 and max(counts) < 1000
+    assert counts[0] > counts[100] * 10
+
+
+def test_meals_are_chronological_and_use_catalog():
+    catalog = dict(iter_catalog(200))
+    meals = list(iter_meals(1000, 200, years=2))
+    stamps = [meal["timestamp"] for meal in meals]
+    assert stamps == sorted(stamps)
+    assert stamps[0][:4] == "2024" and stamps[-1][:10] <= "2026-10-19"
+    for meal in meals:
+        assert 1 <= len(meal["items"]) <= 5
+        for item in meal["items"]:
+            assert item["calories"] == catalog[item["name"]] * item["weight"] / 100
+        assert meal["total"] == sum(item["calories"] for item in meal["items"])
+
+
+def test_generate_writes_identical_datasets(tmp_path):
+    first = generate(str(tmp_path / "a"), products=50, meals=300, years=1)
+    generate(str(tmp_path / "b"), products=50, meals=300, years=1)
+    assert first == {
+        "products_ru.json": 50,
+        "products_en.json": 50,
+        "meals.json": 300,
+        "meals/": 300,
+    }
+    for name in ("products_ru.json", "products_en.json", "meals.json"):
+        assert (tmp_path / "a" / name).read_bytes() == (
+            tmp_path / "b" / name
+        ).read_bytes()
+
+    legacy = json.loads((tmp_path / "a" / "meals.json").read_text(encoding="utf-8"))
+    assert MealJournal(str(tmp_path / "a" / "meals")).read_all() == legacy
@@ -83,10 +83,13 @@ def test_ensure_file_with_defaults_creates_new_file(
         app.PRODUCTS_LIST_RU = temp_file_path
     else:
         app.PRODUCTS_LIST_EN = temp_file_path
+    app.notify = MagicMock()
 
     result = app.ensure_file_with_defaults(language)
     assert isinstance(result, dict)
     assert expected_key in result
+    app.notify.assert_called_once()
+    app.info_message.assert_not_called()
 
     with open(temp_file_path, encoding="utf-8") as f:
         data = json.load(f)
@@ -155,6 +158,7 @@ def test_write_default_ioerror_handling(mock_open, mocks, instance):
     data_defaults = instance(DataDefaults, language="ru")
     data_defaults.log = MagicMock()
     data_defaults.info_message = MagicMock()
+    data_defaults.notify = MagicMock()
     data_defaults.error_message = MagicMock()
 
     result = data_defaults.ensure_file_with_defaults("ru")
@@ -165,6 +169,7 @@ def test_write_default_ioerror_handling(mock_open, mocks, instance):
 
     # Успешное сообщение не должно быть вызвано
     assert data_defaults.info_message.call_count == 0
+    data_defaults.notify.assert_not_called()
 
 
 @patch("builtins.open", create=True)
@@ -1,5 +1,6 @@
+import json
 import tkinter as tk
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -93,29 +94,34 @@ def test_restore_window_invalid(instance, window, method, msg):
         app.restore_root_window(window, method)
 
 
-@patch("os.path.exists", return_value=True)
-def test_save_results(_, instance, tmp_path):
+def test_save_results(instance, tmp_path):
     app = instance(Factory)
-    file_path = tmp_path / "test.json"
-
-    app.read_and_write_file = MagicMock(
-        side_effect=lambda path, mode, data=None: ([] if mode == "r" else None)
-    )
+    journal_dir = tmp_path / "meals"
 
     app.info_message = MagicMock()
+    app.notify = MagicMock()
     app.error_message = MagicMock()
 
     entries = [("Яблоко", 150.0, 78.0), ("Банан", 200.0, 120.0)]
 
-    app.save_results(str(file_path), entries)
-    app.read_and_write_file.assert_any_call(str(file_path), "r")
-    app.read_and_write_file.assert_any_call(str(file_path), "w", ANY)
-    app.info_message.assert_called_once()
+    app.save_results(str(journal_dir), entries)
+    app.save_results(str(journal_dir), entries)
+    assert app.notify.call_count == 2
+    assert app.notify.call_args.kwargs["key"] == "meals.saved"
+    app.info_message.assert_not_called()
     app.error_message.assert_not_called()
 
+    # Записи дописываются в файл текущего месяца, по строке на приём пищи
+    month_files = list(journal_dir.glob("*.jsonl"))
+    assert len(month_files) == 1
+    lines = month_files[0].read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["total"] == 198.0
+    assert (journal_dir / "manifest.json").exists()
+
     # --- INVALID INPUT --- #
     bad_entries = [("Плохое", 123)]
-    app.save_results(str(file_path), bad_entries)
+    app.save_results(str(journal_dir), bad_entries)
     app.error_message.assert_called_with(
         "Ошибка", "Некорректный формат данных для сохранения."
     )
@@ -0,0 +1,92 @@
+import tkinter as tk
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import theme
+from data_defaults import DataDefaults
+from theme import STYLES, _darker, apply_theme
+
+
+@pytest.fixture(autouse=True)
+def fresh_theme():
+    theme._themed_roots.clear()
+    yield
+    theme._themed_roots.clear()
+
+
+@pytest.fixture
+def style():
+    with patch("theme.ttk.Style") as style_cls:
+        style_cls.return_value.theme_names.return_value = ("default", "clam")
+        yield style_cls
+
+
+def test_styles_registered_once_per_interpreter(style):
+    root = MagicMock(spec=tk.Tk)
+    toplevel = MagicMock(spec=tk.Toplevel)
+    toplevel._root.return_value = root
+
+    apply_theme(root)
+    apply_theme(toplevel)
+    apply_theme(root)
+
+    style.assert_called_once_with(root)
+    configured = [c.args[0] for c in style.return_value.configure.call_args_list]
+    assert configured == [".", *STYLES]
+    style.return_value.theme_use.assert_called_once_with("clam")
+
+
+def test_button_styles_have_pressed_state(style):
+    apply_theme(MagicMock(spec=tk.Tk))
+
+    mapped = {c.args[0]: c.kwargs for c in style.return_value.map.call_args_list}
+    assert mapped["Danger.TButton"]["background"] == [("active", _darker(theme.RED))]
+    assert "Body.TLabel" not in mapped
+
+
+def test_missing_base_theme_is_skipped(style):
+    style.return_value.theme_names.return_value = ("aqua",)
+
+    apply_theme(MagicMock(spec=tk.Tk))
+
+    style.return_value.theme_use.assert_not_called()
+
+
+def test_labels_and_button_frames_use_window_background(style):
+    apply_theme(MagicMock(spec=tk.Tk), background="#123456")
+
+    configured = {
+        c.args[0]: c.kwargs for c in style.return_value.configure.call_args_list
+    }
+    assert configured["."]["background"] == "#123456"
+    assert configured["Body.TLabel"]["background"] == "#123456"
+    assert configured["Danger.TButton"]["background"] == theme.RED
+    assert configured["Danger.TButton"]["bordercolor"] == "#123456"
+
+
+def test_body_label_background_matches_window():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("нет дисплея для Tk")
+    try:
+        root.withdraw()
+        apply_theme(root, background="#f0f8ff")
+        style = theme.ttk.Style(root)
+
+        assert style.lookup("Body.TLabel", "background") == "#f0f8ff"
+        assert style.lookup("Success.TButton", "background") == theme.GREEN
+    finally:
+        root.destroy()
+
+
+def test_darker():
+    assert _darker("#ffffff", 0.5) == "#7f7f7f"
+
+
+def test_settings_reference_registered_styles(instance):
+    settings = instance(DataDefaults, language="ru")
+
+    for name in ("success", "danger", "info", "danger_small", "body"):
+        assert getattr(settings, name) in STYLES
@@ -0,0 +1,121 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gui_factory import WidgetBuilder
+from virtual_scroll import ScrollRegionUpdater, VirtualList, visible_range
+
+test_case = [
+    # top, height, row_height, count, expected
+    (0, 280, 28, 1000, (0, 11)),
+    (28 * 500, 280, 28, 1000, (500, 511)),
+    (28 * 995, 280, 28, 1000, (995, 1000)),
+    (0, 280, 28, 3, (0, 3)),
+    (0, 1, 28, 1000, (0, 2)),
+    (-10, 280, 28, 1000, (0, 11)),
+    (0, 280, 28, 0, (0, 0)),
+]
+
+
+@pytest.mark.parametrize("top, height, row_height, count, expected", test_case)
+def test_visible_range(top, height, row_height, count, expected):
+    assert visible_range(top, height, row_height, count) == expected
+
+
+def test_scrollregion_updates_are_coalesced():
+    canvas = MagicMock()
+    updater = ScrollRegionUpdater(canvas, interval=16)
+
+    for height in (28, 56, 84):
+        updater.schedule(MagicMock(width=300, height=height))
+
+    canvas.after.assert_called_once_with(16, updater.flush)
+    updater.flush()
+    canvas.configure.assert_called_once_with(scrollregion=(0, 0, 300, 84))
+    canvas.bbox.assert_not_called()
+
+    updater.schedule()
+    assert canvas.after.call_count == 2
+
+
+@pytest.fixture
+def canvas():
+    with patch("tkinter.Canvas") as canvas_cls, patch("tkinter.Scrollbar"):
+        canvas = canvas_cls.return_value
+        canvas.winfo_width.return_value = 300
+        canvas.winfo_height.return_value = 280
+        canvas.canvasy.return_value = 0
+        canvas.create_window.side_effect = range(1, 1000)
+        yield canvas
+
+
+def make_list(model, bound):
+    return VirtualList(
+        MagicMock(),
+        model,
+        create_row=lambda parent: MagicMock(),
+        bind_row=lambda widget, item, index: bound.append((item, index)),
+        row_height=28,
+    )
+
+
+def test_virtual_list_materialises_only_visible_rows(canvas):
+    bound = []
+    model = [f"Продукт {i}" for i in range(100_000)]
+    view = make_list(model, bound)
+
+    view.render()
+
+    assert len(view.rows) == 11
+    assert bound[0] == ("Продукт 0", 0)
+    assert view.shown == (0, 11)
+    canvas.configure.assert_any_call(scrollregion=(0, 0, 300, 28 * 100_000))
+
+
+def test_virtual_list_recycles_rows_on_scroll(canvas):
+    bound = []
+    view = make_list(range(1000), bound)
+    view.render()
+    bound.clear()
+
+    canvas.canvasy.return_value = 28 * 400
+    view.render()
+
+    assert len(view.rows) == 11
+    assert canvas.create_window.call_count == 11
+    assert bound[0] == (400, 400)
+    canvas.coords.assert_called_with(view.rows[-1][1], 0, 28 * 410)
+
+
+def test_virtual_list_hides_unused_rows(canvas):
+    bound = []
+    view = make_list(range(1000), bound)
+    view.render()
+
+    view.set_model(range(3))
+    view.render()
+
+    assert view.shown == (0, 3)
+    canvas.itemconfigure.assert_called_with(view.rows[-1][1], state="hidden")
+
+
+def test_virtual_list_renders_once_per_idle(canvas):
+    view = make_list(range(10), [])
+
+    view.schedule()
+    view.schedule()
+
+    canvas.after_idle.assert_called_once_with(view.render)
+
+
+def test_virtual_list_rejects_bad_row_height(canvas):
+    with pytest.raises(ValueError, match="Высота строки"):
+        VirtualList(MagicMock(), [], MagicMock(), MagicMock(), row_height=0)
+
+
+def test_builder_creates_virtual_list(instance, canvas):
+    builder = instance(WidgetBuilder, bg_color="#f0f8ff")
+
+    view = builder.create_virtual_list(MagicMock(), [], MagicMock(), MagicMock())
+
+    assert isinstance(view, VirtualList)
@@ -224,3 +224,17 @@ def test_create_widgets_without_frame(instance, cls):
 
     with pytest.raises(ValueError, match=re.escape(expected_message)):
         app.create_widgets(cls=cls, frame=None)
+
+
+def test_setup_window_configures_existing_window(instance):
+    app = instance(WidgetFactory, bg_color="#f0f8ff")
+    window = MagicMock()
+    with patch("gui_factory.set_window_icon") as mock_icon:
+        result = app.setup_window(window, title="Меню", size="500x350")
+
+    assert result is window
+    window.title.assert_called_once_with("Меню")
+    window.geometry.assert_called_once_with("500x350")
+    window.resizable.assert_called_once_with(False, False)
+    window.configure.assert_called_once_with(bg="#f0f8ff")
+    mock_icon.assert_called_once_with(window)
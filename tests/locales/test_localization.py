@@ -4,6 +4,7 @@ from unittest.mock import ANY, MagicMock, patch
 import pytest
 
 from localization import Localization, SetupLanguage
+from translations import registry
 
 
 @pytest.fixture
@@ -11,6 +12,15 @@ def error():
     return MagicMock()
 
 
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    # Реестр общий для приложения: каталоги из других тестов не должны
+    # подменять замоканный gettext.translation
+    registry.clear()
+    yield
+    registry.clear()
+
+
 @pytest.mark.parametrize("language", ["en", "ru"])
 def test_setup_language_valid(monkeypatch, instance, language):
     mock_translation = MagicMock()
@@ -57,26 +67,29 @@ def test_on_close_without_root(monkeypatch, instance, error):
 
 
 @patch("localization.MainController")
-@patch("localization.DataDefaults")
-@patch("localization.ProductManager")
-@patch("localization.ProductContext")
-@patch("localization.Factory")
 @pytest.mark.parametrize("language", ["en", "ru"])
-def test_start_with_root_calls_destroy(
-    mock_factory, mock_context, mock_manager, mock_data, mock_main, language, instance
-):
+def test_start_with_root_reuses_window(mock_main, language, instance):
     cmd = instance(Localization)
     cmd.root = MagicMock()
+    picker = MagicMock()
+    cmd.root.winfo_children.return_value = [picker]
     cmd.start_application_with_language(language, cmd.root)
 
-    mock_factory.assert_called_once_with(language)
-    mock_factory.return_value.window_status.assert_called_with(cmd.root, "hide")
-    mock_context.assert_called_once_with(language)
-    mock_manager.assert_called_once_with(mock_context.return_value)
-    mock_data.assert_called_once_with(language)
-    cmd.root.destroy.assert_called_once()
+    picker.destroy.assert_called_once()
+    cmd.root.destroy.assert_not_called()
     mock_main.assert_called_once_with(language)
-    mock_main.return_value.run.assert_called_once()
+    # меню строится в цикле событий окна выбора, без вложенного mainloop
+    mock_main.return_value.build.assert_called_once_with(cmd.root)
+    mock_main.return_value.run.assert_not_called()
+    assert cmd.main is mock_main.return_value
+
+
+@patch("localization.MainController")
+def test_start_without_root_creates_window(mock_main, instance):
+    cmd = instance(Localization)
+    cmd.start_application_with_language("ru")
+
+    mock_main.return_value.run.assert_called_once_with()
 
 
 @patch(
@@ -121,6 +134,10 @@ def test_get_lang_code_behavior(mock_start, mock_setup, mock_write, instance):
 
     mock_write.assert_called_once_with("en")
     mock_setup.assert_called_once_with("en")
+    mock_start.assert_not_called()
+
+    (start,) = app.root.after_idle.call_args.args
+    start()
     mock_start.assert_called_once_with("en", app.root)
 
 
@@ -170,3 +187,17 @@ def test_init_window(instance, mock_tkinter):
         0, weight=1
     )
     mock_tkinter["tk_instance"].mainloop.assert_called_once()
+
+
+def test_init_window_shuts_down_menu_after_loop(instance, mock_tkinter):
+    cmd = instance(Localization)
+    main = MagicMock()
+
+    def choose_language():
+        cmd.main = main  # меню открыто кнопкой выбора языка
+
+    mock_tkinter["tk_instance"].mainloop.side_effect = choose_language
+    cmd.init_window()
+
+    mock_tkinter["tk_instance"].mainloop.assert_called_once()
+    main.shutdown.assert_called_once()
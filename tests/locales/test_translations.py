@@ -0,0 +1,99 @@
+import builtins
+from unittest.mock import MagicMock
+
+import pytest
+
+from translations import UI_STRINGS, StringTable, TranslationRegistry
+
+
+@pytest.fixture
+def translation(monkeypatch):
+    catalogs = {}
+
+    def fake_translation(domain, localedir, languages, fallback):
+        return catalogs.setdefault(languages[0], MagicMock(name=languages[0]))
+
+    mock = MagicMock(side_effect=fake_translation)
+    monkeypatch.setattr("gettext.translation", mock)
+    return mock
+
+
+def test_catalog_loaded_once(translation):
+    registry = TranslationRegistry()
+
+    assert registry.get("en") is registry.get("en")
+    registry.activate("en")
+    registry.activate("ru")
+    registry.activate("en")
+
+    assert translation.call_count == 2
+    assert registry.get("en").install.call_count == 2
+
+
+def test_activate_notifies_listeners_on_change(translation):
+    registry = TranslationRegistry()
+    listener = MagicMock()
+    registry.subscribe(listener)
+
+    registry.activate("ru")  # первый запуск — не переключение
+    registry.activate("ru")
+    registry.activate("en")
+
+    listener.assert_called_once_with("en")
+    assert registry.language == "en"
+
+    registry.unsubscribe(listener)
+    registry.activate("ru")
+    listener.assert_called_once()
+
+
+def test_clear_drops_catalogs(translation):
+    registry = TranslationRegistry()
+    registry.get("en")
+    registry.clear()
+    registry.get("en")
+
+    assert translation.call_count == 2
+
+
+def test_real_catalog_translates():
+    catalog = TranslationRegistry().get("en")
+    assert catalog.gettext("Главное Меню") == "Main Menu"
+
+
+def test_string_table_resolved_once():
+    translate = MagicMock(side_effect=str.upper)
+    table = StringTable(translate)
+    assert translate.call_count == len(UI_STRINGS)
+
+    assert table["Назад"] == "НАЗАД"
+    assert table["Назад"] == "НАЗАД"
+    assert translate.call_count == len(UI_STRINGS)
+
+    # Строка вне таблицы переводится один раз и запоминается
+    assert table["Прочее"] == "ПРОЧЕЕ"
+    assert table["Прочее"] == "ПРОЧЕЕ"
+    assert translate.call_count == len(UI_STRINGS) + 1
+
+
+def test_string_table_reports_untranslated():
+    table = StringTable(lambda s: "Back" if s == "Назад" else s)
+    missing = table.untranslated()
+    assert "Назад" not in missing
+    assert "Ошибка" in missing
+
+
+def test_activate_swaps_string_table(monkeypatch):
+    # activate() устанавливает настоящий каталог в builtins._ — вернём его
+    monkeypatch.setattr(builtins, "_", getattr(builtins, "_", str), raising=False)
+    registry = TranslationRegistry()
+    assert registry.strings["Назад"] == "Назад"
+
+    registry.activate("en")
+    assert registry.strings["Назад"] == "Back"
+    assert registry.strings.untranslated() == []
+
+    registry.activate("ru")
+    assert registry.strings["Назад"] == "Назад"
+    registry.clear()
+    assert registry.strings["Назад"] == "Назад"
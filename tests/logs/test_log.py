@@ -1,7 +1,7 @@
 import logging
 from unittest.mock import MagicMock, patch
 
-from log import setup_logger
+from log import LazyQueueHandler, setup_logger, shutdown_logger
 
 
 def test_logger_return_if_already_initialized(tmp_path):
@@ -31,4 +31,42 @@ def test_logger_return_if_already_initialized(tmp_path):
         assert mock_handler_cls.call_count == 1  # не добавился новый
 
     # Восстановим оригинальные обработчики
+    shutdown_logger()
     logger.handlers = original_handlers
+
+
+def test_queue_pipeline_writes_traceback_on_shutdown(tmp_path):
+    temp_log_path = tmp_path / "app.log"
+    logger = logging.getLogger()
+    original_handlers = logger.handlers[:]
+    logger.handlers.clear()
+
+    try:
+        setup_logger(log_path=str(temp_log_path))
+        assert isinstance(logger.handlers[0], LazyQueueHandler)
+
+        try:
+            raise ValueError("Тестовая Ошибка")
+        except ValueError:
+            logging.getLogger("test").error("Сбой", exc_info=True)
+    finally:
+        shutdown_logger()
+        logger.handlers = original_handlers
+
+    text = temp_log_path.read_text(encoding="utf-8")
+    assert "[ERROR] Сбой" in text
+    assert "Traceback" in text and "ValueError: Тестовая Ошибка" in text
+
+
+def test_lazy_handler_keeps_record_unformatted():
+    handler = LazyQueueHandler(MagicMock())
+    error = ValueError("x")
+    record = logging.LogRecord(
+        "t", logging.ERROR, __file__, 1, "Сбой", None, (ValueError, error, None)
+    )
+
+    prepared = handler.prepare(record)
+
+    # Трейсбек не форматируется в вызывающем потоке
+    assert prepared is record
+    assert prepared.exc_info[1] is error and prepared.exc_text is None
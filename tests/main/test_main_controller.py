@@ -17,6 +17,8 @@ class MockController:
             patch("main_controller.Factory"),
             patch("main_controller.WidgetBuilder"),
             patch("main_controller.StatsManager"),
+            patch("main_controller.BackgroundRunner"),
+            patch("main_controller.StallMonitor"),
             patch("main_controller.tk.Tk") as mock_tk,
         ):
 
@@ -35,10 +37,9 @@ class MockController:
         self.attrs = {
             "frame_grid": {"padx": 10},
             "button_grid": {"sticky": "ew"},
-            "font_12": {"font": "Arial"},
-            "green": {"bg": "green"},
-            "red": {"bg": "red"},
-            "blue": {"bg": "blue"},
+            "success": "Success.TButton",
+            "danger": "Danger.TButton",
+            "info": "Info.TButton",
         }
 
     def _set_mocks(self, mock_tk):
@@ -65,18 +66,20 @@ class MockController:
 
         self.main.manager.root_for_window = MagicMock()
 
-        self.main.stats_manager.get_stats_by_period = MagicMock()
+        self.main.stats_manager.get_totals_by_period = MagicMock()
 
 
 test_case = [
-    ("Выход", 0, {"bg": "red"}),
-    ("Exit", 0, {"bg": "red"}),
-    ("Cбросить Языковые Настройки", 0, {"bg": "blue"}),
-    ("Reset Language Settings", 0, {"bg": "blue"}),
-    ("Назад", 1, {"bg": "red"}),
-    ("Back", 1, {"bg": "red"}),
-    ("Рассчитать", 1, {"bg": "blue"}),
-    ("Calculate", 1, {"bg": "blue"}),
+    ("Выход", 0, "Danger.TButton"),
+    ("Exit", 0, "Danger.TButton"),
+    ("Cбросить Языковые Настройки", 0, "Info.TButton"),
+    ("Reset Language Settings", 0, "Info.TButton"),
+    ("Назад", 1, "Danger.TButton"),
+    ("Back", 1, "Danger.TButton"),
+    ("Рассчитать", 1, "Info.TButton"),
+    ("Calculate", 1, "Info.TButton"),
+    ("Рассчитать калории", 0, "Success.TButton"),
+    ("+ Добавить продукт", 1, "Success.TButton"),
 ]
 test_case_2 = [
     ("Рассчитать Калории", "500x500"),
@@ -106,6 +109,7 @@ def test_run_method(controller):
     controller.open_calculate_window = MagicMock()
     controller.open_manager_products_menu = MagicMock()
     controller.open_stats_menu = MagicMock()
+    controller.switch_language = MagicMock()
 
     controller.run()
 
@@ -119,7 +123,7 @@ def test_run_method(controller):
     assert controller.create_buttons.call_count == 1
 
     with patch("main_controller.MainController.create_buttons"):
-        assert controller.builder.create_button.call_count == 5
+        assert controller.builder.create_button.call_count == 6
 
     commands = [
         controller.open_calculate_window,
@@ -127,6 +131,7 @@ def test_run_method(controller):
         controller.open_stats_menu,
         controller.factory.on_close,
         controller.factory.reset_config_settings,
+        controller.switch_language,
     ]
 
     for idx, call in enumerate(controller.builder.create_button.call_args_list):
@@ -147,16 +152,7 @@ def test_run_method(controller):
 
 @pytest.mark.parametrize("text, case, expected", test_case)
 def test_get_button_style(controller, text, case, expected):
-    base_style = {"font": "Arial", "bg": "green"}
-
-    result = controller.get_button_style(text, case)
-
-    assert result["font"] == base_style["font"]
-
-    if expected:
-        assert result["bg"] == expected["bg"]
-    else:
-        assert result["bg"] == base_style["bg"]
+    assert controller.get_button_style(text, case) == expected
 
 
 @pytest.mark.parametrize("text, size", test_case_2)
@@ -194,7 +190,8 @@ def test_open_calculate_window(controller, products_exist):
             _("Ошибка"), _("Нет продуктов для расчёта.")
         )
     else:
-        controller._win_ = MagicMock()
+        mock_win = MagicMock()
+        controller._win_ = MagicMock(return_value=mock_win)
         controller.builder.create_frame.return_value = MagicMock()
         controller.builder.create_scrollable_frame.return_value = MagicMock()
         controller.root = MagicMock()
@@ -211,7 +208,8 @@ def test_open_calculate_window(controller, products_exist):
 
         back_command = controller.builder.create_button.call_args_list[2].args[2]
         back_command()
-        controller.factory.restore_root_window.assert_called_once()
+        mock_win.withdraw.assert_called_once()
+        controller.root.deiconify.assert_called_once()
 
 
 def test_open_manager_products_menu(controller):
@@ -234,7 +232,45 @@ def test_open_manager_products_menu(controller):
 
     back_command = controller.builder.create_button.call_args_list[3].kwargs["command"]
     back_command()
-    controller.factory.restore_root_window.assert_called_once()
+    mock_win.withdraw.assert_called_once()
+    controller.root.deiconify.assert_called_once()
+
+
+def test_calculate_window_is_reused_with_fresh_row(controller):
+    mock_win = MagicMock()
+    area = MagicMock()
+    controller._win_ = MagicMock(return_value=mock_win)
+    controller.builder.create_scrollable_frame.return_value = area
+    controller.manager.products = ["product1"]
+    controller.root = MagicMock()
+
+    controller.open_calculate_window()
+    rows = controller.product_rows
+    rows.clear = MagicMock()
+    controller.add_product_row()
+
+    controller.open_calculate_window()
+
+    controller._win_.assert_called_once()
+    rows.clear.assert_called_once()
+    area.winfo_children.assert_not_called()
+    assert controller.calculator.create_input_product_row.call_count == 3
+    controller.calculator.create_input_product_row.assert_called_with(rows, area)
+    mock_win.deiconify.assert_called_once()
+    controller.root.withdraw.assert_called_once()
+
+
+def test_rerender_drops_pooled_windows(controller):
+    controller.root = MagicMock()
+    controller.root.winfo_children.return_value = []
+    controller.main_frame = MagicMock()
+    controller._win_ = MagicMock(return_value=MagicMock())
+
+    controller.open_manager_products_menu()
+    controller.rerender()
+    controller.open_manager_products_menu()
+
+    assert controller._win_.call_count == 2
 
 
 def test_show_error_calls_error_message_and_logger(controller):
@@ -244,7 +280,8 @@ def test_show_error_calls_error_message_and_logger(controller):
         mock_logger.error.assert_called_once_with("Test: Best")
 
 
-def test_open_stats_menu(controller):
+@patch("main_controller.rolling_stats.build_overlays")
+def test_open_stats_menu(build_overlays, controller):
     mock_win = MagicMock()
     mock_frame = MagicMock()
     controller._win_ = MagicMock(return_value=mock_win)
@@ -256,13 +293,20 @@ def test_open_stats_menu(controller):
     stats_month = MagicMock()
     stats_all = MagicMock()
 
-    controller.stats_manager.get_stats_by_period.side_effect = [
+    controller.stats_manager.get_totals_by_period.side_effect = [
         stats_week,
         stats_month,
         stats_all,
     ]
 
     controller.show_stats_window = MagicMock()
+    controller.settings.ROLLING_WINDOW = 7
+    controller.settings.DAILY_TARGET = 2000.0
+    overlays = build_overlays.return_value
+    # Фоновый пул выполняем синхронно, чтобы проверить доставку результата
+    controller.runner.submit.side_effect = lambda widget, func, on_done, *a: on_done(
+        func()
+    )
 
     controller.open_stats_menu()
 
@@ -289,38 +333,118 @@ def test_open_stats_menu(controller):
 
         style = call.kwargs["style"]
         if button_texts[idx] in ["Назад", "Back"]:
-            assert style["bg"] == controller.settings.red["bg"]
+            assert style == controller.settings.danger
+        elif call.kwargs["command"] is None:
+            assert style == controller.settings.info
         else:
-            assert style["bg"] == controller.settings.green["bg"]
-        assert style["font"] == controller.settings.font_12["font"]
+            assert style == controller.settings.success
 
     # Проверка, что колбэки вызываются корректно
     # Статистика за 7 дней
     call_7_days = controller.builder.create_button.call_args_list[0]
     call_7_days.kwargs["command"]()
-    controller.show_stats_window.assert_any_call("7 дней", stats_week)
+    controller.show_stats_window.assert_any_call(
+        "7 дней", stats_week, chart=ANY, overlays=overlays
+    )
+    controller.runner.cancel_for.assert_called_with(mock_frame)
 
     # Статистика за 30 дней
     call_30_days = controller.builder.create_button.call_args_list[1]
     call_30_days.kwargs["command"]()
-    controller.show_stats_window.assert_any_call("30 дней", stats_month)
+    controller.show_stats_window.assert_any_call(
+        "30 дней", stats_month, chart=ANY, overlays=overlays
+    )
 
     # Пропускаем кнопку без команды (индекс 2)
 
     # Статистика за всё время
     call_all_time = controller.builder.create_button.call_args_list[3]
     call_all_time.kwargs["command"]()
-    controller.show_stats_window.assert_any_call("Все время", stats_all)
+    controller.show_stats_window.assert_any_call(
+        "Все время", stats_all, chart=ANY, overlays=overlays
+    )
+    build_overlays.assert_any_call(stats_week, 7, 2000.0)
+    assert build_overlays.call_count == 3
 
     # Назад
     call_back = controller.builder.create_button.call_args_list[4]
     call_back.kwargs["command"]()
-    controller.factory.restore_root_window.assert_called_once_with(
-        controller.root, mock_win
-    )
+    mock_win.withdraw.assert_called_once()
+    controller.root.deiconify.assert_called_once()
+
+    # Закрытие окна отменяет незавершённые запросы
+    close_callback = mock_win.protocol.call_args[0][1]
+    close_callback()
+    controller.factory.on_close.assert_called_once_with(controller.root, mock_win)
 
     # Проверка настройки сетки
     assert mock_frame.grid_rowconfigure.call_count == 6  # кнопок 5 + 1
     mock_frame.grid_columnconfigure.assert_called_once_with(0, weight=1)
     mock_win.grid_rowconfigure.assert_called_once_with(0, weight=1)
     mock_win.grid_columnconfigure.assert_called_once_with(0, weight=1)
+
+
+@patch("main_controller.registry")
+@patch("main_controller.write_config")
+def test_switch_language(mock_write, mock_registry, controller):
+    controller.language = "ru"
+
+    controller.switch_language()
+    mock_write.assert_called_once_with("en")
+    mock_registry.activate.assert_called_once_with("en")
+
+    controller.switch_language("ru")  # уже активен — ничего не делаем
+    mock_write.assert_called_once()
+
+
+def test_apply_language_swaps_catalog_and_rerenders(controller):
+    products = {"Apples": 52.0}
+    old_frame = MagicMock()
+    toplevel = MagicMock(spec=tk.Toplevel)
+    controller.root = MagicMock()
+    controller.root.winfo_children.return_value = [old_frame, toplevel]
+    controller.main_frame = old_frame
+    controller.manager.switch_language.return_value = products
+
+    controller.apply_language("en")
+
+    assert controller.language == "en"
+    controller.manager.switch_language.assert_called_once_with("en")
+    assert controller.calculator.products is products
+    controller.runner.cancel_all.assert_called_once()
+    toplevel.destroy.assert_called_once()
+    old_frame.destroy.assert_called_once()
+    assert controller.main_frame is controller.builder.create_frame.return_value
+    controller.create_buttons.assert_called_once_with(controller.main_frame)
+    controller.factory.window_status.assert_called_with(controller.root, "show")
+
+
+def test_preload_stats_runs_in_background(controller):
+    controller.root = MagicMock()
+    controller.stats_manager.loaded = False
+
+    controller.preload_stats()
+
+    controller.runner.submit.assert_called_once()
+    args, kwargs = controller.runner.submit.call_args
+    assert args == (controller.root, controller.stats_manager.preload)
+
+    controller.runner.submit.reset_mock()
+    controller.stats_manager.loaded = True
+    controller.preload_stats()
+    controller.runner.submit.assert_not_called()
+
+
+def test_build_reuses_existing_root(controller):
+    picker_root = MagicMock()
+    controller.builder.setup_window.return_value = picker_root
+
+    controller.build(picker_root)
+
+    controller.builder.create_widgets.assert_not_called()
+    controller.builder.setup_window.assert_called_once_with(
+        picker_root, title=_("Главное Меню"), size="500x350"
+    )
+    assert controller.root is picker_root
+    # цикл событий уже идёт в окне выбора языка
+    picker_root.mainloop.assert_not_called()
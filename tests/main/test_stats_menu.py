@@ -4,6 +4,7 @@ import pytest
 from matplotlib.figure import Figure
 
 from main_controller import MainController
+from rolling_stats import build_overlays
 
 
 @pytest.fixture
@@ -20,7 +21,7 @@ def test_show_stats_window_empty_stats(controller):
     controller.builder.create_scrollable_frame.return_value = mock_frame
     controller.builder.create_label = MagicMock()
     controller.settings.label_grid = {"padx": 5}
-    controller.settings.font_10 = {"font": "Arial"}
+    controller.settings.body = "Body.TLabel"
 
     controller.show_stats_window("Test Title", [])
 
@@ -31,7 +32,7 @@ def test_show_stats_window_empty_stats(controller):
         mock_frame,
         text="Нет данных за указанный период",
         grid={"padx": 5},
-        style={"font": "Arial"},
+        style="Body.TLabel",
     )
 
 
@@ -84,3 +85,53 @@ def test_show_stats_window_with_data(mock_canvas, mock_plt, controller):
     mock_frame.grid_columnconfigure.assert_called_once_with(0, weight=1)
     mock_win.grid_rowconfigure.assert_called_once_with(0, weight=1)
     mock_win.grid_columnconfigure.assert_called_once_with(0, weight=1)
+
+
+@patch("main_controller.plt")
+@patch("main_controller.FigureCanvasTkAgg")
+def test_show_stats_window_with_overlays(mock_canvas, mock_plt, controller):
+    mock_ax = MagicMock()
+    mock_plt.subplots.return_value = (MagicMock(spec=Figure), mock_ax)
+    controller._win_ = MagicMock()
+    controller.builder = MagicMock()
+
+    stats = [
+        {"timestamp": "2025-06-01T12:00:00", "total": 1500.0},
+        {"timestamp": "2025-06-03T12:00:00", "total": 2500.0},
+    ]
+    overlays = build_overlays(stats, window=7, target=2000.0)
+
+    controller.show_stats_window("Stats Title", stats, overlays=overlays)
+
+    # Скользящее среднее рисуется по всем дням, включая пропущенный
+    average_call = mock_ax.plot.call_args_list[0]
+    assert average_call.args[0] == ["2025-06-01", "2025-06-02", "2025-06-03"]
+    assert mock_ax.plot.call_count == 2
+    mock_ax.axhline.assert_called_once()
+    # пропущенный день серию не продлевает
+    assert "1 дн." in mock_ax.text.call_args.args[2]
+
+
+@patch("main_controller.plt")
+@patch("main_controller.FigureCanvasTkAgg")
+def test_show_stats_window_lists_entries_virtually(mock_canvas, mock_plt, controller):
+    mock_plt.subplots.return_value = (MagicMock(spec=Figure), MagicMock())
+    controller._win_ = MagicMock()
+    controller.builder = MagicMock()
+    stats = [
+        {"timestamp": f"2025-06-01T12:{minute:02d}:00", "total": 100.0}
+        for minute in range(60)
+    ]
+
+    controller.show_stats_window("Stats Title", stats)
+
+    container = controller.builder.create_frame.return_value
+    call = controller.builder.create_virtual_list.call_args
+    parent, model, _create_row, bind_row = call.args
+    assert parent is container
+    assert model is stats  # строки не создаются на каждую запись
+    assert call.kwargs["row_height"] == 24
+
+    label = MagicMock()
+    bind_row(label, stats[5], 5)
+    label.configure.assert_called_once_with(text="2025-06-01 12:05   100.00")
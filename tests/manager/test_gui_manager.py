@@ -147,7 +147,7 @@ def test_open_add_products_window(
         app.error_message.assert_called_once_with(title, msg)
 
     btn.click(1)
-    app.factory.restore_root_window.assert_called()
+    btn.window.withdraw.assert_called_once()
 
 
 @pytest.mark.parametrize("name, title, msg", test_case_4)
@@ -168,7 +168,7 @@ def test_open_del_products_window(instance, context, fake_root, name, title, msg
         app.error_message.assert_called_once_with(title, msg)
 
     btn.click(1)
-    app.factory.restore_root_window.assert_called()
+    btn.window.withdraw.assert_called_once()
 
 
 @pytest.mark.parametrize("name, kcal, key, value, title, msg", test_case_5)
@@ -198,4 +198,21 @@ def test_open_change_products_window(
         ), f"Ожидался вызов error_message({title}, {msg}), но среди вызовов: {error_calls}"
 
     btn.click(1)
-    app.factory.restore_root_window.assert_called()
+    btn.window.withdraw.assert_called_once()
+
+
+@pytest.mark.parametrize("tag, method", test_case)
+def test_product_window_is_reused(instance, context, tag, method):
+    app = instance(ProductManagerGUI, context)
+    btn = ButtonCall(app, True)
+    root = MagicMock()
+
+    getattr(app, method)(root)
+    btn.click(1)
+    getattr(app, method)(root)
+
+    app.factory.create_widgets.assert_called_once()
+    btn.window.withdraw.assert_called_once()
+    btn.window.deiconify.assert_called_once()
+    root.deiconify.assert_called_once()
+    root.withdraw.assert_called_once()
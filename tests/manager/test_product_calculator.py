@@ -4,6 +4,7 @@ from unittest.mock import ANY, MagicMock
 import pytest
 
 from product_manager import ProductCalculator, ProductContext
+from product_rows import ProductRows
 
 
 @pytest.fixture
@@ -117,8 +118,9 @@ def test_create_and_remove_input_row(instance, context, fake_root):
 
     manager.builder.create_button = MagicMock(side_effect=mock_create_button)
     manager.builder.create_entry = MagicMock(return_value=mock_env.entry)
+    rows = ProductRows()
 
-    p_var, w_var = manager.create_input_product_row([], frame=mock_env.frame)
+    p_var, w_var = manager.create_input_product_row(rows, frame=mock_env.frame)
 
     manager.builder.create_button.assert_any_call(
         mock_env.frame,
@@ -131,15 +133,35 @@ def test_create_and_remove_input_row(instance, context, fake_root):
     manager.builder.create_entry.assert_called_once()
     manager.builder.create_button.assert_called_once()
 
-    p_var, w_var = manager.create_input_product_row(mock_env.data, frame=mock_env.frame)
+    second = manager.create_input_product_row(rows, frame=mock_env.frame)
 
     assert manager.builder.create_entry.call_count == 2
     assert manager.builder.create_button.call_count == 2
-
-    mock_env.data.append((p_var, w_var))
-    assert (p_var, w_var) in mock_env.data
+    assert list(rows) == [(p_var, w_var), second]
 
     remove_command_holder["command"]()
+    assert list(rows) == [(p_var, w_var)]
+    mock_env.button.grid_remove.assert_called()
+
+
+def test_removed_row_widgets_are_reused(instance, context, fake_root):
+    manager = instance(ProductCalculator, context)
+    mock_env = Assistant(manager, root=fake_root)
+    manager.builder.create_combobox = MagicMock()
+    rows = ProductRows()
+
+    manager.create_input_product_row(rows, frame=mock_env.frame)
+    p_var, w_var = manager.create_input_product_row(rows, frame=mock_env.frame)
+    w_var.set("250")
+    remove = manager.builder.create_button.call_args.kwargs["command"]
+    remove()
+
+    reused = manager.create_input_product_row(rows, frame=mock_env.frame)
+
+    assert reused == (p_var, w_var)
+    assert w_var.get() == ""
+    assert manager.builder.create_combobox.call_count == 2
+    assert len(rows) == 2
 
 
 @pytest.mark.parametrize("items, data, frame, msg", test_case_3)
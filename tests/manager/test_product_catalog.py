@@ -0,0 +1,100 @@
+import json
+import sys
+from array import array
+
+import pytest
+
+from autocomplete import Autocomplete
+from product_catalog import ProductCatalog
+
+
+@pytest.fixture
+def catalog():
+    return ProductCatalog({"Яблоки": 52, "бананы": 89.0, "Грибы": 22.5, "Груша": 57})
+
+
+def test_behaves_like_dict(catalog):
+    assert len(catalog) == 4
+    assert list(catalog) == ["Яблоки", "бананы", "Грибы", "Груша"]
+    assert catalog["Грибы"] == 22.5
+    assert "Груша" in catalog and "груша" not in catalog and None not in catalog
+    assert catalog.get("Нет", 0) == 0
+    assert catalog == {"Яблоки": 52, "бананы": 89.0, "Грибы": 22.5, "Груша": 57}
+    assert dict(catalog.items())["бананы"] == 89.0
+    assert list(catalog.values()) == [52.0, 89.0, 22.5, 57.0]
+    assert ProductCatalog() == {}
+    with pytest.raises(KeyError):
+        catalog["Нет"]
+
+
+def test_integer_kcal_stays_int(catalog):
+    assert type(catalog["Яблоки"]) is int and f"{catalog['Яблоки']}" == "52"
+    assert type(catalog["Грибы"]) is float
+    assert [type(kcal) for kcal in catalog.values()] == [int, int, float, int]
+    assert dict(catalog.items())["бананы"] == 89 and f"{catalog['бананы']}" == "89"
+
+
+def test_storage_is_compact(catalog):
+    assert isinstance(catalog._kcal, array)
+    assert not hasattr(catalog, "__dict__")
+    name = "".join(["Гри", "бы"])
+    assert sys.intern(name) is next(n for n in catalog if n == "Грибы")
+
+
+def test_mutations_bump_version(catalog):
+    version = catalog.version
+    catalog["Киви"] = 61
+    catalog["Грибы"] = 25.0
+    del catalog["Яблоки"]
+    assert catalog.version == version + 3
+    assert list(catalog) == ["бананы", "Грибы", "Груша", "Киви"]
+    assert catalog["Киви"] == 61 and catalog["Грибы"] == 25.0
+    assert "Яблоки" not in catalog and catalog["Груша"] == 57
+    with pytest.raises(KeyError):
+        del catalog["Яблоки"]
+    catalog.clear()
+    assert len(catalog) == 0 and catalog.version == version + 4
+
+
+def test_exact_lookups_skip_sorted_index(catalog):
+    catalog["Киви"] = 61
+    del catalog["бананы"]
+    assert catalog["Груша"] == 57 and "Киви" in catalog
+    assert catalog._positions == {"Яблоки": 0, "Грибы": 1, "Груша": 2, "Киви": 3}
+    assert catalog._folded is None  # строится только для подсказок и find()
+
+
+def test_failed_insert_leaves_catalog_intact(catalog):
+    with pytest.raises(TypeError):
+        catalog["Киви"] = "много"
+    assert "Киви" not in catalog and len(catalog) == 4
+
+
+def test_complete_and_find_ignore_case(catalog):
+    assert catalog.complete("гр") == ["Грибы", "Груша"]
+    assert catalog.complete("ГР", limit=1) == ["Грибы"]
+    assert catalog.complete("Б") == ["бананы"]
+    assert catalog.complete("х") == []
+    assert catalog.complete("  ", limit=2) == ["бананы", "Грибы"]  # тоже по алфавиту
+    assert catalog.find("ЯБЛОКИ ") == "Яблоки"
+    assert catalog.find("Киви") is None
+
+    catalog["Гранат"] = 72  # индекс подсказок перестраивается после изменения
+    assert catalog.complete("гр") == ["Гранат", "Грибы", "Груша"]
+
+
+def test_autocomplete_uses_catalog_index(catalog):
+    assert Autocomplete(limit=2).matches(catalog, "гр") == ["Грибы", "Груша"]
+
+
+def test_to_dict_keeps_json_format(catalog):
+    data = catalog.to_dict()
+    assert type(data) is dict
+    assert json.dumps(data, ensure_ascii=False) == json.dumps(
+        {"Яблоки": 52, "бананы": 89, "Грибы": 22.5, "Груша": 57}, ensure_ascii=False
+    )
+
+
+def test_rejects_non_mapping():
+    with pytest.raises(ValueError):
+        ProductCatalog(["Яблоки"])
@@ -21,6 +21,7 @@ class Assistant:
         self.instance.factory.read_and_write_file = MagicMock()
         self.instance.settings.ensure_file_with_defaults = MagicMock()
         self.instance.info_message = MagicMock()
+        self.instance.notify = MagicMock()
         self.instance.error_message = MagicMock()
         if mock_save:
             self.instance._save_products = MagicMock()
@@ -121,7 +122,10 @@ def test_save_products(instance, context, language, title, msg):
     manager.factory.read_and_write_file.assert_called_with(
         mock_env.file_path, "w", manager.products
     )
-    manager.info_message.assert_called_with(title, msg)
+    manager.notify.assert_called_once_with(
+        title, msg, key="products.saved", summary="Продукты сохранены: {count}"
+    )
+    manager.info_message.assert_not_called()
 
 
 @pytest.mark.parametrize("language, msg, init_language", test_case_2)
@@ -134,7 +138,7 @@ def test_save_products_errors(instance, context, language, msg, init_language):
         manager._save_products(language)
 
     manager.factory.read_and_write_file.assert_not_called()
-    manager.info_message.assert_not_called()
+    manager.notify.assert_not_called()
 
 
 @pytest.mark.parametrize("language, items", test_case_7)
@@ -221,3 +225,29 @@ def test_update_product_data_errors(instance, context, name, kcal, items, msg):
 
     assert manager.products == items
     manager._save_products.assert_not_called()
+
+
+@patch("product_manager.SUPPORTED_LANGUAGES", {"ru", "en"})
+def test_switch_language_uses_cached_catalogs(instance, context):
+    context.language = "ru"
+    manager = instance(ProductManager, context)
+    Assistant(manager, "ru")
+    ru_products = manager.products
+    manager._load_products_internal = MagicMock(return_value={"Bananas": 89.0})
+
+    assert manager.switch_language("en") == {"Bananas": 89.0}
+    assert manager.language == context.language == "en"
+
+    assert manager.switch_language("ru") is ru_products
+    assert manager.switch_language("en") == {"Bananas": 89.0}
+    manager._load_products_internal.assert_called_once_with("en")
+
+
+def test_switch_language_unsupported(instance, context):
+    context.language = "ru"
+    manager = instance(ProductManager, context)
+    Assistant(manager, "ru")
+
+    assert manager.switch_language("tr") is None
+    manager.error_message.assert_called_once()
+    assert manager.language == "ru"
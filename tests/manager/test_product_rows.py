@@ -0,0 +1,124 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from product_rows import ProductRow, ProductRows
+
+
+def make_row(rows: ProductRows) -> ProductRow:
+    row = ProductRow(MagicMock(), MagicMock())
+    row.widgets = (MagicMock(), MagicMock(), MagicMock())
+    return rows.add(row)
+
+
+@pytest.fixture
+def rows():
+    return ProductRows()
+
+
+def test_iterates_variable_pairs_in_order(rows):
+    added = [make_row(rows) for _ in range(3)]
+
+    assert list(rows) == [(r.product_var, r.weight_var) for r in added]
+    assert [r.key for r in added] == [0, 1, 2]
+    assert rows.next_row == 3
+
+
+def test_remove_hides_widgets_without_regridding_neighbours(rows):
+    first, middle, last = (make_row(rows) for _ in range(3))
+
+    rows.remove(middle)
+
+    assert list(rows) == [
+        (first.product_var, first.weight_var),
+        (last.product_var, last.weight_var),
+    ]
+    for widget in middle.widgets:
+        widget.grid_remove.assert_called_once()
+    for widget in first.widgets + last.widgets:
+        widget.grid.assert_not_called()
+        widget.grid_remove.assert_not_called()
+    assert rows.hidden == 1
+
+
+def test_remove_twice_is_ignored(rows):
+    row = make_row(rows)
+
+    rows.remove(row)
+    rows.remove(row)
+
+    assert rows.hidden == 1
+    assert len(rows) == 0
+
+
+def test_reuse_regrids_compactly_once_per_batch(rows):
+    first, second, third = (make_row(rows) for _ in range(3))
+    rows.remove(first)
+    rows.remove(second)
+
+    reused = [rows.reuse(), rows.reuse()]
+
+    assert reused == [second, first]
+    # раскладка отложена и запланирована один раз на всю пачку
+    second.widgets[0].after_idle.assert_called_once_with(rows.layout)
+    first.widgets[0].after_idle.assert_not_called()
+    for widget in first.widgets + second.widgets:
+        widget.grid.assert_not_called()
+
+    rows.layout()
+
+    for widget in third.widgets:
+        widget.grid.assert_called_once_with(row=0)
+    for widget in second.widgets:
+        widget.grid.assert_called_once_with(row=1)
+    for widget in first.widgets:
+        widget.grid.assert_called_once_with(row=2)
+    assert rows.next_row == 3
+    assert list(rows) == [(r.product_var, r.weight_var) for r in (third, second, first)]
+    assert rows.reuse() is None
+
+
+def test_rows_in_place_are_not_regridded(rows):
+    first, second = make_row(rows), make_row(rows)
+    rows.remove(second)
+    rows.reuse()
+
+    rows.layout()
+
+    for widget in first.widgets:
+        widget.grid.assert_not_called()
+    for widget in second.widgets:
+        widget.grid.assert_called_once_with(row=1)
+
+
+def test_indices_stay_bounded_on_recycling(rows):
+    row = make_row(rows)
+    for _ in range(100):
+        rows.remove(row)
+        row = rows.reuse()
+        rows.layout()
+
+    assert rows.next_row == 1
+    assert row.grid_row == 0
+
+
+def test_clear_hides_everything_and_restarts_numbering(rows):
+    added = [make_row(rows) for _ in range(3)]
+
+    rows.clear()
+
+    assert len(rows) == 0
+    assert rows.next_row == 0
+    assert rows.hidden == 3
+    assert rows.reuse() is added[0]
+
+
+def test_many_rows_stay_indexed(rows):
+    added = [make_row(rows) for _ in range(500)]
+    for row in added[::2]:
+        rows.remove(row)
+
+    assert len(rows) == 250
+    assert [pair for pair in rows] == [
+        (r.product_var, r.weight_var) for r in added[1::2]
+    ]
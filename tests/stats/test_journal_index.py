@@ -0,0 +1,99 @@
+from datetime import datetime
+
+import pytest
+
+import journal_index
+from journal_index import RECORD, JournalIndex, from_micros, to_micros
+from meal_journal import MealJournal
+
+
+def entry(timestamp, total=100.0):
+    return {"timestamp": timestamp, "items": [{"name": "apple"}], "total": total}
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = MealJournal(str(tmp_path / "meals"))
+    journal.append_many(
+        [
+            entry("2026-09-30T20:00:00", 1.0),
+            entry("2026-10-01T08:00:00", 2.0),
+            entry("2026-10-02T08:30:00.250000", 3.5),
+        ]
+    )
+    return journal
+
+
+def test_micros_roundtrip():
+    stamp = datetime(2026, 10, 2, 8, 30, 0, 250000)
+    assert from_micros(to_micros(stamp.isoformat())) == stamp
+
+
+def test_append_maintains_index(journal, tmp_path):
+    index = tmp_path / "meals" / "2026-10.idx"
+    assert index.stat().st_size == 2 * RECORD.size
+
+
+def test_totals_range_matches_journal(journal):
+    totals = journal.totals_range(datetime(2026, 10, 1), datetime(2026, 10, 31))
+
+    assert [(t["timestamp"], t["total"]) for t in totals] == [
+        ("2026-10-01T08:00:00", 2.0),
+        ("2026-10-02T08:30:00.250000", 3.5),
+    ]
+    assert all(t["partition"] == "2026-10" for t in totals)
+
+
+def test_totals_range_open_bounds(journal):
+    assert [t["total"] for t in journal.totals_range()] == [1.0, 2.0, 3.5]
+
+
+def test_read_entry_by_offset(journal):
+    light = journal.totals_range(datetime(2026, 10, 2), datetime(2026, 10, 3))[0]
+    assert journal.read_entry(light["partition"], light["offset"]) == entry(
+        "2026-10-02T08:30:00.250000", 3.5
+    )
+
+
+def test_missing_or_stale_index_is_rebuilt(journal, tmp_path):
+    folder = tmp_path / "meals"
+    (folder / "2026-10.idx").unlink()
+    # Индекс отстал от файла месяца: запись дописана в обход журнала
+    with open(folder / "2026-09.idx", "ab") as f:
+        f.write(RECORD.pack(0, 0, 0))
+
+    assert [t["total"] for t in journal.totals_range()] == [1.0, 2.0, 3.5]
+    assert (folder / "2026-10.idx").stat().st_size == 2 * RECORD.size
+    assert (folder / "2026-09.idx").stat().st_size == RECORD.size
+
+
+def test_index_survives_archiving(journal, tmp_path):
+    journal.archive_closed("gzip", now=datetime(2026, 10, 19))
+
+    light = journal.totals_range(datetime(2026, 9, 1), datetime(2026, 9, 30, 23, 59))
+    assert [t["total"] for t in light] == [1.0]
+    assert journal.read_entry("2026-09", light[0]["offset"]) == entry(
+        "2026-09-30T20:00:00", 1.0
+    )
+
+
+def test_load_without_numpy(journal, tmp_path, monkeypatch):
+    monkeypatch.setattr(journal_index, "np", None)
+
+    stamps, totals, offsets = JournalIndex(str(tmp_path / "meals")).load("2026-10")
+    assert list(totals) == [2.0, 3.5]
+    assert offsets[0] == 0
+    assert [t["total"] for t in journal.totals_range()] == [1.0, 2.0, 3.5]
+
+
+def test_rebuild_skips_lines_without_timestamp(tmp_path, caplog):
+    index = JournalIndex(str(tmp_path))
+    good = b'{"timestamp": "2026-10-01T08:00:00", "total": 5.0}\n'
+    lines = [b'{"total": 1.0}\n', good]
+
+    index.rebuild("2026-10", lines)
+
+    stamps, totals, offsets = index.load("2026-10")
+    assert list(totals) == [5.0]
+    assert list(offsets) == [len(lines[0])]
+    assert "без даты" in caplog.text
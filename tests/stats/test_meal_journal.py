@@ -0,0 +1,202 @@
+import json
+from datetime import datetime
+
+import pytest
+
+import meal_journal
+from meal_journal import MealJournal, get_journal, main
+
+
+def entry(timestamp, total=100.0):
+    return {"timestamp": timestamp, "items": [{"name": "apple"}], "total": total}
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return MealJournal(str(tmp_path / "meals"))
+
+
+def test_append_writes_month_partition_and_manifest(journal, tmp_path):
+    journal.append(entry("2026-10-01T08:00:00"))
+    journal.append(entry("2026-10-02T08:00:00", 50.0))
+
+    partition = tmp_path / "meals" / "2026-10.jsonl"
+    assert len(partition.read_text(encoding="utf-8").splitlines()) == 2
+
+    manifest = json.loads((tmp_path / "meals" / "manifest.json").read_text())
+    info = manifest["partitions"]["2026-10"]
+    assert info["count"] == 2
+    assert info["first"] == "2026-10-01T08:00:00"
+    assert info["last"] == "2026-10-02T08:00:00"
+
+
+def test_keys_for_range(journal):
+    journal.append_many(
+        [
+            entry("2025-12-31T23:00:00"),
+            entry("2026-01-10T08:00:00"),
+            entry("2026-03-10T08:00:00"),
+        ]
+    )
+    keys = journal.keys_for_range(datetime(2026, 1, 1), datetime(2026, 2, 28))
+    assert keys == ["2026-01"]
+
+
+def test_manifest_rebuilt_when_missing(journal, tmp_path):
+    journal.append(entry("2026-10-01T08:00:00"))
+    (tmp_path / "meals" / "manifest.json").unlink()
+
+    restored = MealJournal(str(tmp_path / "meals"))
+    assert restored.partitions["2026-10"]["count"] == 1
+    assert restored.read_all() == [entry("2026-10-01T08:00:00")]
+
+
+def test_corrupted_line_is_skipped(journal, tmp_path):
+    journal.append(entry("2026-10-01T08:00:00"))
+    with open(tmp_path / "meals" / "2026-10.jsonl", "a", encoding="utf-8") as f:
+        f.write("{broken\n")
+
+    assert journal.read_all() == [entry("2026-10-01T08:00:00")]
+
+
+def test_line_without_timestamp_is_skipped(journal, tmp_path, caplog):
+    journal.append(entry("2026-10-01T08:00:00"))
+    partition = tmp_path / "meals" / "2026-10.jsonl"
+    with open(partition, "a", encoding="utf-8") as f:
+        f.write('{"items": [], "total": 10.0}\n')  # правка вручную: без даты
+        f.write('["not", "an", "entry"]\n')
+    (tmp_path / "meals" / "manifest.json").unlink()
+    (tmp_path / "meals" / "2026-10.idx").unlink(missing_ok=True)
+
+    restored = MealJournal(str(tmp_path / "meals"))  # перестройка манифеста
+
+    assert "Строка без даты" in caplog.text
+    assert restored.partitions["2026-10"]["count"] == 1
+    assert restored.read_all() == [entry("2026-10-01T08:00:00")]
+    assert [e["total"] for e in restored.totals_range()] == [100.0]
+
+    legacy = tmp_path / "meals.json"
+    legacy.write_text(json.dumps([entry("2026-10-02T08:00:00")]), encoding="utf-8")
+    assert restored.migrate_legacy(str(legacy)) == 1  # месяц переписывается
+
+    restored.compact("2026-10")
+    assert [e["timestamp"] for e in restored.read_all()] == [
+        "2026-10-01T08:00:00",
+        "2026-10-02T08:00:00",
+    ]
+
+
+def test_migrate_legacy_keeps_chronological_order(journal, tmp_path):
+    journal.append(entry("2026-10-05T08:00:00", 3.0))
+    legacy = tmp_path / "meals.json"
+    legacy.write_text(
+        json.dumps(
+            [
+                entry("2026-10-01T08:00:00", 1.0),
+                entry("2026-09-01T08:00:00", 0.5),
+                {"items": []},  # без даты — пропускается
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    assert journal.migrate_legacy(str(legacy)) == 2
+    assert [e["total"] for e in journal.read_all()] == [0.5, 1.0, 3.0]
+    assert journal.migrate_legacy(str(legacy)) == 0  # файл уже перенесён
+
+
+def test_failed_migration_keeps_existing_months(journal, tmp_path, monkeypatch):
+    journal.append(entry("2026-09-05T08:00:00", 1.0))
+    journal.append(entry("2026-10-05T08:00:00", 2.0))
+    legacy = tmp_path / "meals.json"
+    legacy.write_text(
+        json.dumps([entry("2026-09-01T08:00:00"), entry("2026-10-01T08:00:00")]),
+        encoding="utf-8",
+    )
+    dump_entry = meal_journal.dump_entry
+
+    def fail_on_october(item):
+        if item["timestamp"].startswith("2026-10"):
+            raise OSError("disk full")
+        return dump_entry(item)
+
+    monkeypatch.setattr(meal_journal, "dump_entry", fail_on_october)
+
+    with pytest.raises(OSError, match="disk full"):
+        journal.migrate_legacy(str(legacy))
+
+    assert [e["total"] for e in journal.read_all()] == [1.0, 2.0]
+    assert sorted(p.name for p in (tmp_path / "meals").glob("*.jsonl*")) == [
+        "2026-09.jsonl",
+        "2026-10.jsonl",
+    ]
+    assert legacy.exists()  # перенос можно повторить
+
+    monkeypatch.undo()
+    assert journal.migrate_legacy(str(legacy)) == 2
+    assert len(journal.read_all()) == 4
+
+
+def test_get_journal_returns_shared_instance(tmp_path):
+    assert get_journal(str(tmp_path / "a")) is get_journal(str(tmp_path / "a"))
+    assert get_journal(str(tmp_path / "a")) is not get_journal(str(tmp_path / "b"))
+
+
+# ---------- archive / compact ----------
+@pytest.mark.parametrize("codec, suffix", [("gzip", ".gz"), ("lzma", ".xz")])
+def test_archive_closed_months(journal, tmp_path, codec, suffix):
+    journal.append_many(
+        [
+            entry("2026-08-02T08:00:00", 2.0),
+            entry("2026-08-01T08:00:00", 1.0),
+            entry("2026-09-01T08:00:00", 3.0),
+            entry("2026-10-01T08:00:00", 4.0),
+        ]
+    )
+
+    archived = journal.archive_closed(codec, now=datetime(2026, 10, 19))
+
+    folder = tmp_path / "meals"
+    assert archived == ["2026-08", "2026-09"]
+    assert (folder / f"2026-08.jsonl{suffix}").exists()
+    assert not (folder / "2026-08.jsonl").exists()
+    assert (folder / "2026-10.jsonl").exists()  # текущий месяц не трогаем
+
+    # Чтение прозрачно, месяц уплотнён в хронологическом порядке
+    assert [e["total"] for e in journal.read_all()] == [1.0, 2.0, 3.0, 4.0]
+    result = list(journal.iter_range(datetime(2026, 9, 1), datetime(2026, 9, 30)))
+    assert [e["total"] for e in result] == [3.0]
+
+    # Запись в архивный месяц и восстановление манифеста по сжатым файлам
+    journal.append(entry("2026-08-03T08:00:00", 5.0))
+    (folder / "manifest.json").unlink()
+    restored = MealJournal(str(folder))
+    assert restored.partitions["2026-08"]["count"] == 3
+    assert restored.partitions["2026-08"]["file"] == f"2026-08.jsonl{suffix}"
+
+
+def test_archive_unknown_codec(journal):
+    with pytest.raises(ValueError, match="недоступен"):
+        journal.archive_closed("rar")
+
+
+def test_compact_drops_broken_lines(journal, tmp_path):
+    journal.append(entry("2026-10-01T08:00:00"))
+    with open(tmp_path / "meals" / "2026-10.jsonl", "a", encoding="utf-8") as f:
+        f.write("{broken\n")
+
+    journal.compact("2026-10")
+
+    lines = (tmp_path / "meals" / "2026-10.jsonl").read_text().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0]) == entry("2026-10-01T08:00:00")
+
+
+def test_cli_archive(tmp_path, capsys):
+    folder = tmp_path / "meals"
+    MealJournal(str(folder)).append(entry("2020-01-01T08:00:00"))
+
+    main(["archive", "--dir", str(folder), "--codec", "gzip"])
+
+    assert (folder / "2020-01.jsonl.gz").exists()
+    assert "1" in capsys.readouterr().out
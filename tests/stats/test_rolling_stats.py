@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from rolling_stats import (
+    build_overlays,
+    daily_totals,
+    deviation,
+    longest_streak,
+    moving_average,
+    rolling_sum,
+)
+
+
+@pytest.fixture
+def stats():
+    return [
+        {"timestamp": "2026-10-01T08:00:00", "total": 1000.0},
+        {"timestamp": "2026-10-01T19:00:00", "total": 500.0},
+        {"timestamp": "2026-10-03T12:00:00", "total": 2500.0},
+        {"timestamp": "2026-10-04T12:00:00", "total": 1800.0},
+    ]
+
+
+def test_daily_totals_fills_missing_days(stats):
+    days, totals = daily_totals(stats)
+    assert [str(day) for day in days] == [
+        "2026-10-01",
+        "2026-10-02",
+        "2026-10-03",
+        "2026-10-04",
+    ]
+    assert totals.tolist() == [1500.0, 0.0, 2500.0, 1800.0]
+
+
+def test_daily_totals_empty():
+    days, totals = daily_totals([])
+    assert len(days) == 0 and len(totals) == 0
+
+
+def test_rolling_sum_and_average():
+    totals = np.array([1.0, 2.0, 3.0, 4.0])
+    assert rolling_sum(totals, 2).tolist() == [1.0, 3.0, 5.0, 7.0]
+    assert moving_average(totals, 2).tolist() == [1.0, 1.5, 2.5, 3.5]
+    assert moving_average(totals, 10).tolist() == [1.0, 1.5, 2.0, 2.5]
+
+
+def test_rolling_invalid_window():
+    with pytest.raises(ValueError, match="Некорректный размер окна"):
+        rolling_sum(np.array([1.0]), 0)
+
+
+def test_deviation():
+    assert deviation([1500.0, 2500.0], 2000.0).tolist() == [-500.0, 500.0]
+
+
+@pytest.mark.parametrize(
+    "totals, expected",
+    [
+        ([1.0, 5.0, 1.0, 1.0, 1.0, 5.0], (3, 2)),
+        ([1.0, 1.0], (2, 0)),
+        ([5.0, 5.0], (0, -1)),
+        ([], (0, -1)),
+    ],
+)
+def test_longest_streak(totals, expected):
+    assert longest_streak(np.array(totals), 2.0) == expected
+
+
+def test_build_overlays(stats):
+    overlays = build_overlays(stats, window=2, target=2000.0)
+
+    assert overlays["dates"][0] == "2026-10-01"
+    assert overlays["average"].tolist() == [1500.0, 750.0, 1250.0, 2150.0]
+    assert overlays["deviation"].tolist() == [-500.0, -2000.0, 500.0, -200.0]
+    # 2 октября записей нет: это пропуск, а не день в пределах цели
+    assert overlays["streak"] == (1, "2026-10-01")
+
+
+def test_streak_breaks_on_days_without_entries():
+    stats = [
+        {"timestamp": "2026-10-01T12:00:00", "total": 1500.0},
+        {"timestamp": "2026-10-02T12:00:00", "total": 1800.0},
+        {"timestamp": "2026-10-05T12:00:00", "total": 1900.0},
+        {"timestamp": "2026-10-06T12:00:00", "total": 1700.0},
+        {"timestamp": "2026-10-07T12:00:00", "total": 1600.0},
+    ]
+
+    overlays = build_overlays(stats, target=2000.0)
+
+    assert overlays["daily"].tolist()[2:4] == [0.0, 0.0]
+    assert overlays["streak"] == (3, "2026-10-05")
+
+
+def test_longest_streak_with_logged_mask():
+    totals = np.array([1.0, 0.0, 1.0, 1.0])
+    logged = np.array([True, False, True, True])
+    assert longest_streak(totals, 2.0, logged) == (2, 2)
+
+
+def test_build_overlays_without_target(stats):
+    overlays = build_overlays(stats)
+    assert "target" not in overlays and "streak" not in overlays
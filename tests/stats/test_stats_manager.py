@@ -1,6 +1,6 @@
 import json
+import threading
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
@@ -11,16 +11,16 @@ from stats_manager import StatsManager
 def sample_data():
     now = datetime.now()
     return [
-        {
-            "timestamp": (now - timedelta(days=1)).isoformat(),
-            "items": [{"name": "apple"}],
-            "total": 100,
-        },
         {
             "timestamp": (now - timedelta(days=5)).isoformat(),
             "items": [{"name": "banana"}],
             "total": 200,
         },
+        {
+            "timestamp": (now - timedelta(days=1)).isoformat(),
+            "items": [{"name": "apple"}],
+            "total": 100,
+        },
     ]
 
 
@@ -29,51 +29,84 @@ def stats_path(tmp_path):
     return tmp_path / "meals.json"
 
 
+@pytest.fixture
+def filled(stats_path, sample_data):
+    sm = StatsManager(stats_file=str(stats_path))
+    sm.journal.append_many(sample_data)
+    return sm
+
+
 # ---------- _load_stats ----------
-def test_load_stats_success(stats_path, sample_data):
-    stats_json = json.dumps(sample_data, ensure_ascii=False, indent=4)
-    with patch("builtins.open", mock_open(read_data=stats_json)):
-        with patch("os.path.exists", return_value=True):
-            sm = StatsManager(stats_file=str(stats_path))
-            assert sm.stats == sample_data
+def test_load_stats_migrates_legacy_file(stats_path, sample_data):
+    stats_path.write_text(
+        json.dumps(sample_data, ensure_ascii=False, indent=4), encoding="utf-8"
+    )
+    sm = StatsManager(stats_file=str(stats_path))
 
+    assert sm.get_stats_by_period("all") == sample_data
+    assert not stats_path.exists()
+    assert (stats_path.parent / "meals.json.migrated").exists()
+    assert (stats_path.parent / "meals" / "manifest.json").exists()
 
-def test_load_stats_file_not_found(stats_path):
-    with patch("os.path.exists", return_value=False):
-        sm = StatsManager(stats_file=str(stats_path))
-        assert sm.stats == []
 
+def test_load_is_deferred_until_first_query(stats_path, sample_data):
+    stats_path.write_text(json.dumps(sample_data), encoding="utf-8")
+    sm = StatsManager(stats_file=str(stats_path))
 
-def test_load_stats_json_error(stats_path):
-    with patch("builtins.open", mock_open(read_data="INVALID_JSON")):
-        with patch("os.path.exists", return_value=True):
-            sm = StatsManager(stats_file=str(stats_path))
-            assert sm.stats == []
+    assert not sm.loaded
+    assert stats_path.exists()
+    assert not (stats_path.parent / "meals").exists()
+
+    assert len(sm.get_totals_by_period("all")) == len(sample_data)
+    assert sm.loaded
+    assert not stats_path.exists()
+
+
+def test_preload_loads_once_across_threads(stats_path, sample_data, monkeypatch):
+    stats_path.write_text(json.dumps(sample_data), encoding="utf-8")
+    sm = StatsManager(stats_file=str(stats_path))
+    calls = []
+    original = sm._load_stats
+    monkeypatch.setattr(
+        sm, "_load_stats", lambda j, now: calls.append(j) or original(j, now)
+    )
+
+    threads = [threading.Thread(target=sm.preload) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert sm.get_stats_by_period("all") == sample_data
 
 
-# ---------- _save_stats ----------
-def test_save_stats(stats_path, sample_data):
+def test_load_stats_file_not_found(stats_path):
     sm = StatsManager(stats_file=str(stats_path))
-    sm.stats = sample_data
+    assert sm.get_stats_by_period("all") == []
+
 
-    with patch("builtins.open", mock_open()) as m:
-        sm._save_stats()
-        m.assert_called_once_with(str(stats_path), "w", encoding="utf-8")
+def test_load_stats_json_error(stats_path):
+    stats_path.write_text("INVALID_JSON", encoding="utf-8")
+    sm = StatsManager(stats_file=str(stats_path))
+    assert sm.get_stats_by_period("all") == []
 
 
 # ---------- log_product_usage ----------
 def test_log_product_usage(stats_path):
     sm = StatsManager(stats_file=str(stats_path))
-    sm._save_stats = MagicMock()
-    before_len = len(sm.stats)
     sm.log_product_usage([{"name": "bread"}], 123.45)
-    assert len(sm.stats) == before_len + 1
-    sm._save_stats.assert_called_once()
+
+    key = datetime.now().strftime("%Y-%m")
+    partition = stats_path.parent / "meals" / f"{key}.jsonl"
+    lines = partition.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["total"] == 123.45
 
 
 # ---------- _is_within_range ----------
-def test_is_within_range_valid():
-    sm = StatsManager(stats_file="dummy.json")
+def test_is_within_range_valid(stats_path):
+    sm = StatsManager(stats_file=str(stats_path))
     now = datetime.now()
     timestamp = now.isoformat()
     assert sm._is_within_range(
@@ -81,47 +114,58 @@ def test_is_within_range_valid():
     )
 
 
-def test_is_within_range_invalid():
-    sm = StatsManager(stats_file="dummy.json")
+def test_is_within_range_invalid(stats_path):
+    sm = StatsManager(stats_file=str(stats_path))
     assert not sm._is_within_range("invalid-timestamp", datetime.now(), datetime.now())
 
 
 # ---------- get_stats_for_range ----------
-def test_get_stats_for_range(stats_path, sample_data):
-    sm = StatsManager(stats_file=str(stats_path))
-    sm.stats = sample_data
+def test_get_stats_for_range(filled, sample_data):
     today = datetime.now().strftime("%Y-%m-%d")
     start = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-    result = sm.get_stats_for_range(start, today)
+    result = filled.get_stats_for_range(start, today)
     assert len(result) == len(sample_data)
 
 
-# ---------- get_stats_last_n_days ----------
-def test_get_stats_last_n_days(stats_path, sample_data):
+def test_get_stats_for_range_opens_only_overlapping_months(stats_path, monkeypatch):
     sm = StatsManager(stats_file=str(stats_path))
-    sm.stats = sample_data
-    result = sm.get_stats_last_n_days(7)
+    sm.journal.append_many(
+        [
+            {"timestamp": "2024-01-15T10:00:00", "items": [], "total": 1},
+            {"timestamp": "2024-02-15T10:00:00", "items": [], "total": 2},
+            {"timestamp": "2024-03-15T10:00:00", "items": [], "total": 3},
+        ]
+    )
+    opened = []
+    original = sm.journal.iter_partition
+    monkeypatch.setattr(
+        sm.journal, "iter_partition", lambda key: opened.append(key) or original(key)
+    )
+
+    result = sm.get_stats_for_range("2024-02-01", "2024-02-28")
+
+    assert [entry["total"] for entry in result] == [2]
+    assert opened == ["2024-02"]
+
+
+# ---------- get_stats_last_n_days ----------
+def test_get_stats_last_n_days(filled):
+    result = filled.get_stats_last_n_days(7)
     assert len(result) == 2
 
 
 # ---------- get_stats_by_period ----------
-def test_get_stats_by_period_all(stats_path, sample_data):
-    sm = StatsManager(stats_file=str(stats_path))
-    sm.stats = sample_data
-    assert sm.get_stats_by_period("all") == sample_data
+def test_get_stats_by_period_all(filled, sample_data):
+    assert filled.get_stats_by_period("all") == sample_data
 
 
-def test_get_stats_by_period_week(stats_path, sample_data):
-    sm = StatsManager(stats_file=str(stats_path))
-    sm.stats = sample_data
-    result = sm.get_stats_by_period("week")
+def test_get_stats_by_period_week(filled):
+    result = filled.get_stats_by_period("week")
     assert isinstance(result, list)
 
 
-def test_get_stats_by_period_month(stats_path, sample_data):
-    sm = StatsManager(stats_file=str(stats_path))
-    sm.stats = sample_data
-    result = sm.get_stats_by_period("month")
+def test_get_stats_by_period_month(filled):
+    result = filled.get_stats_by_period("month")
     assert isinstance(result, list)
 
 
@@ -132,10 +176,32 @@ def test_get_stats_by_period_unknown(stats_path):
 
 
 # ---------- clear_stats ----------
-def test_clear_stats(stats_path, sample_data):
+def test_clear_stats(filled):
+    filled.clear_stats()
+    assert filled.get_stats_by_period("all") == []
+    assert list(filled.journal.partitions) == []
+
+
+# ---------- totals (binary index) ----------
+@pytest.mark.parametrize("use_index", [True, False])
+def test_get_totals_by_period(stats_path, sample_data, use_index):
+    sm = StatsManager(stats_file=str(stats_path), use_index=use_index)
+    sm.journal.append_many(sample_data)
+
+    totals = sm.get_totals_by_period("week")
+    assert [(t["timestamp"], t["total"]) for t in totals] == [
+        (e["timestamp"], e["total"]) for e in sm.get_stats_by_period("week")
+    ]
+    assert [t["total"] for t in sm.get_totals_by_period("all")] == [200, 100]
+
+
+def test_get_totals_by_period_unknown(stats_path):
     sm = StatsManager(stats_file=str(stats_path))
-    sm.stats = sample_data
-    sm._save_stats = MagicMock()
-    sm.clear_stats()
-    assert sm.stats == []
-    sm._save_stats.assert_called_once()
+    with pytest.raises(ValueError, match="Неизвестный период"):
+        sm.get_totals_by_period("year")
+
+
+def test_load_entry_details(filled, sample_data):
+    light = filled.get_totals_by_period("all")
+    assert "items" not in light[0]
+    assert filled.load_entry_details(light[0]) == sample_data[0]
@@ -0,0 +1,102 @@
+import time
+from concurrent.futures import wait
+from unittest.mock import MagicMock
+
+import pytest
+
+from background import BackgroundRunner
+
+
+class FakeWidget:
+    """Имитирует `after()` Tk: колбэки копятся и вызываются вручную."""
+
+    def __init__(self):
+        self.pending = {}
+        self.counter = 0
+
+    def after(self, ms, func, *args):
+        self.counter += 1
+        after_id = f"after#{self.counter}"
+        self.pending[after_id] = (func, args)
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run_pending(self):
+        calls, self.pending = self.pending, {}
+        for func, args in calls.values():
+            func(*args)
+
+
+def drain(widget, task, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while widget.pending and time.monotonic() < deadline:
+        wait([task.future], timeout=timeout)
+        widget.run_pending()
+
+
+@pytest.fixture
+def runner():
+    runner = BackgroundRunner(poll_interval=1)
+    yield runner
+    runner.shutdown()
+
+
+def test_result_delivered_via_after(runner):
+    widget = FakeWidget()
+    on_done = MagicMock()
+
+    task = runner.submit(widget, lambda: 2 + 2, on_done)
+    on_done.assert_not_called()  # результат доставляется только через after()
+
+    drain(widget, task)
+    on_done.assert_called_once_with(4)
+    assert runner.tasks == []
+
+
+def test_error_delivered_to_handler(runner):
+    widget = FakeWidget()
+    on_done, on_error = MagicMock(), MagicMock()
+
+    def fail():
+        raise ValueError("Сбой")
+
+    task = runner.submit(widget, fail, on_done, on_error)
+    drain(widget, task)
+
+    on_done.assert_not_called()
+    assert isinstance(on_error.call_args[0][0], ValueError)
+
+
+def test_cancel_for_widget_discards_result(runner):
+    widget, other = FakeWidget(), FakeWidget()
+    on_done, on_cancel = MagicMock(), MagicMock()
+
+    task = runner.submit(widget, lambda: "data", on_done, on_cancel=on_cancel)
+    runner.submit(other, lambda: "other", MagicMock())
+    runner.cancel_for(widget)
+
+    wait([task.future], timeout=2.0)
+    widget.run_pending()
+
+    assert widget.pending == {}
+    on_done.assert_not_called()
+    on_cancel.assert_called_once()
+    assert [t.widget for t in runner.tasks] == [other]
+
+
+def test_submit_without_widget(runner):
+    with pytest.raises(ValueError, match="Не указано окно"):
+        runner.submit(None, lambda: None, MagicMock())
+
+
+def test_cancel_all_skips_on_cancel(runner):
+    widget = FakeWidget()
+    on_cancel = MagicMock()
+    runner.submit(widget, lambda: 1, MagicMock(), on_cancel=on_cancel)
+
+    runner.cancel_all()
+
+    assert runner.tasks == []
+    on_cancel.assert_not_called()
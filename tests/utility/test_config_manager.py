@@ -4,7 +4,14 @@ import os
 from unittest.mock import patch
 
 import pytest
-from config_manager import read_config, reset_config, write_config
+from config_manager import (
+    PROJECT_ROOT,
+    ConfigService,
+    get_config,
+    read_config,
+    reset_config,
+    write_config,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -193,3 +200,120 @@ def test_write_and_reset_config_contents(fake_config):
         assert (
             config.get("settings", "language") == ""
         ), "После сброса язык должен быть пустой строкой"
+
+
+# ---------- ConfigService ----------
+def test_service_reads_file_once(fake_config):
+    with patch("config_manager.CONFIG_PATH", str(fake_config)):
+        write_config("ru")
+        read = configparser.ConfigParser.read
+        with patch.object(
+            configparser.ConfigParser, "read", autospec=True, side_effect=read
+        ) as mock_read:
+            service = ConfigService(str(fake_config))
+            for _ in range(3):
+                assert service.get("settings", "language") == "ru"
+            assert mock_read.call_count == 1
+
+
+def test_service_rereads_changed_file(fake_config):
+    service = ConfigService(str(fake_config))
+    service.update({"settings": {"language": "ru"}})
+    assert service.get("settings", "language") == "ru"
+
+    # Файл изменён извне: другое содержимое и время модификации
+    with open(fake_config, "w", encoding="utf-8") as f:
+        f.write("[settings]\nlanguage = en\n")
+    os.utime(fake_config, ns=(0, 0))
+
+    assert service.get("settings", "language") == "en"
+
+
+def test_service_writes_only_on_change(fake_config):
+    service = ConfigService(str(fake_config))
+    assert service.update({"settings": {"language": "ru"}}) is True
+    os.utime(fake_config, ns=(0, 0))
+
+    assert service.update({"settings": {"language": "ru"}}) is False
+    assert os.stat(fake_config).st_mtime_ns == 0
+
+    assert service.update({"settings": {"language": "en"}}) is True
+    assert not os.path.exists(str(fake_config) + ".tmp")
+    assert ConfigService(str(fake_config)).get("settings", "language") == "en"
+
+
+def test_service_defaults(fake_config):
+    service = ConfigService(str(fake_config))
+    assert service.getint("performance", "poll_interval") == 50
+    assert service.get_path("file_path", "meals_dir") == os.path.join(
+        PROJECT_ROOT, "data/meals"
+    )
+
+    service.update({"performance": {"poll_interval": "20"}})
+    assert service.getint("performance", "poll_interval") == 20
+    assert service.get("missing", "key", fallback="x") == "x"
+
+
+def test_reset_keeps_other_sections(fake_config):
+    with patch("config_manager.CONFIG_PATH", str(fake_config)):
+        write_config("en")
+        get_config().update({"performance": {"autocomplete_limit": "10"}})
+        reset_config()
+
+        assert read_config() == (None, [None, None])
+        assert get_config().getint("performance", "autocomplete_limit") == 10
+
+
+def test_reset_keeps_journal_paths(fake_config):
+    with patch("config_manager.CONFIG_PATH", str(fake_config)):
+        write_config("en")
+        get_config().update({"file_path": {"meals_dir": "custom/journal"}})
+        reset_config()
+
+        assert read_config() == (None, [None, None])
+        assert get_config().get("file_path", "meals_dir") == "custom/journal"
+        assert not get_config().parser.has_option("file_path", "path_ru")
+
+
+def test_get_config_shared_per_path(fake_config, tmp_path):
+    assert get_config(str(fake_config)) is get_config(str(fake_config))
+    assert get_config(str(fake_config)) is not get_config(str(tmp_path / "b.ini"))
+
+
+def test_malformed_values_fall_back_to_defaults(fake_config, caplog):
+    service = ConfigService(str(fake_config))
+    service.update(
+        {
+            "performance": {"poll_interval": "fast", "startup_budget_ms": "3s"},
+            "instrumentation": {"enabled": "maybe"},
+        }
+    )
+
+    assert service.getint("performance", "poll_interval") == 50
+    assert service.getfloat("performance", "startup_budget_ms") == 3000.0
+    assert service.getboolean("instrumentation", "enabled") is False
+    assert "Ошибка: Некорректное значение performance.poll_interval" in caplog.text
+
+
+def test_malformed_value_without_default_raises(fake_config):
+    service = ConfigService(str(fake_config))
+    service.update({"custom": {"size": "big"}})
+
+    with pytest.raises(ValueError):
+        service.getint("custom", "size")
+
+
+def test_data_defaults_survive_hand_edited_config(fake_config):
+    from data_defaults import DataDefaults
+
+    with patch("config_manager.CONFIG_PATH", str(fake_config)):
+        get_config().update(
+            {
+                "performance": {"poll_interval": "fast", "max_workers": ""},
+                "stats": {"daily_target": "много", "rolling_window": "7.5"},
+            }
+        )
+        settings = DataDefaults("ru", path_ru="ru.json", path_en="en.json")
+
+    assert settings.POLL_INTERVAL == 50 and settings.MAX_WORKERS == 1
+    assert settings.DAILY_TARGET == 2000.0 and settings.ROLLING_WINDOW == 7
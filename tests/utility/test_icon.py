@@ -6,11 +6,21 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+import gui_factory
 from gui_factory import set_window_icon
 
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(autouse=True)
+def fresh_icon_cache():
+    gui_factory._icon_file.cache_clear()
+    gui_factory._window_icons.clear()
+    yield
+    gui_factory._icon_file.cache_clear()
+    gui_factory._window_icons.clear()
+
+
 @pytest.fixture
 def fake_script_path():
     # Путь к "фейковому" файлу gui_factory.py в структуре проекта (например, .../src/gui_factory.py)
@@ -23,51 +33,88 @@ def expected_icon_path(fake_script_path):
     return fake_script_path.parent.parent / "resources" / "icon.ico"
 
 
-def test_set_window_icon(monkeypatch, fake_script_path, expected_icon_path):
+def only_exists(suffix):
+    return patch.object(
+        Path, "exists", autospec=True, side_effect=lambda path: path.suffix == suffix
+    )
+
+
+def test_set_window_icon(monkeypatch, fake_script_path):
     """
-    Тест: Проверяем, что set_window_icon корректно формирует путь к иконке
-    и вызывает метод iconbitmap с правильным аргументом,
-    если файл иконки существует.
+    Тест: PNG-иконка загружается один раз и ставится через iconphoto(True, ...),
+    поэтому следующие окна (в том числе Toplevel) диск не трогают.
     """
-    # Мокаем путь к модулю gui_factory
     monkeypatch.setattr("gui_factory.__file__", str(fake_script_path))
+    root = MagicMock(spec=tk.Tk)
+    toplevel = MagicMock(spec=tk.Toplevel)
+    toplevel._root.return_value = root
+    expected = fake_script_path.parent.parent / "resources" / "icon.png"
+
+    with only_exists(".png") as mock_exists, patch("tkinter.PhotoImage") as photo:
+        set_window_icon(root)
+        set_window_icon(toplevel)
+        set_window_icon(root)
 
+    photo.assert_called_once_with(master=root, file=str(expected))
+    root.iconphoto.assert_called_once_with(True, photo.return_value)
+    toplevel.iconphoto.assert_not_called()
+    assert mock_exists.call_count == 1
+
+    logger.info(expected)
+
+
+def test_set_window_icon_ico_fallback(
+    monkeypatch, fake_script_path, expected_icon_path
+):
+    """
+    Тест: Без PNG используется .ico через iconbitmap(default=...),
+    который также наследуют все окна интерпретатора.
+    """
+    monkeypatch.setattr("gui_factory.__file__", str(fake_script_path))
     mock_window = MagicMock(spec=tk.Tk)
 
-    # Мокаем проверку существования файла иконки как True
-    with patch("pathlib.Path.exists", return_value=True):
+    with only_exists(".ico"):
+        set_window_icon(mock_window)
         set_window_icon(mock_window)
 
-    # Проверяем, что iconbitmap вызван один раз с ожидаемым путем
-    mock_window.iconbitmap.assert_called_once_with(expected_icon_path)
+    mock_window.iconbitmap.assert_called_once_with(default=expected_icon_path)
 
-    actual_path = mock_window.iconbitmap.call_args[0][0]
+    actual_path = mock_window.iconbitmap.call_args.kwargs["default"]
     assert isinstance(
         actual_path, Path
     ), f"Аргумент должен быть Path, но был {type(actual_path)}"
-    assert (
-        actual_path == expected_icon_path
-    ), f"Ожидался путь {expected_icon_path}, но был {actual_path}"
 
-    logger.info(fake_script_path)
-    logger.info(expected_icon_path)
+
+def test_icon_load_error_is_logged(monkeypatch, fake_script_path):
+    monkeypatch.setattr("gui_factory.__file__", str(fake_script_path))
+    mock_window = MagicMock(spec=tk.Tk)
+    mock_window.iconbitmap.side_effect = tk.TclError("bitmap not defined")
+
+    with only_exists(".ico"), patch("gui_factory.logger") as mock_logger:
+        set_window_icon(mock_window)
+        set_window_icon(mock_window)
+
+    mock_window.iconbitmap.assert_called_once()
+    mock_logger.warning.assert_called_once()
 
 
 def test_icon_not_found(expected_icon_path):
     """
     Тест: Проверяем поведение, когда иконка не найдена.
-    Ожидается, что iconbitmap не вызывается,
-    и появляется предупреждение в логах.
+    Ожидается, что иконка не ставится, а предупреждение
+    в логах появляется один раз.
     """
     with (
-        patch("pathlib.Path.exists", return_value=False) as mock_exists,
+        patch("pathlib.Path.exists", return_value=False),
         patch("gui_factory.logger") as mock_logger,
     ):
         mock_window = MagicMock(spec=tk.Tk)
         set_window_icon(mock_window)
+        set_window_icon(MagicMock(spec=tk.Tk))
 
     msg = f"Иконка {expected_icon_path} не найдена. Используется стандартная иконка."
     mock_window.iconbitmap.assert_not_called()
+    mock_window.iconphoto.assert_not_called()
     mock_logger.warning.assert_called_once_with(msg)
     logger.info(msg)
 
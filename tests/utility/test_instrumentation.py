@@ -0,0 +1,93 @@
+import json
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from instrumentation import ENV_OUTPUT, ENV_VAR, Instrumentation
+
+
+@pytest.fixture
+def spans():
+    return Instrumentation(enabled=True)
+
+
+def test_disabled_records_nothing():
+    spans = Instrumentation()
+
+    @spans.timed("work")
+    def work():
+        return 42
+
+    with spans.span("block"):
+        pass
+    assert work() == 42
+    assert spans.span("a") is spans.span("b")  # общий пустой контекст
+    assert spans.summary() == {}
+
+
+def test_span_and_timed_record_counts(spans):
+    @spans.timed("work")
+    def work(x):
+        if x < 0:
+            raise ValueError("x")
+        return x
+
+    for i in range(3):
+        with spans.span("block"):
+            work(i)
+    with pytest.raises(ValueError):
+        work(-1)
+
+    summary = spans.summary()
+    assert summary["block"]["count"] == 3
+    assert summary["work"]["count"] == 4  # исключение тоже учитывается
+    assert summary["work"]["max_ms"] >= summary["work"]["mean_ms"] >= 0
+
+
+def test_export_logs_and_writes_json(spans, tmp_path, caplog):
+    spans.record("journal.append", 0.002)
+    report = tmp_path / "spans.json"
+
+    with caplog.at_level(logging.INFO):
+        spans.export(str(report))
+
+    assert "span journal.append: 1 раз" in caplog.text
+    data = json.loads(report.read_text(encoding="utf-8"))
+    assert data["journal.append"] == {
+        "count": 1,
+        "total_ms": 2.0,
+        "mean_ms": 2.0,
+        "max_ms": 2.0,
+    }
+
+
+@pytest.mark.parametrize("value, expected", [("1", True), ("0", False)])
+def test_configure_from_env(monkeypatch, tmp_path, value, expected):
+    monkeypatch.setenv(ENV_VAR, value)
+    monkeypatch.setenv(ENV_OUTPUT, str(tmp_path / "spans.json"))
+    spans = Instrumentation()
+
+    with (
+        patch("config_manager.CONFIG_PATH", str(tmp_path / "config.ini")),
+        patch("atexit.register") as mock_register,
+    ):
+        assert spans.configure() is expected
+
+    assert spans.output == str(tmp_path / "spans.json")
+    assert mock_register.called is expected
+
+
+def test_configure_from_config(monkeypatch, tmp_path):
+    monkeypatch.delenv(ENV_VAR, raising=False)
+    monkeypatch.delenv(ENV_OUTPUT, raising=False)
+    config = tmp_path / "config.ini"
+    config.write_text("[instrumentation]\nenabled = yes\n", encoding="utf-8")
+    spans = Instrumentation()
+
+    with (
+        patch("config_manager.CONFIG_PATH", str(config)),
+        patch("atexit.register"),
+    ):
+        assert spans.configure() is True
+    assert spans.output is None
@@ -0,0 +1,94 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from notifications import Notifier
+
+
+@pytest.fixture
+def root():
+    root = MagicMock()
+    root.after.side_effect = lambda delay, func: f"after#{delay}"
+    return root
+
+
+@pytest.fixture
+def toast():
+    with patch("tkinter.Toplevel") as toplevel, patch("tkinter.Label") as label:
+        toplevel.return_value.winfo_screenwidth.return_value = 1920
+        toplevel.return_value.winfo_screenheight.return_value = 1080
+        toplevel.return_value.winfo_reqwidth.return_value = 200
+        toplevel.return_value.winfo_reqheight.return_value = 40
+        yield toplevel.return_value, label.return_value
+
+
+def test_repeated_notices_are_coalesced(root, toast):
+    window, label = toast
+    notifier = Notifier(delay_ms=400)
+    notifier.attach(root)
+
+    for _ in range(12):
+        notifier.notify(
+            "Успех",
+            "Продукты сохранены!",
+            key="products.saved",
+            summary="Продукты сохранены: {count}",
+        )
+    notifier.notify("Успех", "Данные сохранены в meals")
+
+    root.after.assert_called_once_with(400, notifier.flush)
+    notifier.flush()
+
+    label.configure.assert_called_once_with(
+        text="Успех: Продукты сохранены: 12\nУспех: Данные сохранены в meals"
+    )
+    window.geometry.assert_called_once_with("+1696+976")
+    assert notifier.pending == {}
+
+
+def test_coalesced_without_summary_shows_counter(root, toast):
+    _window, label = toast
+    notifier = Notifier()
+    notifier.attach(root)
+
+    notifier("Успех", "Файл создан.")
+    notifier("Успех", "Файл создан.")
+    notifier.flush()
+
+    label.configure.assert_called_once_with(text="Успех: Файл создан. (×2)")
+
+
+def test_notices_wait_for_window(root, toast):
+    notifier = Notifier()
+
+    notifier.notify("Успех", "Файл создан.")
+    assert len(notifier.pending) == 1
+
+    notifier.attach(root)
+    root.after.assert_called_once_with(notifier.delay_ms, notifier.flush)
+
+
+def test_toast_hides_after_duration(root, toast):
+    window, _label = toast
+    notifier = Notifier(duration_ms=3000)
+    notifier.attach(root)
+
+    notifier.notify("Успех", "Раз")
+    notifier.flush()
+    notifier.notify("Успех", "Два")
+    notifier.flush()
+
+    root.after_cancel.assert_called_once_with("after#3000")
+    notifier.hide()
+    window.withdraw.assert_called_once()
+
+
+def test_nothing_to_show(root, toast):
+    window, _label = toast
+    notifier = Notifier()
+    notifier.attach(root)
+
+    notifier.flush()
+
+    root.after.assert_not_called()
+    window.deiconify.assert_not_called()
@@ -0,0 +1,127 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sampling_profile import ENV_OUTPUT, ENV_VAR, SamplingProfiler
+
+
+def spin(stop: threading.Event):
+    while not stop.is_set():
+        sum(i * i for i in range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=spin, args=(stop,), name="worker")
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+def test_sample_aggregates_collapsed_stacks(busy_thread, tmp_path):
+    sampler = SamplingProfiler(interval_ms=1, output=str(tmp_path / "out.folded"))
+
+    for _ in range(5):
+        sampler.sample()
+
+    assert sampler.samples == 5
+    lines = sampler.collapsed()
+    worker = [line for line in lines if line.startswith("worker;")]
+    assert worker
+    stack, count = worker[0].rsplit(" ", 1)
+    assert "test_sampling_profile.py:spin" in stack.split(";")
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in worker) == 5
+    assert int(count) >= 1
+    # поток, снимавший стеки, в отчёт не попадает
+    assert not any("test_sample_aggregates" in line for line in lines)
+
+
+def test_disabled_profiler_does_not_start():
+    sampler = SamplingProfiler()
+
+    sampler.start()
+
+    assert not sampler.running
+    assert sampler.stop() is None
+
+
+def test_stop_writes_folded_file_and_logs(busy_thread, tmp_path, caplog):
+    output = tmp_path / "logs" / "sampling.folded"
+    sampler = SamplingProfiler(interval_ms=2, output=str(output))
+
+    sampler.start()
+    time.sleep(0.1)
+    with caplog.at_level("INFO"):
+        path = sampler.stop()
+
+    assert path == str(output)
+    assert not sampler.running
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert any(line.startswith("worker;") for line in lines)
+    assert "затраты на опрос" in caplog.text
+    assert sampler.busy < 0.1
+
+
+def test_nothing_sampled_writes_nothing(tmp_path):
+    sampler = SamplingProfiler(interval_ms=5, output=str(tmp_path / "out.folded"))
+
+    assert sampler.write() is None
+    assert not (tmp_path / "out.folded").exists()
+
+
+def test_configure_from_environment(monkeypatch, tmp_path):
+    output = tmp_path / "env.folded"
+    monkeypatch.setenv(ENV_VAR, "5")
+    monkeypatch.setenv(ENV_OUTPUT, str(output))
+    sampler = SamplingProfiler()
+
+    with patch("sampling_profile.atexit.register") as register:
+        assert sampler.configure() is True
+    sampler.stop()
+
+    assert sampler.interval_ms == 5
+    assert sampler.output == str(output)
+    register.assert_called_once_with(sampler.stop)
+
+
+def test_configure_off_by_default(monkeypatch):
+    monkeypatch.delenv(ENV_VAR, raising=False)
+    sampler = SamplingProfiler()
+
+    with patch("sampling_profile.atexit.register") as register:
+        assert sampler.configure() is False
+
+    register.assert_not_called()
+
+
+def test_malformed_environment_falls_back_to_config(monkeypatch, caplog):
+    monkeypatch.setenv(ENV_VAR, "fast")
+    config = MagicMock()
+    config.getfloat.return_value = 0.0
+    config.get.return_value = ""
+    monkeypatch.setattr("config_manager.get_config", lambda: config)
+    sampler = SamplingProfiler(interval_ms=10)
+
+    assert sampler.configure() is False
+
+    assert sampler.interval_ms == 0
+    assert f"Ошибка: Некорректный интервал сэмплирования {ENV_VAR}='fast'" in (
+        caplog.text
+    )
+    config.getfloat.assert_called_once_with("performance", "sampling_interval_ms")
+
+
+def test_malformed_config_disables_sampling(monkeypatch, caplog):
+    monkeypatch.delenv(ENV_VAR, raising=False)
+    config = MagicMock()
+    config.getfloat.side_effect = ValueError("could not convert string to float")
+    config.get.return_value = ""
+    monkeypatch.setattr("config_manager.get_config", lambda: config)
+    sampler = SamplingProfiler()
+
+    assert sampler.configure() is False
+    assert "Ошибка: Некорректный интервал сэмплирования" in caplog.text
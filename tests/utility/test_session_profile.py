@@ -0,0 +1,75 @@
+import os
+import pstats
+from unittest.mock import MagicMock
+
+import pytest
+
+from session_profile import SessionProfiler
+
+
+def busy_handler():
+    return sum(i * i for i in range(20000))
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    profiler = SessionProfiler(output_dir=str(tmp_path / "logs"), top=5)
+    profiler.notify = MagicMock()
+    yield profiler
+    profiler.stop()
+
+
+def test_inactive_profiler_costs_nothing(profiler):
+    assert not profiler.active
+    assert profiler._profile is None
+    assert profiler.stop() is None
+    profiler.notify.assert_not_called()
+
+
+def test_toggle_writes_pstats_and_summary(profiler):
+    assert profiler.toggle() is None
+    assert profiler.active
+    busy_handler()
+    path = profiler.toggle()
+
+    assert not profiler.active
+    assert path.endswith(".pstats")
+    stats = pstats.Stats(path)
+    assert any(func[2] == "busy_handler" for func in stats.stats)
+
+    with open(path[: -len(".pstats")] + ".txt", encoding="utf-8") as f:
+        summary = f.read()
+    assert summary.startswith("Запись профиля:")
+    assert "busy_handler" in summary
+    assert profiler.notify.call_count == 2
+
+
+def test_bind_hotkey_toggles(profiler):
+    root = MagicMock()
+
+    profiler.bind(root, "<Control-Shift-P>")
+    sequence, handler = root.bind_all.call_args.args
+    handler(None)
+
+    assert sequence == "<Control-Shift-P>"
+    assert profiler.active
+
+
+def test_empty_hotkey_is_not_bound(profiler):
+    root = MagicMock()
+
+    profiler.bind(root, "")
+
+    root.bind_all.assert_not_called()
+
+
+def test_write_error_is_logged(profiler, tmp_path, caplog):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    profiler.output_dir = str(blocker)  # каталог не создать: на его месте файл
+
+    profiler.start()
+    assert profiler.stop() is None
+
+    assert "Ошибка записи профиля" in caplog.text
+    assert not os.path.isdir(blocker)
@@ -0,0 +1,91 @@
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from stall_monitor import SRC_DIR, StallMonitor, find_culprit
+
+
+def fake_frame(filename, lineno, name, back=None):
+    code = SimpleNamespace(co_filename=filename, co_name=name)
+    return SimpleNamespace(f_code=code, f_lineno=lineno, f_back=back)
+
+
+@pytest.fixture
+def monitor():
+    monitor = StallMonitor(threshold_ms=500, interval_ms=100)
+    monitor.root = MagicMock()
+    return monitor
+
+
+def test_find_culprit_points_at_app_code():
+    outer = fake_frame(os.path.join(SRC_DIR, "main_controller.py"), 412, "on_done")
+    middle = fake_frame(
+        os.path.join(SRC_DIR, "product_manager.py"), 350, "_save_products", outer
+    )
+    inner = fake_frame("/usr/lib/python3/json/encoder.py", 200, "iterencode", middle)
+
+    assert find_culprit(inner) == "product_manager.py:350 в _save_products"
+    assert find_culprit(fake_frame("/usr/lib/tkinter/__init__.py", 1, "x")) is None
+    assert find_culprit(None) is None
+
+
+def test_check_reports_once_per_stall(monitor):
+    monitor.last_beat = 10.0
+
+    assert monitor.check(now=10.5) is None  # 400 мс сверх пульса — в пределах порога
+    with patch("stall_monitor.logger") as mock_logger:
+        report = monitor.check(now=10.7)
+        assert monitor.check(now=11.5) is None
+
+    assert report["stalled_ms"] == 600
+    assert "test_check_reports_once_per_stall" in report["stack"]
+    assert monitor.stalls == [report]
+    mock_logger.warning.assert_called_once()
+
+
+def test_beat_logs_stall_duration_and_reschedules(monitor):
+    monitor.last_beat = time.perf_counter() - 2
+    monitor._reported = True
+
+    with patch("stall_monitor.logger") as mock_logger:
+        monitor.beat()
+
+    assert "не отвечал" in mock_logger.warning.call_args.args[0]
+    assert monitor._reported is False
+    monitor.root.after.assert_called_once_with(100, monitor.beat)
+
+
+def test_regular_beat_is_quiet(monitor):
+    monitor.last_beat = time.perf_counter() - 0.1
+
+    with patch("stall_monitor.logger") as mock_logger:
+        monitor.beat()
+
+    mock_logger.warning.assert_not_called()
+
+
+def test_zero_threshold_disables_monitor():
+    root = MagicMock()
+    monitor = StallMonitor(threshold_ms=0)
+
+    monitor.start(root)
+
+    root.after.assert_not_called()
+    assert monitor._thread is None
+
+
+def test_watchdog_captures_blocked_main_thread():
+    root = MagicMock()  # пульс не приходит: after() ничего не вызывает
+    monitor = StallMonitor(threshold_ms=50, interval_ms=10)
+
+    monitor.start(root)
+    time.sleep(0.3)  # «долгий обработчик» в главном потоке
+    monitor.stop()
+
+    assert monitor.stalls
+    assert "time.sleep(0.3)" in monitor.stalls[0]["stack"]
+    root.after_cancel.assert_called_once()
+    assert monitor._thread is None
@@ -0,0 +1,157 @@
+import configparser
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tkinter as tk
+from unittest.mock import MagicMock
+
+import pytest
+
+import startup_profile
+from startup_profile import ENV_BUDGET, StartupProfiler, startup_budget_ms
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+@pytest.fixture
+def profiler(tmp_path, monkeypatch):
+    monkeypatch.setenv(ENV_BUDGET, "1000")
+    profiler = StartupProfiler()
+    profiler.enable(str(tmp_path / "startup.json"))
+    return profiler
+
+
+def test_disabled_records_nothing():
+    profiler = StartupProfiler()
+    root = MagicMock()
+    with profiler.phase("imports"):
+        pass
+    profiler.watch(root)
+    assert profiler.phases == []
+    root.bind.assert_not_called()
+
+
+def test_phases_are_recorded_in_order(profiler):
+    with profiler.phase("config"):
+        pass
+    with pytest.raises(RuntimeError):
+        with profiler.phase("catalog"):
+            raise RuntimeError("boom")
+    names = [phase["name"] for phase in profiler.phases]
+    assert names == ["config", "catalog"]
+    first, second = profiler.phases
+    assert second["start_ms"] >= first["start_ms"] + first["duration_ms"]
+
+
+def test_window_mapped_writes_report(profiler):
+    with profiler.phase("imports"):
+        pass
+    report = profiler.window_mapped()
+    saved = json.loads(open(profiler.output, encoding="utf-8").read())
+    assert saved == report
+    assert report["budget_ms"] == 1000
+    assert report["over_budget"] is False
+    assert report["first_window_ms"] >= report["phases"][0]["duration_ms"]
+
+
+def test_report_flags_over_budget(profiler):
+    profiler.first_window_ms = 1500.0
+    assert profiler.report()["over_budget"] is True
+    assert profiler.report(budget_ms=2000)["over_budget"] is False
+
+
+def test_watch_reacts_only_to_root_map(profiler):
+    root = MagicMock()
+    profiler.watch(root)
+    on_map = root.bind.call_args.args[1]
+
+    on_map(MagicMock(widget=MagicMock()))  # дочерний виджет
+    assert profiler.first_window_ms is None
+
+    on_map(MagicMock(widget=root))
+    assert profiler.first_window_ms is not None
+    root.after_idle.assert_called_once_with(root.destroy)
+
+
+def test_budget_from_config(monkeypatch):
+    monkeypatch.delenv(ENV_BUDGET, raising=False)
+    config = MagicMock()
+    config.getfloat.return_value = 2500.0
+    monkeypatch.setattr("config_manager.get_config", lambda: config)
+    assert startup_budget_ms() == 2500.0
+    config.getfloat.assert_called_once_with("performance", "startup_budget_ms")
+
+
+@pytest.fixture
+def app_copy(tmp_path):
+    """
+    Копия приложения со своими config.ini, data/ и logs/: полный запуск
+    не трогает конфиг, данные и логи рабочей копии.
+    """
+    app = tmp_path / "app"
+    ignore = shutil.ignore_patterns("__pycache__", "*.ini", "*.log*", "*.json")
+    for folder in ("src", "config", "logs", "locales", "resources"):
+        shutil.copytree(os.path.join(ROOT, folder), app / folder, ignore=ignore)
+    shutil.copy(os.path.join(ROOT, "main.py"), app / "main.py")
+    (app / "data" / "products").mkdir(parents=True)
+
+    config = configparser.ConfigParser()
+    config["settings"] = {"language": "ru"}
+    config["file_path"] = {
+        "path_ru": str(app / "data" / "products" / "products_ru.json"),
+        "path_en": str(app / "data" / "products" / "products_en.json"),
+    }
+    with open(app / "config" / "config.ini", "w", encoding="utf-8") as f:
+        config.write(f)
+    return app
+
+
+def test_startup_within_budget(app_copy, tmp_path):
+    """Полный запуск `main.py --profile-startup` укладывается в бюджет."""
+    try:
+        tk.Tk().destroy()
+    except tk.TclError:
+        pytest.skip("Нет дисплея для запуска окна")
+
+    report_path = tmp_path / "startup.json"
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        str(app_copy / folder) for folder in ("src", "config", "logs")
+    )
+    subprocess.run(
+        [sys.executable, "main.py", "--profile-startup", str(report_path)],
+        cwd=app_copy,
+        env=env,
+        timeout=120,
+        check=True,
+    )
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["first_window_ms"] is not None
+    assert not report["over_budget"], (
+        f"Первое окно через {report['first_window_ms']} мс, "
+        f"бюджет {report['budget_ms']} мс ({ENV_BUDGET} или startup_budget_ms)"
+    )
+
+
+def test_app_copy_is_isolated(app_copy):
+    assert (app_copy / "main.py").exists()
+    assert (app_copy / "src" / "main_controller.py").exists()
+    assert not list((app_copy / "data" / "products").iterdir())
+    assert not list((app_copy / "logs").glob("*.log*"))
+    assert "language = ru" in (app_copy / "config" / "config.ini").read_text()
+
+
+def test_shared_profiler_is_disabled_by_default():
+    assert startup_profile.profiler.enabled is False
+
+
+def test_malformed_budget_env_falls_back_to_config(monkeypatch, caplog):
+    monkeypatch.setenv(ENV_BUDGET, "fast")
+    config = MagicMock()
+    config.getfloat.return_value = 2500.0
+    monkeypatch.setattr("config_manager.get_config", lambda: config)
+
+    assert startup_budget_ms() == 2500.0
+    assert f"Ошибка: Некорректный бюджет запуска {ENV_BUDGET}='fast'" in caplog.text
@@ -0,0 +1,130 @@
+import tkinter as tk
+from unittest.mock import MagicMock
+
+import pytest
+
+from window_pool import WindowPool, clear_inputs
+
+
+@pytest.fixture
+def pool():
+    return WindowPool()
+
+
+def test_show_builds_once_and_reuses(pool):
+    root = MagicMock()
+    window = MagicMock()
+    build = MagicMock(return_value=window)
+    reset = MagicMock()
+
+    assert pool.show("calc", root, build, reset) is window
+    assert pool.show("calc", root, build, reset) is window
+
+    build.assert_called_once()
+    reset.assert_called_once()
+    root.withdraw.assert_called_once()
+    window.deiconify.assert_called_once()
+    window.lift.assert_called_once()
+
+
+def test_show_rebuilds_destroyed_window(pool):
+    dead, fresh = MagicMock(), MagicMock()
+    dead.winfo_exists.side_effect = tk.TclError("invalid command name")
+    build = MagicMock(side_effect=[dead, fresh])
+
+    pool.show("stats", MagicMock(), build)
+    assert pool.show("stats", MagicMock(), build) is fresh
+
+    assert build.call_count == 2
+    dead.deiconify.assert_not_called()
+
+
+def test_show_does_not_pool_failed_build(pool):
+    build = MagicMock(return_value=None)
+
+    assert pool.show("add", MagicMock(), build) is None
+    assert pool.show("add", MagicMock(), build) is None
+    assert build.call_count == 2
+
+
+def test_show_without_root(pool):
+    with pytest.raises(ValueError, match="Не указано родительское окно"):
+        pool.show("add", None, MagicMock())
+
+
+def test_default_reset_clears_inputs(pool):
+    window = MagicMock()
+    pool.show("add", MagicMock(), MagicMock(return_value=window))
+    window.winfo_children.return_value = []
+
+    pool.show("add", MagicMock(), MagicMock())
+
+    window.winfo_children.assert_called_once()
+
+
+def test_clear_inputs_walks_children():
+    entry = MagicMock(spec=tk.Entry)
+    listbox = MagicMock(spec=tk.Listbox)
+    label = MagicMock()
+    frame = MagicMock()
+    for widget in (entry, listbox, label):
+        widget.winfo_children.return_value = []
+    frame.winfo_children.return_value = [entry, listbox]
+    window = MagicMock()
+    window.winfo_children.return_value = [frame, label]
+
+    clear_inputs(window)
+
+    entry.delete.assert_called_once_with(0, tk.END)
+    listbox.delete.assert_called_once_with(0, tk.END)
+    label.delete.assert_not_called()
+
+
+def test_hide_withdraws_window_and_shows_root(pool):
+    root, window = MagicMock(), MagicMock()
+
+    pool.hide(root, window)
+
+    window.withdraw.assert_called_once()
+    root.deiconify.assert_called_once()
+
+
+def test_clear_destroys_pooled_windows(pool):
+    window = MagicMock()
+    pool.show("calc", MagicMock(), MagicMock(return_value=window))
+
+    pool.clear()
+
+    window.destroy.assert_called_once()
+    assert pool.screens == {}
+
+
+def test_back_returns_to_latest_parent(pool):
+    old_menu, new_menu = MagicMock(), MagicMock()
+    window = MagicMock()
+    build = MagicMock(return_value=window)
+
+    pool.show("add", old_menu, build)
+    pool.show("add", new_menu, build)  # меню пересоздано, экран из пула
+    pool.back(window, default=old_menu)
+
+    window.withdraw.assert_called_once()
+    new_menu.deiconify.assert_called_once()
+    old_menu.deiconify.assert_not_called()
+
+
+def test_back_with_destroyed_parent_shows_root(pool):
+    menu, window = MagicMock(), MagicMock()
+    menu.winfo_exists.side_effect = tk.TclError("invalid command name")
+    pool.show("add", menu, MagicMock(return_value=window))
+
+    pool.back(window)
+
+    menu.deiconify.assert_not_called()
+    window._root.return_value.deiconify.assert_called_once()
+
+
+def test_parent_of_unpooled_window_is_default(pool):
+    default = MagicMock()
+
+    assert pool.parent(MagicMock(), default) is default